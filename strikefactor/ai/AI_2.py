@@ -1,21 +1,99 @@
 import random
+import numpy as np
+
+
+class StateEncoder():
+
+    def __init__(self):
+        """
+        Map state tuples `(outs, strikes, balls, runners, hits, score)`
+        to dense integer indices, assigned in the order states are first
+        seen. Index `i` is row `i` of the Q-table.
+        """
+        self.index = dict()
+        self.states = []
+
+    def __len__(self):
+        return len(self.states)
+
+    def encode(self, state):
+        """
+        Return the index for `state`, assigning the next free index
+        if the state has not been seen before.
+        """
+        state = tuple(state)
+        idx = self.index.get(state)
+        if idx is None:
+            idx = len(self.states)
+            self.index[state] = idx
+            self.states.append(state)
+        return idx
+
+    def lookup(self, state):
+        """
+        Return the index for `state`, or -1 if it has never been seen.
+        """
+        return self.index.get(tuple(state), -1)
+
 
 class ERAI():
 
     def __init__(self, actions: list, alpha=0.5, epsilon=0.1):
         """
-        Initialize AI with an empty Q-learning dictionary,
-        an alpha (learning) rate, and an epsilon rate.
+        Initialize AI with an empty Q-table, an alpha (learning) rate,
+        and an epsilon rate.
 
-        The Q-learning dictionary maps `(state, action)`
-        pairs to a Q-value (a number).
-         - `state` is a tuple of remaining piles, e.g. (1, 1, 4, 4)
-         - `action` is a tuple `(i, j)` for an action
+        Q-values live in a NumPy array of shape `(n_states, n_actions)`.
+         - rows are states, indexed by `self.encoder`
+         - columns are actions, in the order of `self.actions`
+        A `(state, action)` pair that was never updated has Q-value 0.
         """
-        self.q = dict()
         self.alpha = alpha
         self.epsilon = epsilon
         self.actions = actions
+        self.action_index = {action: i for i, action in enumerate(actions)}
+        self.encoder = StateEncoder()
+        self.q_table = np.zeros((64, len(actions)))
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled AI. Pickles written before the Q-table was
+        array-backed store Q-values in a `q` dict keyed by
+        `(state, action)`; those are converted on load.
+        """
+        legacy_q = state.pop('q', None)
+        if legacy_q is None:
+            self.__dict__.update(state)
+            return
+        self.__init__(state['actions'], state.get('alpha', 0.5), state.get('epsilon', 0.1))
+        for (q_state, action), value in legacy_q.items():
+            if action in self.action_index:
+                row = self._row(q_state)
+                self.q_table[row, self.action_index[action]] = value
+
+    @property
+    def q(self):
+        """
+        The Q-values as a `(state, action) -> value` dict, for code
+        that still expects the old representation.
+        """
+        return {
+            (state, action): float(self.q_table[row, col])
+            for row, state in enumerate(self.encoder.states)
+            for action, col in self.action_index.items()
+        }
+
+    def _row(self, state):
+        """
+        Return the Q-table row for `state`, adding (and growing the
+        table for) states that have not been seen before.
+        """
+        row = self.encoder.encode(state)
+        if row >= len(self.q_table):
+            grown = np.zeros((2 * len(self.q_table), len(self.actions)))
+            grown[:len(self.q_table)] = self.q_table
+            self.q_table = grown
+        return row
 
     def update(self, old_state, action, new_state, reward):
         """
@@ -23,18 +101,23 @@ class ERAI():
         in that state, a new resulting state, and the reward received
         from taking that action.
         """
-        old = self.get_q_value(old_state, action)
+        if action not in self.action_index:
+            return
+        row = self._row(old_state)
+        col = self.action_index[action]
+        old = self.q_table[row, col]
         best_future = self.best_future_reward(new_state)
-        self.update_q_value(old_state, action, old, reward, best_future)
+        self.q_table[row, col] = old + (self.alpha * (reward + best_future - old))
 
     def get_q_value(self, state, action):
         """
         Return the Q-value for the state `state` and the action `action`.
-        If no Q-value exists yet in `self.q`, return 0.
+        If no Q-value exists yet in `self.q_table`, return 0.
         """
-        if (tuple(state), action) in self.q:
-            return self.q[(tuple(state), action)]
-        return 0
+        row = self.encoder.lookup(state)
+        if row < 0 or action not in self.action_index:
+            return 0
+        return float(self.q_table[row, self.action_index[action]])
 
     def update_q_value(self, state, action, old_q, reward, future_rewards):
         """
@@ -50,8 +133,14 @@ class ERAI():
         where `old value estimate` is the previous Q-value,
         `alpha` is the learning rate, and `new value estimate`
         is the sum of the current reward and estimated future rewards.
+
+        Actions outside `self.actions` are never chosen or compared, so
+        they are not stored.
         """
-        self.q[(tuple(state), action)] = old_q + (self.alpha * (reward + future_rewards - old_q))
+        if action not in self.action_index:
+            return
+        row = self._row(state)
+        self.q_table[row, self.action_index[action]] = old_q + (self.alpha * (reward + future_rewards - old_q))
 
     def best_future_reward(self, state):
         """
@@ -60,19 +149,15 @@ class ERAI():
         of their Q-values.
 
         Use 0 as the Q-value if a `(state, action)` pair has no
-        Q-value in `self.q`. If there are no available actions in
+        Q-value in `self.q_table`. If there are no available actions in
         `state`, return 0.
         """
-        actions = self.actions
-        if not actions:
+        if not self.actions:
+            return 0
+        row = self.encoder.lookup(state)
+        if row < 0:
             return 0
-        q_values = []
-        for action in actions:
-            if (tuple(state), action) in self.q:
-                q_values.append(self.q[(tuple(state), action)])
-            else:
-                q_values.append(0)
-        return max(q_values)
+        return float(self.q_table[row].max())
 
     def choose_action(self, state, epsilon=True):
         """
@@ -90,19 +175,14 @@ class ERAI():
         options is an acceptable return value.
         """
         actions = self.actions
-        action_value = {}
-        for action in actions:
-            if (state, action) in self.q:
-                action_value[action] = self.q[(state, action)]
-            else:
-                action_value[action] = 0
-        max_actions = [action for action in actions if action_value[action] == max(action_value.values())]
+        if epsilon and random.random() < self.epsilon:
+            return random.choice(actions)
+        row = self.encoder.lookup(state)
+        if row < 0:
+            # Unseen state: every action has Q-value 0
+            return random.choice(actions)
+        values = self.q_table[row]
+        max_actions = np.flatnonzero(values == values.max())
         if len(max_actions) > 1:
-            best_action = random.choice(max_actions)
-        else:
-            best_action = max_actions[0]
-        if epsilon:
-            random_action = random.choice(actions)
-            return random.choices([random_action, best_action], weights=[self.epsilon, 1-self.epsilon], k=1)[0]
-        else:
-            return best_action
\ No newline at end of file
+            return actions[random.choice(max_actions)]
+        return actions[max_actions[0]]
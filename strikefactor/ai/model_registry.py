@@ -0,0 +1,153 @@
+"""
+Model Registry - Loads the umpire and pitcher AI models at most once.
+
+Models are registered with a loader and only loaded on first use, or ahead of
+time on a background thread via prefetch(). Every caller gets the same shared
+instance, and the registry records how long each model took to load and
+roughly how much memory it holds.
+"""
+
+import glob
+import os
+import pickle
+import sys
+import threading
+import time
+from typing import Callable, Dict
+from config import get_path
+
+
+def _deep_sizeof(obj, seen=None) -> int:
+    """Approximate memory footprint of an object graph in bytes."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    nbytes = getattr(obj, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return sys.getsizeof(obj) + nbytes
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += _deep_sizeof(vars(obj), seen)
+    return size
+
+
+def load_pickled_model(path: str):
+    """Unpickle a model file, resolving pitcher AIs pickled from the old AI_2 module."""
+    import ai.AI_2 as AI_2
+    sys.modules.setdefault('AI_2', AI_2)
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+class _ModelEntry:
+    """A registered model and its load statistics."""
+
+    def __init__(self, loader: Callable):
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.model = None
+        self.loaded = False
+        self.load_time_ms = 0.0
+        self.memory_bytes = 0
+
+
+class ModelRegistry:
+    """Lazily loads and shares models by name."""
+
+    def __init__(self):
+        self._entries: Dict[str, _ModelEntry] = {}
+
+    def register(self, name: str, loader: Callable):
+        """Register a loader for a model; nothing is loaded until it is needed."""
+        self._entries[name] = _ModelEntry(loader)
+
+    def has(self, name: str) -> bool:
+        """Check if a model is registered."""
+        return name in self._entries
+
+    def is_loaded(self, name: str) -> bool:
+        """Check if a model has already been loaded."""
+        entry = self._entries.get(name)
+        return entry is not None and entry.loaded
+
+    def get(self, name: str):
+        """Get a shared model instance, loading it on first use."""
+        entry = self._entries[name]
+        if entry.loaded:
+            return entry.model
+
+        with entry.lock:
+            if not entry.loaded:
+                start = time.perf_counter()
+                model = entry.loader()
+                entry.load_time_ms = (time.perf_counter() - start) * 1000
+                entry.memory_bytes = _deep_sizeof(model)
+                entry.model = model
+                entry.loaded = True
+        return entry.model
+
+    def prefetch(self, *names: str) -> threading.Thread:
+        """Load the given models on a background thread; unknown names are skipped."""
+        def load_all():
+            for name in names:
+                if name not in self._entries:
+                    continue
+                try:
+                    self.get(name)
+                except Exception as e:
+                    # Leave it unloaded; the next get() retries and raises on the caller's thread
+                    print(f"Failed to prefetch model '{name}': {e}")
+
+        thread = threading.Thread(target=load_all, name="model-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Get load time and memory for every registered model."""
+        return {
+            name: {
+                'loaded': entry.loaded,
+                'load_time_ms': entry.load_time_ms,
+                'memory_bytes': entry.memory_bytes,
+            }
+            for name, entry in self._entries.items()
+        }
+
+    def print_stats(self):
+        """Print a load time and memory report for every registered model."""
+        for name, stats in self.get_stats().items():
+            if stats['loaded']:
+                print(f"{name:<16} {stats['load_time_ms']:8.1f} ms {stats['memory_bytes'] / 1024:10.1f} KiB")
+            else:
+                print(f"{name:<16} {'not loaded':>22}")
+
+
+def _create_default_registry() -> ModelRegistry:
+    """Create the registry with the umpire and every shipped pitcher AI."""
+    registry = ModelRegistry()
+    umpire_path = get_path("ai/ai_umpire.pkl")
+
+    def load_umpire_zone():
+        from ai.umpire_zone import UmpireZone
+        return UmpireZone(umpire_path, model_loader=lambda: registry.get("umpire_model"))
+
+    registry.register("umpire_model", lambda: load_pickled_model(umpire_path))
+    registry.register("umpire_zone", load_umpire_zone)
+
+    # Pitcher AIs are registered as "<pitcher>_ai", e.g. "sasaki_ai"
+    for path in glob.glob(get_path("ai/*_ai.pkl")):
+        name = os.path.basename(path)[:-len(".pkl")]
+        registry.register(name, lambda path=path: load_pickled_model(path))
+
+    return registry
+
+
+model_registry = _create_default_registry()
@@ -0,0 +1,293 @@
+"""
+Headless self-play trainer for the pitcher AIs.
+
+Each pitcher's arsenal is thrown against a stochastic batter model. Counts,
+outs and runners follow the same rules as PitchSimulation, using ScoreKeeper
+and HitOutcomeManager, with no display or mixer. Plate appearances run across
+a process pool; every round each worker trains its own copy of the Q-table
+and the copies are merged, weighted by how often each (state, action) pair
+was visited. The result is pickled in the format the game loads.
+
+Run from the strikefactor directory:
+    python -m ai.trainer sasaki --plate-appearances 1000000 --workers 8
+"""
+
+import argparse
+import os
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from ai.AI_2 import ERAI
+from config import OUTCOME_VALUES, get_path
+
+# Pitch parameters sampled per pitch type when a worker starts
+PITCH_POOL_SIZE = 2000
+
+
+def create_pitcher(pitcher_name: str):
+    """Create a pitcher without a display or sprites; only its arsenal is used."""
+    import pygame
+    from pitchers.Sale import Sale
+    from pitchers.Degrom import Degrom
+    from pitchers.Yamamoto import Yamamoto
+    from pitchers.Sasaki import Sasaki
+    from pitchers.Mcclanahan import Mcclanahan
+
+    pitcher_classes = {
+        'sale': Sale, 'degrom': Degrom, 'yamamoto': Yamamoto,
+        'sasaki': Sasaki, 'mcclanahan': Mcclanahan,
+    }
+    return pitcher_classes[pitcher_name](pygame.Surface((1280, 720)), lambda name, number: [])
+
+
+class PitchPool:
+    """Plate locations and travel times sampled from each pitch in an arsenal."""
+
+    def __init__(self, pitcher, size: int = PITCH_POOL_SIZE):
+        from utils.physics import simulate_pitch_trajectories
+        from ai.model_registry import model_registry
+
+        umpire_zone = model_registry.get("umpire_zone")
+        self.pitches = {}
+        for pitch_name in pitcher.get_pitch_names():
+            samples = []
+
+            def capture(release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype):
+                samples.append((release_point[0], release_point[1], vx, vy, ax, ay, traveltime))
+
+            for _ in range(size):
+                pitcher.pitch(capture, pitch_name)
+            release_x, release_y, vx, vy, ax, ay, traveltime = np.array(samples).T
+            final = simulate_pitch_trajectories(np.column_stack((release_x, release_y)),
+                                                vx, vy, ax, ay, traveltime)
+            in_zone = [umpire_zone.is_strike(x, y) for x, y in final]
+            self.pitches[pitch_name] = list(zip(final[:, 0].tolist(), final[:, 1].tolist(),
+                                                traveltime.tolist(), in_zone))
+
+    def sample(self, pitch_name: str):
+        """Return (final_x, final_y, traveltime, called_strike) for one pitch."""
+        return random.choice(self.pitches[pitch_name])
+
+
+class StochasticBatter:
+    """A simple batter: swings more at strikes and with two strikes, whiffs more on hard stuff."""
+
+    def __init__(self, zone_swing=0.65, chase_swing=0.28, two_strike_swing=0.15,
+                 zone_contact=0.85, chase_contact=0.6, foul_rate=0.45, power_rate=0.4):
+        self.zone_swing = zone_swing
+        self.chase_swing = chase_swing
+        self.two_strike_swing = two_strike_swing
+        self.zone_contact = zone_contact
+        self.chase_contact = chase_contact
+        self.foul_rate = foul_rate
+        self.power_rate = power_rate
+
+    def swings(self, in_zone: bool, strikes: int) -> bool:
+        chance = self.zone_swing if in_zone else self.chase_swing
+        if strikes == 2:
+            chance += self.two_strike_swing
+        return random.random() < chance
+
+    def makes_contact(self, in_zone: bool, traveltime: float) -> bool:
+        chance = self.zone_contact if in_zone else self.chase_contact
+        # Roughly 1% less contact per 10 ms under a 420 ms (about 87 mph) pitch
+        chance -= max(0.0, 420 - traveltime) / 1000
+        return random.random() < chance
+
+
+class HalfInningSimulator:
+    """Plays pitches through count, out and runner transitions like PitchSimulation."""
+
+    def __init__(self, pitch_pool: PitchPool, batter: StochasticBatter):
+        from gameplay.scoring import ScoreKeeper
+        from gameplay.hit_outcome_manager import HitOutcomeManager
+
+        self.pitch_pool = pitch_pool
+        self.batter = batter
+        self.score_keeper = ScoreKeeper()
+        self.hit_outcome_manager = HitOutcomeManager(self.score_keeper, None)
+        self.reset()
+
+    def reset(self):
+        """Start a new half-inning."""
+        self.score_keeper.reset()
+        self.outs = 0
+        self.strikes = 0
+        self.balls = 0
+        self.hits = 0
+
+    def get_state(self):
+        return (self.outs, self.strikes, self.balls,
+                self.score_keeper.get_runners_on_base(), self.hits, self.score_keeper.get_score())
+
+    def play_pitch(self, pitch_name: str):
+        """Throw one pitch and return (outcome, plate_appearance_over)."""
+        final_x, final_y, traveltime, in_zone = self.pitch_pool.sample(pitch_name)
+
+        if not self.batter.swings(in_zone, self.strikes):
+            if in_zone:
+                return self._strike()
+            self.balls += 1
+            if self.balls == 4:
+                self.score_keeper.update_walk_event()
+                self._reset_count()
+                return 'walk', True
+            return 'ball', False
+
+        if not self.batter.makes_contact(in_zone, traveltime):
+            return self._strike()
+
+        if random.random() < self.batter.foul_rate:
+            if self.strikes < 2:
+                self.strikes += 1
+            return 'foul', False
+
+        swing_y = final_y + random.gauss(0, 20)
+        timing_diff = random.gauss(0, 35)
+        if random.random() < self.batter.power_rate:
+            outcome = self.hit_outcome_manager.get_power_hit_outcome(swing_y, final_y, timing_diff)
+        else:
+            outcome = self.hit_outcome_manager.get_contact_hit_outcome(swing_y, final_y, timing_diff)
+        if outcome in ["FLYOUT", "GROUNDOUT"]:
+            self.outs += 1
+        else:
+            self.hits += 1
+        self._reset_count()
+        return outcome, True
+
+    def _strike(self):
+        self.strikes += 1
+        if self.strikes == 3:
+            self.outs += 1
+            self._reset_count()
+            return 'strikeout', True
+        return 'strike', False
+
+    def _reset_count(self):
+        self.strikes = 0
+        self.balls = 0
+
+
+# Per-process pitch pools, built once per pitcher and reused across rounds
+_worker_pools = {}
+
+
+def _train_worker(pitcher_name, actions, states, q_values, plate_appearances, alpha, epsilon, seed):
+    """Train a copy of the Q-table; returns (states, q_values, visits, pitches thrown)."""
+    random.seed(seed)
+    np.random.seed(seed % (2 ** 32))
+
+    ai = ERAI(actions, alpha, epsilon)
+    for state, values in zip(states, q_values):
+        row = ai._row(state)
+        ai.q_table[row] = values
+    visits = np.zeros_like(ai.q_table, dtype=np.int64)
+
+    if pitcher_name not in _worker_pools:
+        _worker_pools[pitcher_name] = PitchPool(create_pitcher(pitcher_name))
+    simulator = HalfInningSimulator(_worker_pools[pitcher_name], StochasticBatter())
+
+    pitches = 0
+    for _ in range(plate_appearances):
+        over = False
+        while not over:
+            old_state = simulator.get_state()
+            action = ai.choose_action(old_state)
+            outcome, over = simulator.play_pitch(action)
+            new_state = simulator.get_state()
+            ai.update(old_state, action, new_state, OUTCOME_VALUES[outcome])
+
+            row = ai.encoder.lookup(old_state)
+            if row >= len(visits):
+                visits = np.vstack((visits, np.zeros((len(ai.q_table) - len(visits), len(actions)), dtype=np.int64)))
+            visits[row, ai.action_index[action]] += 1
+            pitches += 1
+        if simulator.outs >= 3:
+            simulator.reset()
+
+    n_states = len(ai.encoder)
+    return ai.encoder.states, ai.q_table[:n_states], visits[:n_states], pitches
+
+
+def merge_q_tables(ai: ERAI, results):
+    """Merge worker Q-tables into `ai`, weighting each value by its visit count."""
+    total = np.zeros((0, len(ai.actions)))
+    weights = np.zeros((0, len(ai.actions)))
+    for states, q_values, visits, _ in results:
+        rows = np.array([ai._row(state) for state in states], dtype=np.int64)
+        if len(ai.encoder) > len(total):
+            grow = len(ai.encoder) - len(total)
+            total = np.vstack((total, np.zeros((grow, len(ai.actions)))))
+            weights = np.vstack((weights, np.zeros((grow, len(ai.actions)))))
+        np.add.at(total, rows, q_values * visits)
+        np.add.at(weights, rows, visits)
+
+    visited = weights > 0
+    n_states = len(total)
+    merged = ai.q_table[:n_states]
+    merged[visited] = total[visited] / weights[visited]
+
+
+def train(pitcher_name: str, plate_appearances: int, workers: int, rounds: int,
+          ai: ERAI = None, alpha: float = 0.5, epsilon: float = 0.1, seed: int = 0) -> ERAI:
+    """Train a pitcher AI with self-play across a process pool."""
+    if ai is None:
+        ai = ERAI(create_pitcher(pitcher_name).get_pitch_names(), alpha, epsilon)
+
+    per_task = max(1, plate_appearances // (workers * rounds))
+    total_pitches = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for round_number in range(rounds):
+            states = list(ai.encoder.states)
+            q_values = ai.q_table[:len(states)].copy()
+            futures = [
+                pool.submit(_train_worker, pitcher_name, ai.actions, states, q_values,
+                            per_task, ai.alpha, ai.epsilon, seed + round_number * workers + worker)
+                for worker in range(workers)
+            ]
+            results = [future.result() for future in futures]
+            merge_q_tables(ai, results)
+
+            total_pitches += sum(result[3] for result in results)
+            elapsed = time.perf_counter() - start
+            print(f"Round {round_number + 1}/{rounds}: {len(ai.encoder)} states, "
+                  f"{total_pitches:,} pitches, {total_pitches / elapsed:,.0f} pitches/s")
+    return ai
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train pitcher AIs with headless self-play.")
+    parser.add_argument('pitchers', nargs='+', choices=['sale', 'degrom', 'yamamoto', 'sasaki', 'mcclanahan'])
+    parser.add_argument('--plate-appearances', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--rounds', type=int, default=10, help="merges of the per-worker Q-tables")
+    parser.add_argument('--output-dir', default=get_path("ai"))
+    parser.add_argument('--fresh', action='store_true', help="start from an empty Q-table")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for pitcher_name in args.pitchers:
+        output = os.path.join(args.output_dir, f"{pitcher_name}_ai.pkl")
+        ai = None
+        if not args.fresh and os.path.exists(output):
+            from ai.model_registry import load_pickled_model
+            ai = load_pickled_model(output)
+            # Continue from the shipped AI only if it was trained on this arsenal
+            if set(ai.actions) != set(create_pitcher(pitcher_name).get_pitch_names()):
+                ai = None
+
+        print(f"Training {pitcher_name} on {args.plate_appearances:,} plate appearances "
+              f"with {args.workers} workers")
+        ai = train(pitcher_name, args.plate_appearances, args.workers, args.rounds, ai, seed=args.seed)
+
+        os.makedirs(args.output_dir, exist_ok=True)
+        with open(output, "wb") as f:
+            pickle.dump(ai, f)
+        print(f"Saved {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Umpire Zone - Rasterized ball/strike lookup compiled from the umpire model.
+
+The pickled umpire model is evaluated once over a dense pixel grid around the
+strike zone, one grid per difficulty strike_zone_tolerance. Calls during a
+pitch are then a single array index instead of a pandas/sklearn round trip.
+Compiled grids are cached to disk, keyed by a hash of the model file.
+
+Umpire calls in a game use the 1.0 grid, which reproduces the model exactly
+and is the only one compiled up front; the other grids scale the zone about
+its center for callers that ask for them. A tolerance that is not compiled
+yet is answered from the 1.0 grid while its own grid compiles on a
+background thread.
+
+Compile every difficulty's grid ahead of time (e.g. before packaging) from
+the strikefactor directory:
+    python -m ai.umpire_zone
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+import numpy as np
+from config import STRIKEZONE_RECT, get_path
+
+# strike_zone_tolerance values used by the difficulty levels in SettingsManager
+DEFAULT_TOLERANCES = (1.2, 1.0, 0.9, 0.8, 0.7)
+
+# Pixels of grid around the strike zone on every side; anything further out is a ball
+GRID_MARGIN = 150
+
+
+class UmpireZone:
+    """O(1) ball/strike calls from grids precompiled from the umpire model."""
+
+    def __init__(self, model_path: str, cache_dir: str = None,
+                 tolerances=(1.0,), margin: int = GRID_MARGIN, model_loader=None):
+        """
+        Load the compiled grids from cache, compiling them if needed.
+
+        Args:
+            model_path: Path to the pickled umpire model
+            cache_dir: Directory for compiled grids (default: data/)
+            tolerances: strike_zone_tolerance values to compile up front (1.0 always is)
+            margin: Pixels of grid around the strike zone on every side
+            model_loader: Callable returning the umpire model (default: unpickle model_path)
+        """
+        self.model_path = model_path
+        self.cache_dir = cache_dir or get_path("data")
+        self._model = None
+        self._model_loader = model_loader
+        self._lock = threading.Lock()
+        self._compiling = set()
+
+        (zone_x, zone_y), (zone_w, zone_h) = STRIKEZONE_RECT
+        self.center = (zone_x + zone_w / 2, zone_y + zone_h / 2)
+        self.origin_x = zone_x - margin
+        self.origin_y = zone_y - margin
+        self.width = zone_w + 2 * margin + 1
+        self.height = zone_h + 2 * margin + 1
+
+        with open(model_path, "rb") as f:
+            self.model_hash = hashlib.sha256(f.read()).hexdigest()
+        self.cache_file = os.path.join(self.cache_dir, f"umpire_zone_{self.model_hash[:16]}_{margin}.npz")
+
+        self.grids = self._load_cache()
+        # The 1.0 grid is always compiled; it answers calls for tolerances still compiling
+        missing = [tolerance for tolerance in dict.fromkeys((1.0, *tolerances)) if tolerance not in self.grids]
+        if missing:
+            for tolerance in missing:
+                self.grids[tolerance] = self._compile(tolerance)
+            self._save_cache()
+
+    def get_model(self):
+        """Get the underlying umpire model, unpickling it on first use."""
+        if self._model is None:
+            if self._model_loader is not None:
+                self._model = self._model_loader()
+            else:
+                with open(self.model_path, "rb") as f:
+                    self._model = pickle.load(f)
+        return self._model
+
+    def is_strike(self, x: float, y: float, tolerance: float = 1.0) -> bool:
+        """Return True if the umpire calls a pitch arriving at (x, y) a strike."""
+        grid = self.grids.get(tolerance)
+        if grid is None:
+            self.compile_in_background(tolerance)
+            grid = self.grids[1.0]
+
+        col = int(round(x)) - self.origin_x
+        row = int(round(y)) - self.origin_y
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return bool(grid[row, col])
+        return False
+
+    def compile_in_background(self, tolerance: float) -> threading.Thread:
+        """
+        Compile the grid for a tolerance on a background thread and add it to the cache.
+
+        Returns:
+            The compiling thread, or None if the grid exists or is already compiling
+        """
+        with self._lock:
+            if tolerance in self.grids or tolerance in self._compiling:
+                return None
+            self._compiling.add(tolerance)
+
+        def compile_grid():
+            try:
+                grid = self._compile(tolerance)
+                with self._lock:
+                    self.grids[tolerance] = grid
+                    self._save_cache()
+            except Exception as e:
+                print(f"Failed to compile umpire zone for tolerance {tolerance}: {e}")
+            finally:
+                with self._lock:
+                    self._compiling.discard(tolerance)
+
+        thread = threading.Thread(target=compile_grid, name="umpire-zone-compile", daemon=True)
+        thread.start()
+        return thread
+
+    def _compile(self, tolerance: float) -> np.ndarray:
+        """Evaluate the model at every grid pixel for one tolerance."""
+        import pandas as pd
+
+        cols, rows = np.meshgrid(np.arange(self.width) + self.origin_x,
+                                 np.arange(self.height) + self.origin_y)
+        # A tolerance above 1 widens the zone by pulling pixels towards its center
+        finalx = self.center[0] + (cols.ravel() - self.center[0]) / tolerance
+        finaly = self.center[1] + (rows.ravel() - self.center[1]) / tolerance
+        points = pd.DataFrame({'finalx': finalx, 'finaly': finaly})
+        return self.get_model().predict(points).astype(bool).reshape(self.height, self.width)
+
+    def _load_cache(self) -> dict:
+        """Load compiled grids for this model from disk, if present."""
+        try:
+            with np.load(self.cache_file) as data:
+                return {float(tolerance): grid for tolerance, grid in zip(data['tolerances'], data['grids'])}
+        except (OSError, KeyError, ValueError):
+            return {}
+
+    def _save_cache(self):
+        """Save all compiled grids for this model to disk."""
+        tolerances = sorted(self.grids)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.savez_compressed(self.cache_file, tolerances=np.array(tolerances),
+                                grids=np.stack([self.grids[tolerance] for tolerance in tolerances]))
+        except OSError as e:
+            print(f"Failed to save umpire zone cache: {e}")
+
+
+def main():
+    """Compile the grid of every difficulty's tolerance into the cache."""
+    start = time.perf_counter()
+    zone = UmpireZone(get_path("ai/ai_umpire.pkl"), tolerances=DEFAULT_TOLERANCES)
+    print(f"✓ Compiled {len(zone.grids)} umpire zone grids to {zone.cache_file} "
+          f"in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
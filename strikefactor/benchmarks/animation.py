@@ -0,0 +1,63 @@
+"""
+Benchmark for keyframe animation lookups.
+
+Times finding the pose for a frame with Animation.pose_at() against walking
+the keyframes in order, as the if/elif sprite timelines did, for the shipped
+windups and for synthetic sequences of growing length.
+
+Run from the strikefactor directory:
+    python -m benchmarks.animation
+"""
+import random
+import time
+
+from engine.animation import Animation
+from pitchers.arsenal import load_arsenal_spec
+
+LOOKUPS = 100000
+
+
+def linear_pose(keyframes, elapsed):
+    """Find the pose by testing each keyframe in turn."""
+    pose = keyframes[0][1:]
+    for keyframe in keyframes[1:]:
+        if elapsed <= keyframe[0]:
+            break
+        pose = keyframe[1:]
+    return pose
+
+
+def time_lookups(keyframes):
+    animation = Animation(keyframes)
+    end = keyframes[-1][0] + 200
+    times = [random.uniform(0, end) for _ in range(LOOKUPS)]
+
+    start = time.perf_counter()
+    for elapsed in times:
+        linear_pose(keyframes, elapsed)
+    linear_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+    start = time.perf_counter()
+    for elapsed in times:
+        animation.pose_at(elapsed)
+    bisect_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+    return linear_us, bisect_us
+
+
+def main():
+    random.seed(0)
+    print("Shipped windups:")
+    for name in ['sale', 'degrom', 'sasaki', 'yamamoto', 'mcclanahan']:
+        keyframes = load_arsenal_spec(name)['windup_animation']
+        linear_us, bisect_us = time_lookups(keyframes)
+        print(f"  {name:10s} {len(keyframes):3d} keyframes   linear {linear_us:5.2f} us   bisect {bisect_us:5.2f} us")
+
+    print("Synthetic sequences:")
+    for length in [10, 100, 1000]:
+        keyframes = [[i * 10, i + 1, 0, 0] for i in range(length)]
+        linear_us, bisect_us = time_lookups(keyframes)
+        print(f"  {length:4d} keyframes   linear {linear_us:7.2f} us   bisect {bisect_us:5.2f} us")
+
+
+if __name__ == "__main__":
+    main()
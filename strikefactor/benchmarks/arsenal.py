@@ -0,0 +1,57 @@
+"""
+Benchmark for compiled pitch arsenals.
+
+Times drawing a pitch from a compiled arsenal table against solving the same
+pitch on every throw (speed draw, travel time, trajectory coefficients and
+velocity solve), as the hand-written pitch methods used to.
+
+Run from the strikefactor directory:
+    python -m benchmarks.arsenal
+"""
+import random
+import time
+
+import pygame
+
+from pitchers.arsenal import compile_arsenal, load_arsenal_spec
+from utils.physics import calculate_pitch_velocity, calculate_travel_time
+
+THROWS = 20000
+
+
+def solve_on_throw(pitch_spec, release_point, arm_extension):
+    """Draw and solve one pitch from scratch."""
+    speed = pitch_spec['speed_mph']
+    speed_mph = random.gauss(speed['mean'], speed['sd']) if isinstance(speed, dict) else speed
+    travel_time = calculate_travel_time(speed_mph, arm_extension)
+    target_x = random.uniform(*random.choice(pitch_spec['target']['x']))
+    target_y = random.uniform(*random.choice(pitch_spec['target']['y']))
+    return calculate_pitch_velocity(release_point, target_x, target_y,
+                                    pitch_spec['ax'], pitch_spec['ay'], travel_time)
+
+
+def main():
+    spec = load_arsenal_spec('degrom')
+    release_point = pygame.Vector2(640 + spec['release_point'][0], 240 + spec['release_point'][1])
+
+    start = time.perf_counter()
+    arsenal = compile_arsenal(spec, release_point, spec['arm_extension'])
+    compile_ms = (time.perf_counter() - start) * 1000
+    print(f"Compiled {len(arsenal)} pitches in {compile_ms:.1f} ms")
+
+    for name, pitch_spec in spec['pitches'].items():
+        start = time.perf_counter()
+        for _ in range(THROWS):
+            solve_on_throw(pitch_spec, release_point, spec['arm_extension'])
+        solved_us = (time.perf_counter() - start) / THROWS * 1e6
+
+        pitch = arsenal[name]
+        start = time.perf_counter()
+        for _ in range(THROWS):
+            pitch.sample()
+        compiled_us = (time.perf_counter() - start) / THROWS * 1e6
+        print(f"  {name:10s} solved per throw {solved_us:6.2f} us   compiled table {compiled_us:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
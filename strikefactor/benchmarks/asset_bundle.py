@@ -0,0 +1,68 @@
+"""
+Benchmark for the asset bundle.
+
+Loads every image and sound three ways: decoded one after another as the game
+used to, decoded on the bundle's thread pool into an empty bundle, and from
+the saved, memory-mapped bundle.
+
+Run from the strikefactor directory:
+    python -m benchmarks.asset_bundle
+"""
+import glob
+import os
+import tempfile
+import time
+
+import pygame
+
+from config import get_path
+from engine.asset_bundle import AssetBundle
+
+
+def timed(load) -> float:
+    """Milliseconds load() takes."""
+    start = time.perf_counter()
+    load()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.pre_init(44100, 16, 2, 4096)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    root = get_path("")
+    images = [os.path.relpath(path, root) for path in sorted(glob.glob(get_path("assets/images/**/*.png"), recursive=True))]
+    sounds = [os.path.relpath(path, root) for path in sorted(glob.glob(get_path("assets/sounds/*.mp3")))]
+
+    def load_sequentially():
+        for name in images:
+            pygame.image.load(get_path(name)).convert_alpha()
+        for name in sounds:
+            pygame.mixer.Sound(get_path(name))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "assets.bundle")
+        cold = AssetBundle(path)
+
+        def load_bundle(bundle):
+            bundle.load_images(images)
+            bundle.load_sounds(sounds)
+
+        print(f"{len(images)} images, {len(sounds)} sounds, {cold.workers} decode threads")
+        print(f"  sequential decode:   {timed(load_sequentially):7.1f} ms")
+        print(f"  thread pool decode:  {timed(lambda: load_bundle(cold)):7.1f} ms")
+        save_ms = timed(cold.save)
+        cold.close()
+        print(f"  bundle write:        {save_ms:7.1f} ms ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+        warm = AssetBundle(path)
+        print(f"  memory-mapped load:  {timed(lambda: load_bundle(warm)):7.1f} ms")
+        warm.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
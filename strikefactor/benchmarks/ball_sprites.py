@@ -0,0 +1,75 @@
+"""
+Benchmark for the pre-scaled ball sprite cache.
+
+Draws the ball along a pitch's z range the way the ball renderer used to,
+scaling the frame every time, and through the BallSpriteCache, checks both
+produce the same pixels and reports the cache hit rate and memory.
+
+Run from the strikefactor directory:
+    python -m benchmarks.ball_sprites
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config import get_path
+from engine.sprite_cache import BallSpriteCache, BALL_CENTER_OFFSET, ball_scale, ball_size_at
+
+
+def draw_scaled(screen, frames, frame_index, x, y, z):
+    """The ball renderer before the cache: scale the frame on every draw."""
+    ratio, width, height = ball_scale(ball_size_at(z))
+    image = pygame.transform.scale(frames[frame_index], (width, height))
+    screen.blit(image, (x - (BALL_CENTER_OFFSET[0] * ratio), y - (BALL_CENTER_OFFSET[1] * ratio)))
+
+
+def draw_cached(screen, cache, frame_index, x, y, z):
+    ratio, width, height = ball_scale(ball_size_at(z))
+    screen.blit(cache.get(frame_index, width, height),
+                (x - (BALL_CENTER_OFFSET[0] * ratio), y - (BALL_CENTER_OFFSET[1] * ratio)))
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    ball_dir = get_path('assets/images/ball')
+    frames = [pygame.image.load(f'{ball_dir}/{filename}').convert_alpha() for filename in os.listdir(ball_dir)]
+
+    start = time.perf_counter()
+    cache = BallSpriteCache(frames)
+    cache.prewarm()
+    prewarm_ms = (time.perf_counter() - start) * 1000
+
+    # One draw per frame of a 60fps pitch flight from release to the plate
+    draws = [(i % len(frames), 630 + i * 0.1, 480 + i * 0.05, 4600 - i * 4300 / 26)
+             for i in range(27)] * 2000
+
+    timings = {}
+    for name, draw, source in (("scaled", draw_scaled, frames), ("cached", draw_cached, cache)):
+        start = time.perf_counter()
+        for frame_index, x, y, z in draws:
+            draw(screen, source, frame_index, x, y, z)
+        timings[name] = (time.perf_counter() - start) / len(draws) * 1e6
+
+    mismatches = 0
+    surfaces = pygame.Surface((64, 64)), pygame.Surface((64, 64))
+    for frame_index, x, y, z in draws[:27 * len(frames)]:
+        for surface in surfaces:
+            surface.fill((0, 0, 0))
+        draw_scaled(surfaces[0], frames, frame_index, 32, 32, z)
+        draw_cached(surfaces[1], cache, frame_index, 32, 32, z)
+        mismatches += pygame.image.tobytes(surfaces[0], "RGB") != pygame.image.tobytes(surfaces[1], "RGB")
+
+    print(f"Prewarm: {prewarm_ms:.1f} ms")
+    print(f"Scale per draw: {timings['scaled']:6.2f} us, cached: {timings['cached']:6.2f} us "
+          f"({timings['scaled'] / timings['cached']:.1f}x)")
+    print(f"Draws with different pixels: {mismatches}")
+    cache.print_stats()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
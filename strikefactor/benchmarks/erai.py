@@ -0,0 +1,110 @@
+"""
+Benchmark for the array-backed ERAI Q-table.
+
+Compares the original dict-keyed Q-learning AI with ERAI on the same stream
+of updates and action choices, and checks that both learn the same Q-values.
+Also converts every shipped *_ai.pkl to confirm the legacy loader.
+
+Run from the strikefactor directory:
+    python -m benchmarks.erai
+"""
+import glob
+import random
+import time
+
+from ai.AI_2 import ERAI
+from ai.model_registry import load_pickled_model
+from config import get_path
+
+
+class DictERAI():
+    """The dict-keyed ERAI used before the Q-table was array-backed."""
+
+    def __init__(self, actions, alpha=0.5, epsilon=0.1):
+        self.q = dict()
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self.actions = actions
+
+    def update(self, old_state, action, new_state, reward):
+        old = self.get_q_value(old_state, action)
+        best_future = self.best_future_reward(new_state)
+        self.q[(tuple(old_state), action)] = old + (self.alpha * (reward + best_future - old))
+
+    def get_q_value(self, state, action):
+        if (tuple(state), action) in self.q:
+            return self.q[(tuple(state), action)]
+        return 0
+
+    def best_future_reward(self, state):
+        if not self.actions:
+            return 0
+        q_values = []
+        for action in self.actions:
+            if (tuple(state), action) in self.q:
+                q_values.append(self.q[(tuple(state), action)])
+            else:
+                q_values.append(0)
+        return max(q_values)
+
+    def choose_action(self, state, epsilon=True):
+        actions = self.actions
+        action_value = {}
+        for action in actions:
+            if (state, action) in self.q:
+                action_value[action] = self.q[(state, action)]
+            else:
+                action_value[action] = 0
+        max_actions = [action for action in actions if action_value[action] == max(action_value.values())]
+        best_action = random.choice(max_actions) if len(max_actions) > 1 else max_actions[0]
+        if epsilon:
+            random_action = random.choice(actions)
+            return random.choices([random_action, best_action], weights=[self.epsilon, 1-self.epsilon], k=1)[0]
+        return best_action
+
+
+def make_transitions(actions, count, seed=0):
+    """Generate random (state, action, new_state, reward) transitions."""
+    rng = random.Random(seed)
+
+    def state():
+        return (rng.randint(0, 2), rng.randint(0, 2), rng.randint(0, 3),
+                rng.randint(0, 3), rng.randint(0, 6), rng.randint(0, 6))
+
+    return [(state(), rng.choice(actions), state(), rng.choice([0.5, -0.25, 0.3, 2, -1, -1.5, 1.5]))
+            for _ in range(count)]
+
+
+def time_ai(ai, transitions):
+    start = time.perf_counter()
+    for old_state, action, new_state, reward in transitions:
+        ai.update(old_state, action, new_state, reward)
+    updates = len(transitions) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for old_state, _, _, _ in transitions:
+        ai.choose_action(old_state)
+    choices = len(transitions) / (time.perf_counter() - start)
+    return updates, choices
+
+
+def main():
+    actions = ['FF', 'SI', 'SL', 'CH', 'CB', 'FS']
+    transitions = make_transitions(actions, 200_000)
+
+    legacy, erai = DictERAI(actions), ERAI(actions)
+    legacy_rates = time_ai(legacy, transitions)
+    erai_rates = time_ai(erai, transitions)
+
+    mismatch = max(abs(value - erai.get_q_value(state, action)) for (state, action), value in legacy.q.items())
+    print(f"Dict Q-table:  {legacy_rates[0]:12,.0f} updates/s {legacy_rates[1]:12,.0f} choices/s")
+    print(f"Array Q-table: {erai_rates[0]:12,.0f} updates/s {erai_rates[1]:12,.0f} choices/s")
+    print(f"States: {len(erai.encoder)}, max Q-value difference: {mismatch:.2e}")
+
+    for path in sorted(glob.glob(get_path("ai/*_ai.pkl"))):
+        ai = load_pickled_model(path)
+        print(f"Converted {path.split('/')[-1]}: {len(ai.encoder)} states x {len(ai.actions)} actions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark for the FieldRenderer layer cache.
+
+Times draw_field() in every strike zone mode, once with the cached layers and
+once re-rendering every layer (and the heatmap font) each frame as the
+renderer did before the layers were cached.
+
+Run from the strikefactor directory:
+    python -m benchmarks.field_renderer
+"""
+import os
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from gameplay.field_renderer import FieldRenderer
+
+MODE_NAMES = {1: "hidden", 2: "outline", 3: "grid", 4: "heatmap", 5: "heatmap + averages"}
+
+
+def time_frames(renderer, bases, frames, redraw):
+    """Average draw_field() time in microseconds."""
+    start = time.perf_counter()
+    for _ in range(frames):
+        if redraw:
+            renderer.invalidate_layers()
+            renderer._font = None
+        renderer.draw_field(bases)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    bases = ('yellow', 'white', 'yellow')
+    frames = 2000
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        renderer = FieldRenderer(screen, data_dir=data_dir)
+        renderer.add_test_heatmap_data()
+
+        print(f"{'mode':<20} {'redrawn':>10} {'cached':>10}")
+        for mode, name in MODE_NAMES.items():
+            renderer.set_strikezone_mode(mode)
+            redrawn = time_frames(renderer, bases, frames, redraw=True)
+            cached = time_frames(renderer, bases, frames, redraw=False)
+            print(f"{mode} {name:<18} {redrawn:8.1f}us {cached:8.1f}us  ({redrawn / cached:.1f}x)")
+        renderer.pitch_store.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark for the hybrid sleep/spin frame pacer.
+
+Paces an empty frame loop with Clock.tick_busy_loop, Clock.tick and
+FramePacer.tick at several frame rates, and reports the CPU time used per
+second of wall time next to frame time percentiles.
+
+Run from the strikefactor directory:
+    python -m benchmarks.frame_pacer
+"""
+import time
+
+import numpy as np
+import pygame
+
+from engine.frame_pacer import FramePacer
+
+SECONDS = 2.0
+
+
+def measure(tick, fps):
+    """Run tick(fps) for SECONDS; returns (CPU share, frame time percentiles in ms)."""
+    frame_times = []
+    tick(fps)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    last = wall_start
+    while time.perf_counter() - wall_start < SECONDS:
+        tick(fps)
+        now = time.perf_counter()
+        frame_times.append((now - last) * 1000)
+        last = now
+    cpu = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+    return cpu, np.percentile(frame_times, (50, 99, 100))
+
+
+def main():
+    pygame.init()
+    for fps in (60, 144, 240):
+        print(f"{fps} FPS target ({1000 / fps:.2f} ms frames)")
+        pacers = (
+            ("Clock.tick_busy_loop", pygame.time.Clock().tick_busy_loop),
+            ("Clock.tick", pygame.time.Clock().tick),
+            ("FramePacer.tick", FramePacer().tick),
+        )
+        for name, tick in pacers:
+            cpu, (p50, p99, worst) = measure(tick, fps)
+            print(f"  {name:22s} CPU {cpu:6.1%}  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  max {worst:6.2f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
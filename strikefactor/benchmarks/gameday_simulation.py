@@ -0,0 +1,68 @@
+"""
+Benchmark for the vectorized GameDay simulator.
+
+Plays full games one at a time through GameDayManager, with the player's
+half-innings drawn from the same outcome probabilities, and compares the
+results and speed with GameDaySimulator on 100k games.
+
+Run from the strikefactor directory:
+    python -m benchmarks.gameday_simulation
+"""
+import random
+import time
+
+import numpy as np
+
+from gameplay.gameday_manager import GameDayManager
+from gameplay.gameday_simulator import GameDaySimulator
+
+
+def play_scalar_game():
+    """Play one game through GameDayManager; returns (player runs, opponent runs)."""
+    manager = GameDayManager()
+    while not manager.game_over:
+        while not manager.is_inning_over():
+            manager.simulate_opponent_at_bat()
+        manager.end_half_inning()
+        if manager.should_consider_player_relief_pitcher():
+            manager.substitute_player_relief_pitcher()
+
+        score_keeper = manager.player_scorekeeper
+        while not manager.is_inning_over():
+            outcome = random.choices(GameDayManager._OUTCOME_NAMES, cum_weights=GameDayManager._OUTCOME_CUM_WEIGHTS)[0]
+            before = score_keeper.get_score()
+            if outcome == 'WALK':
+                score_keeper.update_walk_event()
+            elif outcome in GameDayManager.HIT_TYPES:
+                score_keeper.update_hit_event(GameDayManager.HIT_TYPES[outcome])
+            runs = score_keeper.get_score() - before
+            manager.player_score += runs
+            manager.record_player_at_bat(outcome, runs, random.randint(3, 6))
+        if manager.should_consider_relief_pitcher():
+            manager.substitute_relief_pitcher()
+        manager.end_half_inning()
+    return manager.player_score, manager.opponent_score
+
+
+def main():
+    n_scalar, n_vector = 5_000, 100_000
+
+    start = time.perf_counter()
+    scores = np.array([play_scalar_game() for _ in range(n_scalar)])
+    scalar_rate = n_scalar / (time.perf_counter() - start)
+
+    simulator = GameDaySimulator(seed=0)
+    start = time.perf_counter()
+    summary = simulator.simulate(n_vector)
+    vector_rate = n_vector / (time.perf_counter() - start)
+
+    print(f"GameDayManager:   {scalar_rate:12,.0f} games/s, win {np.mean(scores[:, 0] > scores[:, 1]):.1%}, "
+          f"runs {scores[:, 0].mean():.2f} - {scores[:, 1].mean():.2f}")
+    print(f"GameDaySimulator: {vector_rate:12,.0f} games/s, win {summary.win_probability:.1%}, "
+          f"runs {summary.player_runs.mean():.2f} - {summary.opponent_runs.mean():.2f}")
+    print()
+    summary.print_summary()
+
+
+if __name__ == "__main__":
+    main()
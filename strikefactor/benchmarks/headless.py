@@ -0,0 +1,23 @@
+"""
+Benchmark of whole-game throughput with no window.
+
+Plays arcade, sandbox and GameDay headless with scripted input and reports
+frames per second, wall time per pitch and memory allocated per pitch.
+
+Run from the strikefactor directory:
+    python -m benchmarks.headless
+"""
+from engine.headless import MODES, HeadlessRunner
+
+PITCHES = 10
+
+
+def main():
+    reports = [HeadlessRunner(mode, pitches=PITCHES, seed=0, trace_allocations=True).run() for mode in MODES]
+    print()
+    for report in reports:
+        report.print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark for write-behind persistence of batting stats and lap history.
+
+Saves batting stats after every pitch and a lap every 50 pitches, first with
+synchronous json.dump calls as FieldRenderer used to, then through
+PersistenceService, and reports the time the game thread spends per save.
+
+Run from the strikefactor directory:
+    python -m benchmarks.persistence
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+from engine.persistence import PersistenceService, read_jsonl
+
+
+def make_stats():
+    return {
+        'heatmap_data': [random.randint(0, 50) for _ in range(9)],
+        'heatmap_attempts': [random.randint(50, 150) for _ in range(9)],
+        'total_swings': random.randint(0, 1000),
+        'total_hits': random.randint(0, 300),
+        'total_pitches': random.randint(0, 3000),
+        'total_at_bats': random.randint(0, 800),
+        'version': '1.1',
+    }
+
+
+def run_sync(directory, pitches, laps):
+    stats_file = os.path.join(directory, 'batting_stats.json')
+    lap_file = os.path.join(directory, 'lap_history.json')
+    history = {'laps': []}
+    start = time.perf_counter()
+    for pitch in range(pitches):
+        with open(stats_file, 'w') as f:
+            json.dump(make_stats(), f, indent=2)
+        if pitch % (pitches // laps) == 0:
+            history['laps'].append(dict(make_stats(), lap_number=len(history['laps']) + 1))
+            with open(lap_file, 'w') as f:
+                json.dump(history, f, indent=2)
+    return time.perf_counter() - start
+
+
+def run_write_behind(directory, pitches, laps):
+    stats_file = os.path.join(directory, 'batting_stats.json')
+    lap_file = os.path.join(directory, 'lap_history.jsonl')
+    service = PersistenceService(interval=0.5)
+    lap_number = 0
+    start = time.perf_counter()
+    for pitch in range(pitches):
+        service.save_json(stats_file, make_stats())
+        if pitch % (pitches // laps) == 0:
+            lap_number += 1
+            service.append_jsonl(lap_file, dict(make_stats(), lap_number=lap_number))
+    elapsed = time.perf_counter() - start
+    service.close()
+    assert len(read_jsonl(lap_file)) == laps
+    return elapsed, service.writes
+
+
+def main():
+    pitches, laps = 5000, 100
+    with tempfile.TemporaryDirectory() as directory:
+        sync = run_sync(directory, pitches, laps)
+    with tempfile.TemporaryDirectory() as directory:
+        write_behind, writes = run_write_behind(directory, pitches, laps)
+
+    print(f"{pitches} pitch saves, {laps} laps")
+    print(f"  json.dump on game thread: {sync * 1e6 / pitches:8.1f} us/save")
+    print(f"  PersistenceService:       {write_behind * 1e6 / pitches:8.1f} us/save "
+          f"({writes} file writes in the background)")
+    print(f"  speedup:                  {sync / write_behind:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
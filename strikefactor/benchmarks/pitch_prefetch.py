@@ -0,0 +1,51 @@
+"""
+Benchmark for the next-pitch prefetch.
+
+Times the pitch key's work (GameplayState._initiate_pitch) when the pitch was
+solved ahead of time on an idle frame and when it has to be solved on the key
+press, as it was before prefetching.
+
+Run from the strikefactor directory:
+    python -m benchmarks.pitch_prefetch
+"""
+import tempfile
+import time
+
+import numpy as np
+
+PITCHES = 200
+
+
+def time_key_press(state, prefetched: bool) -> float:
+    """Microseconds to start a pitch from the pitch key."""
+    if prefetched:
+        state.pitch_prefetcher.prepare()
+    else:
+        state.pitch_prefetcher.invalidate()
+    start = time.perf_counter()
+    state._initiate_pitch()
+    elapsed = (time.perf_counter() - start) * 1e6
+    state.pitch_simulation = None
+    return elapsed
+
+
+def main():
+    from main import Game
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        game = Game(headless=True, data_dir=data_dir)
+        game.enter_gamemode('Sale', 'sale')
+        game.run_frame(0)
+        state = game.state_manager.get_current_state()
+
+        print(f"{PITCHES} pitches")
+        for prefetched in (False, True):
+            times = np.array([time_key_press(state, prefetched) for _ in range(PITCHES)])
+            label = "prefetched" if prefetched else "solved on key press"
+            print(f"  {label:20s} p50 {np.percentile(times, 50):7.1f} us  p99 {np.percentile(times, 99):7.1f} us")
+        print(f"  prefetcher: {state.pitch_prefetcher.get_stats()}")
+        game.cleanup()
+
+
+if __name__ == "__main__":
+    main()
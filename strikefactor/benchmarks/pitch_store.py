@@ -0,0 +1,82 @@
+"""
+Benchmark for the SQLite pitch store.
+
+Records a few hundred thousand pitches through PitchStore into a temporary
+database, timing what the frame loop pays per pitch and how long the writer
+thread takes to commit them, then times the aggregate queries behind the
+heatmap, the lap log and the scouting panel.
+
+Run from the strikefactor directory:
+    python -m benchmarks.pitch_store
+"""
+import os
+import random
+import tempfile
+import time
+
+from gameplay.pitch_store import PitchStore
+
+PITCHERS = ['Chris Sale', 'Jacob deGrom', 'Yoshinobu Yamamoto', 'Roki Sasaki', 'Shane McClanahan']
+PITCH_KEYS = ['FF_strike', 'FF_chase', 'SLD', 'CHU', 'CB', 'SI', 'FS']
+PITCH_TYPES = ['FF', 'SL', 'CH', 'CB', 'SI', 'FS']
+OUTCOMES = ['strike', 'ball', 'foul', 'strikeout', 'walk', 'SINGLE', 'DOUBLE', 'HOME RUN', 'FLYOUT', 'GROUNDOUT']
+
+
+def random_pitch():
+    swung = random.random() < 0.45
+    outcome = random.choice(OUTCOMES)
+    return dict(
+        pitcher=random.choice(PITCHERS), pitch_key=random.choice(PITCH_KEYS), pitch_type=random.choice(PITCH_TYPES),
+        balls=random.randint(0, 3), strikes=random.randint(0, 2), outs=random.randint(0, 2),
+        final_x=random.uniform(500, 760), final_y=random.uniform(380, 600), zone=random.randint(-1, 8),
+        outcome=outcome, swung=swung, hit=outcome in ('SINGLE', 'DOUBLE', 'HOME RUN'),
+        at_bat=outcome in ('strikeout', 'SINGLE', 'DOUBLE', 'HOME RUN', 'FLYOUT', 'GROUNDOUT'),
+        ball=outcome == 'ball', swinging_strike=swung and outcome == 'strike', in_zone=random.random() < 0.5,
+    )
+
+
+def time_query(name, query, repeats=20):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        query()
+    print(f"  {name:<40} {(time.perf_counter() - start) / repeats * 1000:8.2f} ms")
+
+
+def main():
+    n_pitches, n_sessions = 300_000, 30
+    pitches = [random_pitch() for _ in range(n_pitches)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PitchStore(os.path.join(tmp, "pitches.db"), batch_size=512)
+
+        record_seconds = 0.0
+        start = time.perf_counter()
+        per_session = n_pitches // n_sessions
+        for session in range(n_sessions):
+            store.start_session()
+            for i, pitch in enumerate(pitches[session * per_session:(session + 1) * per_session]):
+                if i and i % 1000 == 0:
+                    store.close_lap()
+                t = time.perf_counter()
+                store.record_pitch(**pitch)
+                record_seconds += time.perf_counter() - t
+        store.flush()
+        total_seconds = time.perf_counter() - start
+
+        print(f"{n_pitches:,} pitches in {n_sessions} sessions")
+        print(f"  record_pitch() on the frame loop: {record_seconds / n_pitches * 1e6:.2f} us per pitch")
+        print(f"  written and committed in {total_seconds:.2f} s ({n_pitches / total_seconds:,.0f} pitches/s)")
+        print(f"  database size: {os.path.getsize(store.db_path) / 2**20:.1f} MiB")
+
+        time_query("pitch_count() one pitcher", lambda: store.pitch_count(pitcher='Chris Sale'))
+        time_query("outcome_counts() all pitches", store.outcome_counts)
+        time_query("heatmap_counts() all pitches", store.heatmap_counts)
+        time_query("heatmap_counts() one lap", lambda: store.heatmap_counts(lap=store.lap - 1))
+        time_query("load_lap_totals() one lap", lambda: store.load_lap_totals(store.lap - 1))
+        time_query("lap_summaries() last 100 laps", lambda: store.lap_summaries(100))
+        time_query("pitch_type_summary() one pitcher", lambda: store.pitch_type_summary('Chris Sale'))
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark for the batch trajectory engine.
+
+Compares simulate_pitch_trajectory run in a Python loop with the vectorized
+simulate_pitch_trajectories and checks that both produce the same plate
+locations.
+
+Run from the strikefactor directory:
+    python -m benchmarks.pitch_trajectories
+"""
+import time
+
+import numpy as np
+
+from utils.physics import simulate_pitch_trajectory, simulate_pitch_trajectories, calculate_travel_time
+
+
+def make_pitches(count, seed=0):
+    """Generate random pitch parameters similar to the shipped arsenals."""
+    rng = np.random.default_rng(seed)
+    release = np.column_stack((rng.uniform(580, 710, count), rng.uniform(420, 450, count)))
+    vx = rng.uniform(-15, 15, count)
+    vy = rng.uniform(-15, 15, count)
+    ax = rng.uniform(-0.02, 0.02, count)
+    ay = rng.uniform(0.005, 0.045, count)
+    traveltime = calculate_travel_time(rng.uniform(78, 100, count), 6.7)
+    return release, vx, vy, ax, ay, traveltime
+
+
+def main():
+    loop_count, batch_count = 2_000, 200_000
+    release, vx, vy, ax, ay, traveltime = make_pitches(batch_count)
+
+    start = time.perf_counter()
+    looped = np.array([
+        simulate_pitch_trajectory(release[i, 0], release[i, 1], vx[i], vy[i], ax[i], ay[i], traveltime[i])
+        for i in range(loop_count)
+    ])
+    loop_rate = loop_count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    batched = simulate_pitch_trajectories(release, vx, vy, ax, ay, traveltime)
+    batch_rate = batch_count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    _, paths = simulate_pitch_trajectories(release[:loop_count], vx[:loop_count], vy[:loop_count],
+                                           ax[:loop_count], ay[:loop_count], traveltime[:loop_count],
+                                           return_paths=True)
+    paths_rate = loop_count / (time.perf_counter() - start)
+
+    print(f"Python loop:          {loop_rate:12,.0f} pitches/s")
+    print(f"Batch engine:         {batch_rate:12,.0f} pitches/s")
+    print(f"Batch engine + paths: {paths_rate:12,.0f} pitches/s  (paths {paths.shape})")
+    print(f"Max difference vs loop: {np.abs(batched[:loop_count] - looped).max():.2e} px")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark for the pitch velocity solver.
+
+Compares the original bisection-over-simulation solver with the closed-form
+solver in utils.physics and checks that both land the pitch on its target.
+
+Run from the strikefactor directory:
+    python -m benchmarks.pitch_velocity
+"""
+import random
+import time
+
+from utils.physics import simulate_pitch_trajectory, calculate_pitch_velocity, calculate_travel_time
+
+
+def bisection_pitch_velocity(release_point, target_x, target_y, ax, ay, traveltime,
+                             z_start=4600, z_end=300, fps=60, tolerance=0.01, max_iterations=100):
+    """The solver calculate_pitch_velocity used before the closed-form version."""
+    release_x, release_y = release_point[0], release_point[1]
+
+    def find_velocity_for_target(target_val, accel, is_x):
+        v_guess = (target_val - (release_x if is_x else release_y)) / 10
+        v_low, v_high = -200, 200
+        for _ in range(max_iterations):
+            if is_x:
+                final_pos, _ = simulate_pitch_trajectory(
+                    release_x, release_y, v_guess, 0, accel, 0, traveltime, z_start, z_end, fps
+                )
+            else:
+                _, final_pos = simulate_pitch_trajectory(
+                    release_x, release_y, 0, v_guess, 0, accel, traveltime, z_start, z_end, fps
+                )
+            error = final_pos - target_val
+            if abs(error) < tolerance:
+                return v_guess
+            if error > 0:
+                v_high = v_guess
+            else:
+                v_low = v_guess
+            v_guess = (v_low + v_high) / 2
+        return v_guess
+
+    return find_velocity_for_target(target_x, ax, True), find_velocity_for_target(target_y, ay, False)
+
+
+def make_pitches(count, seed=0):
+    """Generate random pitch parameters similar to the shipped arsenals."""
+    rng = random.Random(seed)
+    pitches = []
+    for _ in range(count):
+        release_point = (rng.uniform(580, 710), rng.uniform(420, 450))
+        ax = rng.uniform(-0.02, 0.02)
+        ay = rng.uniform(0.005, 0.045)
+        traveltime = calculate_travel_time(rng.uniform(78, 100), 6.7)
+        target = (rng.uniform(490, 700), rng.uniform(380, 620))
+        pitches.append((release_point, target[0], target[1], ax, ay, traveltime))
+    return pitches
+
+
+def time_solver(solver, pitches):
+    start = time.perf_counter()
+    for pitch in pitches:
+        solver(*pitch)
+    return (time.perf_counter() - start) / len(pitches)
+
+
+def max_target_error(solver, pitches):
+    worst = 0.0
+    for release_point, target_x, target_y, ax, ay, traveltime in pitches:
+        vx, vy = solver(release_point, target_x, target_y, ax, ay, traveltime)
+        final_x, final_y = simulate_pitch_trajectory(release_point[0], release_point[1],
+                                                     vx, vy, ax, ay, traveltime)
+        worst = max(worst, abs(final_x - target_x), abs(final_y - target_y))
+    return worst
+
+
+def main():
+    pitches = make_pitches(500)
+
+    before = time_solver(bisection_pitch_velocity, pitches)
+    after = time_solver(calculate_pitch_velocity, pitches)
+
+    print(f"Bisection solver:   {before * 1e6:10.1f} us/pitch  "
+          f"(max target error {max_target_error(bisection_pitch_velocity, pitches):.2e} px)")
+    print(f"Closed-form solver: {after * 1e6:10.1f} us/pitch  "
+          f"(max target error {max_target_error(calculate_pitch_velocity, pitches):.2e} px)")
+    print(f"Speedup: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark for the frame profiler's overhead.
+
+Times a loop of profiler sections with the profiler disabled and enabled
+against the same loop with no instrumentation, then writes a Chrome trace
+of the enabled run.
+
+Run from the strikefactor directory:
+    python -m benchmarks.profiler
+"""
+import os
+import tempfile
+import time
+
+from engine.profiler import FrameProfiler
+
+FRAMES = 2000
+SECTIONS_PER_FRAME = 15
+
+
+def run(profiler):
+    """Per-section cost in nanoseconds of FRAMES frames of SECTIONS_PER_FRAME sections."""
+    start = time.perf_counter_ns()
+    for _ in range(FRAMES):
+        if profiler is None:
+            for _ in range(SECTIONS_PER_FRAME):
+                pass
+            continue
+        profiler.begin_frame()
+        for _ in range(SECTIONS_PER_FRAME):
+            with profiler.section("phase"):
+                pass
+        profiler.end_frame()
+    return (time.perf_counter_ns() - start) / (FRAMES * SECTIONS_PER_FRAME)
+
+
+def main():
+    baseline = run(None)
+    disabled = FrameProfiler()
+    disabled_ns = run(disabled)
+    enabled = FrameProfiler()
+    enabled.set_enabled(True)
+    enabled_ns = run(enabled)
+
+    print(f"{FRAMES} frames x {SECTIONS_PER_FRAME} sections")
+    print(f"  no instrumentation: {baseline:7.0f} ns/section")
+    print(f"  profiler disabled:  {disabled_ns:7.0f} ns/section "
+          f"({(disabled_ns - baseline) * SECTIONS_PER_FRAME / 1000:.2f} us/frame)")
+    print(f"  profiler enabled:   {enabled_ns:7.0f} ns/section "
+          f"({(enabled_ns - baseline) * SECTIONS_PER_FRAME / 1000:.2f} us/frame)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = enabled.save_trace(os.path.join(directory, "trace.json"))
+        print(f"  trace size: {os.path.getsize(path) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark of startup time with lazily loaded pitchers, batter sprites and sounds.
+
+Creates a headless game and runs its first frame, then loads every asset
+startup skipped, to show what building them all up front used to cost.
+
+Run from the strikefactor directory:
+    python -m benchmarks.startup
+"""
+import tempfile
+import time
+
+from main import LAUNCH_TIME, Game
+
+
+def total_load_ms(stats: dict) -> float:
+    """Sum of load times in a name -> {'load_time_ms': ...} mapping."""
+    return sum(entry['load_time_ms'] for entry in stats.values())
+
+
+def main():
+    import_ms = (time.perf_counter() - LAUNCH_TIME) * 1000
+    with tempfile.TemporaryDirectory() as data_dir:
+        game = Game(headless=True, data_dir=data_dir, launch_time=LAUNCH_TIME)
+        game.run_frame(0)
+
+        # Load everything the eager startup built before the first frame
+        for pitcher in game.pitcher_manager.pitchers.values():
+            pitcher.get_windup()
+        for asset in (*game.batter.animation_sets.values(), *game.sound_manager.sounds.values()):
+            asset.get()
+        pitchers_ms = total_load_ms(game.pitcher_manager.get_stats())
+        batter_ms = total_load_ms(game.batter.get_load_stats())
+        sounds_ms = total_load_ms(game.sound_manager.get_load_stats())
+        game.cleanup()
+
+    print(f"Imports:                  {import_ms:7.0f} ms")
+    print(f"First interactive frame:  {game.startup_ms:7.0f} ms after launch ({game.init_ms:.0f} ms in Game())")
+    print("Deferred until first use:")
+    print(f"  5 pitchers with AIs:    {pitchers_ms:7.0f} ms")
+    print(f"  4 batter sprite sets:   {batter_ms:7.0f} ms")
+    print(f"  {len(game.sound_manager.sounds)} sounds:              {sounds_ms:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
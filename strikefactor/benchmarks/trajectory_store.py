@@ -0,0 +1,90 @@
+"""
+Benchmark for the trajectory store.
+
+Records a long session of pitches, once the way the game used to keep them
+(a list of [x, y, size, color, status] points per pitch, plus a copy in each
+PitchViz record) and once in a TrajectoryStore as 64-byte parameter rows, and
+compares the memory each keeps. Then times regenerating a pitch's points, as
+PitchViz does when it is selected, and drawing it again from the cache.
+
+Run from the strikefactor directory:
+    python -m benchmarks.trajectory_store
+"""
+import random
+import time
+import tracemalloc
+
+from helpers import EnhancedPitchRecord
+from gameplay.trajectory_store import TrajectoryRecord, TrajectoryStore
+from utils.physics import calculate_pitch_velocity
+
+PITCHES = 2000
+CAPACITY = 50
+ENGINE_FPS = 120
+FOLLOW_THROUGH_MS = 700
+
+
+def make_pitch():
+    """A TrajectoryRecord of a random pitch, like the shipped arsenals throw."""
+    release_point = (random.uniform(560, 620), random.uniform(410, 430))
+    ax, ay = random.uniform(-0.015, 0.015), random.uniform(0.005, 0.045)
+    traveltime = random.uniform(380, 480)
+    vx, vy = calculate_pitch_velocity(release_point, random.uniform(560, 700), random.uniform(380, 620),
+                                      ax, ay, traveltime)
+    return TrajectoryRecord(release_point, vx, vy, ax, ay, traveltime, stop_ms=traveltime + 10,
+                            duration_ms=traveltime + FOLLOW_THROUGH_MS, fps=ENGINE_FPS,
+                            status=random.choice(['strike', 'ball', 'hit', 'out']))
+
+
+def record_points(pitches):
+    pitch_trajectories, enhanced_pitch_records = [], []
+    for i, pitch in enumerate(pitches):
+        trajectory = pitch.points()
+        pitch_trajectories.append(trajectory)
+        enhanced_pitch_records.append(EnhancedPitchRecord(trajectory.copy(), 'FF', 95.0, 'STRIKE',
+                                                          tuple(trajectory[-1][:2]), i))
+    return pitch_trajectories, enhanced_pitch_records
+
+
+def record_store(pitches):
+    store = TrajectoryStore(CAPACITY)
+    for pitch in pitches:
+        store.add(pitch, 'FF', 95.0, 'STRIKE', (pitch.release_x, pitch.release_y))
+    return store
+
+
+def retained_kib(record, pitches):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = record(pitches)
+    retained = (tracemalloc.get_traced_memory()[0] - before) / 1024
+    tracemalloc.stop()
+    return kept, retained
+
+
+def main():
+    random.seed(0)
+    pitches = [make_pitch() for _ in range(PITCHES)]
+    points = sum(len(pitch) for pitch in pitches) / PITCHES
+    _, points_kib = retained_kib(record_points, pitches)
+    store, store_kib = retained_kib(record_store, pitches)
+    print(f"{PITCHES} pitches of {points:.0f} points:")
+    print(f"  point lists        {points_kib:8.0f} KiB retained")
+    print(f"  parameter rows     {store_kib:8.0f} KiB retained (records for PitchViz included)")
+
+    selected = random.sample(range(PITCHES), CAPACITY)
+    start = time.perf_counter()
+    for index in selected:
+        list(store.records[index].trajectory)
+    regenerate_us = (time.perf_counter() - start) / len(selected) * 1e6
+
+    start = time.perf_counter()
+    for index in selected:
+        list(store.records[index].trajectory)
+    cached_us = (time.perf_counter() - start) / len(selected) * 1e6
+    print(f"  regenerating a pitch's points: {regenerate_us:.0f} us, cached: {cached_us:.1f} us")
+    store.print_stats()
+
+
+if __name__ == "__main__":
+    main()
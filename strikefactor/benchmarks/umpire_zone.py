@@ -0,0 +1,66 @@
+"""
+Parity check and latency benchmark for the rasterized umpire zone.
+
+Compares UmpireZone.is_strike with calling the sklearn umpire model on a
+one-row DataFrame, the way ball/strike calls used to be made, and fails if
+any tolerance's grid disagrees with the model at pixel centers.
+
+Run from the strikefactor directory:
+    python -m benchmarks.umpire_zone
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from ai.umpire_zone import DEFAULT_TOLERANCES, UmpireZone
+from config import get_path
+
+# Share of pixel centers where a grid must agree with the model
+PARITY_THRESHOLD = 0.999
+
+
+def model_calls(zone, model, points, tolerance):
+    """Call points with the model, scaled about the zone center the way the grids are."""
+    scaled = np.array(zone.center) + (points - np.array(zone.center)) / tolerance
+    return model.predict(pd.DataFrame(scaled, columns=['finalx', 'finaly'])).astype(bool)
+
+
+def main():
+    start = time.perf_counter()
+    zone = UmpireZone(get_path("ai/ai_umpire.pkl"), tolerances=DEFAULT_TOLERANCES)
+    print(f"UmpireZone ready in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({len(zone.grids)} grids of {zone.height}x{zone.width})")
+    model = zone.get_model()
+
+    rng = np.random.default_rng(0)
+    points = np.column_stack((rng.uniform(400, 860, 20_000), rng.uniform(250, 720, 20_000)))
+    for tolerance in DEFAULT_TOLERANCES:
+        actual = np.array([zone.is_strike(x, y, tolerance) for x, y in points])
+        parity = np.mean(actual == model_calls(zone, model, np.round(points), tolerance))
+        print(f"Tolerance {tolerance}: parity at pixel centers {parity * 100:.3f}%")
+        assert parity >= PARITY_THRESHOLD, \
+            f"Umpire zone for tolerance {tolerance} disagrees with the model at {(1 - parity) * 100:.3f}% of pixels"
+
+    actual = np.array([zone.is_strike(x, y) for x, y in points])
+    parity = np.mean(actual == model_calls(zone, model, points, 1.0))
+    print(f"Parity at raw positions: {parity * 100:.3f}% (differences are sub-pixel, on the zone edge)")
+
+    sample = points[:200]
+    start = time.perf_counter()
+    for x, y in sample:
+        model.predict(pd.DataFrame([[x, y]], columns=['finalx', 'finaly']))
+    before = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    for x, y in points:
+        zone.is_strike(x, y, 1.0)
+    after = (time.perf_counter() - start) / len(points)
+
+    print(f"sklearn predict on DataFrame: {before * 1e6:10.1f} us/call")
+    print(f"UmpireZone.is_strike:         {after * 1e6:10.1f} us/call")
+    print(f"Speedup: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
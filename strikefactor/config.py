@@ -33,6 +33,13 @@ def calculate_z_delta(engine_fps: int, traveltime: float) -> float:
     """
     return (PHYSICS_Z_DISTANCE * 1000) / (engine_fps * traveltime)
 
+# Pitcher AI rewards per pitch outcome (from the pitcher's point of view)
+OUTCOME_VALUES = {
+    'strike': 0.5, 'ball': -0.25, 'foul': 0.3, 'strikeout': 2, 'walk': -1,
+    'SINGLE': -1.5, 'DOUBLE': -2, 'TRIPLE': -2.5, 'HOME RUN': -3,
+    'FLYOUT': 1.5, 'GROUNDOUT': 1.5
+}
+
 # Player positions
 RIGHT_BATTER_POS = (330, 190)
 LEFT_BATTER_POS = (735, 190)
@@ -0,0 +1,75 @@
+"""
+Animation - Sprite sequences as sorted keyframe tables.
+
+An animation is a list of keyframes [time_ms, frame, x_offset, y_offset]
+sorted by time. A keyframe is shown once more than time_ms has elapsed since
+the animation started, until the next keyframe takes over; before the
+second keyframe the first one is shown. pose_at() finds the keyframe with
+one bisect, so drawing a frame costs the same however long the sequence is.
+
+Pitcher windups are the "windup_animation" of each arsenal spec in
+pitchers/arsenals/. Other sequences live in JSON files read once through
+load_animations(): a name -> {"sprites": sprite set, "<variant>": keyframes}
+mapping, e.g. one keyframe list per batting hand.
+"""
+
+import json
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+from config import get_path
+
+_loaded = {}
+
+
+class Animation:
+    """A keyframe table looked up by elapsed time."""
+
+    __slots__ = ('times', 'poses')
+
+    def __init__(self, keyframes: List[list]):
+        """
+        Args:
+            keyframes: [time_ms, frame, x_offset, y_offset] rows
+        """
+        if not keyframes:
+            raise ValueError("An animation needs at least one keyframe")
+        keyframes = sorted(keyframes, key=lambda keyframe: keyframe[0])
+        self.times = [keyframe[0] for keyframe in keyframes]
+        self.poses = [tuple(keyframe[1:4]) for keyframe in keyframes]
+
+    def __len__(self):
+        return len(self.times)
+
+    def pose_at(self, elapsed: float) -> Tuple[int, int, int]:
+        """
+        Get the pose shown after elapsed milliseconds.
+
+        Returns:
+            Tuple of (frame, x_offset, y_offset)
+        """
+        i = bisect_left(self.times, elapsed) - 1
+        return self.poses[i if i > 0 else 0]
+
+    def duration(self) -> float:
+        """Time of the last keyframe, after which the pose no longer changes."""
+        return self.times[-1]
+
+
+def load_animations(path: str) -> Dict[str, dict]:
+    """
+    Load an animation file once; later calls return the same tables.
+
+    Args:
+        path: JSON file relative to the game directory
+
+    Returns:
+        Dict of name -> {'sprites': sprite set, variant: Animation, ...}
+    """
+    if path not in _loaded:
+        with open(get_path(path)) as f:
+            spec = json.load(f)
+        _loaded[path] = {
+            name: {key: value if key == 'sprites' else Animation(value) for key, value in sequence.items()}
+            for name, sequence in spec.items()
+        }
+    return _loaded[path]
@@ -0,0 +1,352 @@
+"""
+Asset Bundle - Parallel decoding of images and sounds, cached as raw buffers.
+
+load_images() and load_sound() decode PNGs and MP3s on a thread pool the first
+time they are seen and keep the decoded RGBA pixels and mixer PCM. save()
+writes them to a bundle file under data/asset_cache/, which later launches
+memory-map: surfaces are built with pygame.image.frombuffer() and sounds from
+the PCM buffer, with no PNG or MP3 decoding at all. A Game with its own
+data_dir moves the bundle there with set_path().
+
+Each entry records its source file's size, mtime and SHA-256. An unchanged
+mtime is trusted; a changed one (an edit, a checkout, or a fresh PyInstaller
+extraction) is settled by re-hashing the source, so only assets that really
+changed are decoded again. Sounds also record the mixer format their PCM was
+converted to and are decoded again if the mixer opens with another one.
+
+Bundle layout: an 8-byte magic, a 4-byte little-endian header length, a JSON
+header with the format version and the entry index, then the buffers, each
+starting on a 64-byte boundary.
+
+Build a complete bundle ahead of time (e.g. before packaging) from the
+strikefactor directory:
+    python -m engine.asset_bundle
+"""
+
+import glob
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import pygame
+from config import get_path, resource_path
+from engine.persistence import atomic_write_bytes
+
+BUNDLE_VERSION = 1
+MAGIC = b'SFASSET\0'
+ALIGNMENT = 64
+
+
+def _file_hash(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _padding(length: int) -> bytes:
+    return b'\0' * (-length % ALIGNMENT)
+
+
+class AssetBundle:
+    """Loads images and sounds through a memory-mapped cache of decoded buffers."""
+
+    def __init__(self, path: str, workers: int = None):
+        """
+        Args:
+            path: Bundle file; created by the first save()
+            workers: Decoding threads (default: CPU count, at most 8)
+        """
+        self.path = path
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self._lock = threading.RLock()
+        self._pool = None
+        self._mmap = None
+        self._view = None
+        self._data_start = 0
+        self._index = {}    # Entries in the mapped file
+        self._pending = {}  # name -> (entry, buffer) decoded since the file was written
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.decode_ms = 0.0
+        self._open()
+
+    def _open(self):
+        """Map the bundle file, if there is a valid one."""
+        if not os.path.exists(self.path):
+            return
+        mapped = None
+        try:
+            with open(self.path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if mapped[:len(MAGIC)] != MAGIC:
+                raise ValueError("not an asset bundle")
+            header_length = int.from_bytes(mapped[8:12], 'little')
+            header = json.loads(mapped[12:12 + header_length])
+            if header.get('version') != BUNDLE_VERSION:
+                raise ValueError(f"bundle version {header.get('version')}, expected {BUNDLE_VERSION}")
+        except (OSError, ValueError) as e:
+            if mapped is not None:
+                mapped.close()
+            print(f"Ignoring asset bundle {self.path}: {e}")
+            return
+
+        self._mmap = mapped
+        self._view = memoryview(mapped)
+        self._data_start = 12 + header_length + len(_padding(12 + header_length))
+        self._index = header['entries']
+
+    def close(self):
+        """Unmap the bundle file."""
+        with self._lock:
+            if self._view is not None:
+                try:
+                    self._view.release()
+                    self._mmap.close()
+                except BufferError:
+                    # A buffer is still in use on another thread; the map closes once it is garbage
+                    pass
+            self._view = None
+            self._mmap = None
+            self._index = {}
+
+    def set_path(self, path: str):
+        """Use another bundle file; assets decoded but not yet saved are kept for its next save()."""
+        with self._lock:
+            if os.path.abspath(path) == os.path.abspath(self.path):
+                return
+            self.close()
+            self.path = path
+            self._dirty = bool(self._pending)
+            self._open()
+
+    # ==================== Loading ====================
+
+    def load_images(self, names: List[str]) -> list:
+        """
+        Load images as convert_alpha() surfaces, decoding the ones not in the bundle in parallel.
+
+        Args:
+            names: Image paths relative to the game directory, e.g. 'assets/images/sale/LEFTY1.png'
+
+        Returns:
+            The surfaces, in the order of names
+        """
+        surfaces = [None] * len(names)
+        misses = []
+        for i, name in enumerate(names):
+            cached = self._lookup(name, 'image')
+            if cached is None:
+                misses.append(i)
+            else:
+                entry, buffer = cached
+                surfaces[i] = pygame.image.frombuffer(buffer, tuple(entry['size']), 'RGBA').convert_alpha()
+
+        if misses:
+            paths = [self._source_path(names[i]) for i in misses]
+            for i, image in zip(misses, self._decode(pygame.image.load, paths)):
+                surface = image.convert_alpha()
+                self._add(names[i], 'image', {'size': list(surface.get_size())},
+                          pygame.image.tobytes(surface, 'RGBA'))
+                surfaces[i] = surface
+        return surfaces
+
+    def load_image(self, name: str) -> pygame.Surface:
+        """Load one image; see load_images()."""
+        return self.load_images([name])[0]
+
+    def load_sounds(self, names: List[str]) -> list:
+        """
+        Load sounds, decoding the ones not in the bundle in parallel.
+
+        Args:
+            names: Sound paths relative to the game directory, e.g. 'assets/sounds/POP2.mp3'
+
+        Returns:
+            The pygame.mixer.Sound objects, in the order of names
+        """
+        mixer_format = list(pygame.mixer.get_init() or ())
+        sounds = [None] * len(names)
+        misses = []
+        for i, name in enumerate(names):
+            cached = self._lookup(name, 'sound', mixer_format)
+            if cached is None:
+                misses.append(i)
+            else:
+                # The mixer copies the buffer
+                sounds[i] = pygame.mixer.Sound(buffer=cached[1])
+
+        if misses:
+            paths = [self._source_path(names[i]) for i in misses]
+            for i, sound in zip(misses, self._decode(pygame.mixer.Sound, paths)):
+                self._add(names[i], 'sound', {'mixer_format': mixer_format}, sound.get_raw())
+                sounds[i] = sound
+        return sounds
+
+    def load_sound(self, name: str) -> pygame.mixer.Sound:
+        """Load one sound; see load_sounds()."""
+        return self.load_sounds([name])[0]
+
+    @staticmethod
+    def _source_path(name: str) -> str:
+        return resource_path(get_path(name))
+
+    def _decode(self, decoder, paths: List[str]) -> list:
+        """Run a decoder over source files, on the thread pool when there is more than one."""
+        start = time.perf_counter()
+        if len(paths) == 1 or self.workers == 1:
+            decoded = [decoder(path) for path in paths]
+        else:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="asset-decode")
+            decoded = list(self._pool.map(decoder, paths))
+        with self._lock:
+            self.misses += len(paths)
+            self.decode_ms += (time.perf_counter() - start) * 1000
+        return decoded
+
+    def _lookup(self, name: str, kind: str, mixer_format: list = None):
+        """Get (entry, buffer) for an asset whose source is unchanged, or None."""
+        with self._lock:
+            if name in self._pending:
+                entry, buffer = self._pending[name]
+            elif name in self._index:
+                entry, buffer = self._index[name], None
+            else:
+                return None
+            if entry['kind'] != kind or entry.get('mixer_format') != (mixer_format if kind == 'sound' else None):
+                return None
+
+            path = self._source_path(name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            if stat.st_size != entry['source_size']:
+                return None
+            if stat.st_mtime_ns != entry['source_mtime_ns']:
+                # Touched or re-extracted, but maybe unchanged: the hash decides
+                if _file_hash(path) != entry['source_hash']:
+                    return None
+                entry['source_mtime_ns'] = stat.st_mtime_ns
+                self._dirty = True
+
+            if buffer is None:
+                start = self._data_start + entry['offset']
+                buffer = self._view[start:start + entry['length']]
+            self.hits += 1
+            return entry, buffer
+
+    def _add(self, name: str, kind: str, fields: dict, buffer: bytes):
+        """Keep a freshly decoded buffer for the next save()."""
+        path = self._source_path(name)
+        stat = os.stat(path)
+        entry = {
+            'kind': kind,
+            'source_size': stat.st_size,
+            'source_mtime_ns': stat.st_mtime_ns,
+            'source_hash': _file_hash(path),
+            **fields,
+        }
+        with self._lock:
+            self._pending[name] = (entry, buffer)
+            self._dirty = True
+
+    # ==================== Saving ====================
+
+    def save(self) -> bool:
+        """
+        Write the bundle if anything was decoded or revalidated since it was read.
+
+        Entries whose source file no longer exists are dropped.
+
+        Returns:
+            True if the bundle was written
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+
+            buffers = {}
+            for name, entry in self._index.items():
+                if name not in self._pending and os.path.exists(self._source_path(name)):
+                    start = self._data_start + entry['offset']
+                    buffers[name] = (entry, bytes(self._view[start:start + entry['length']]))
+            buffers.update(self._pending)
+
+            entries = {}
+            offset = 0
+            for name, (entry, buffer) in buffers.items():
+                entries[name] = {**entry, 'offset': offset, 'length': len(buffer)}
+                offset += len(buffer) + len(_padding(len(buffer)))
+            header = json.dumps({'version': BUNDLE_VERSION, 'entries': entries}).encode()
+
+            def chunks():
+                yield MAGIC
+                yield len(header).to_bytes(4, 'little')
+                yield header
+                yield _padding(12 + len(header))
+                for _, buffer in buffers.values():
+                    yield buffer
+                    yield _padding(len(buffer))
+
+            # The old file must be unmapped before it can be replaced on Windows
+            self.close()
+            atomic_write_bytes(self.path, chunks())
+            self._pending = {}
+            self._dirty = False
+            self._open()
+            print(f"✓ Saved {len(entries)} decoded assets ({offset / 1e6:.1f} MB) to {self.path}")
+            return True
+
+    # ==================== Statistics ====================
+
+    def get_stats(self) -> dict:
+        """Get bundle hits, decoded misses and the mapped size."""
+        with self._lock:
+            return {
+                'entries': len(self._index),
+                'pending': len(self._pending),
+                'mapped_bytes': len(self._mmap) if self._mmap is not None else 0,
+                'hits': self.hits,
+                'misses': self.misses,
+                'decode_ms': self.decode_ms,
+            }
+
+    def print_stats(self):
+        """Print bundle hits, decoded misses and the mapped size."""
+        stats = self.get_stats()
+        print(f"Asset bundle: {stats['hits']} loaded from {stats['entries']} cached "
+              f"({stats['mapped_bytes'] / 1e6:.1f} MB mapped), {stats['misses']} decoded "
+              f"in {stats['decode_ms']:.0f} ms")
+
+
+# Shared bundle all game assets are loaded through
+asset_bundle = AssetBundle(get_path("data/asset_cache/assets.bundle"))
+
+
+def main():
+    """Decode every image and sound into the bundle."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    # Same mixer format as the game, which sound entries are keyed by
+    pygame.mixer.pre_init(44100, 16, 2, 4096)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    root = get_path("")
+    images = sorted(glob.glob(get_path("assets/images/**/*.png"), recursive=True))
+    sounds = sorted(glob.glob(get_path("assets/sounds/*.mp3")))
+    asset_bundle.load_images([os.path.relpath(path, root).replace(os.sep, '/') for path in images])
+    asset_bundle.load_sounds([os.path.relpath(path, root).replace(os.sep, '/') for path in sounds])
+    asset_bundle.save()
+    asset_bundle.print_stats()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
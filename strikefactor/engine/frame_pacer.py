@@ -0,0 +1,107 @@
+"""
+Frame Pacer - Frame rate limiting that neither burns a core nor jitters.
+
+Clock.tick_busy_loop spins for the whole frame budget, and Clock.tick sleeps
+through it with the OS scheduler's granularity. FramePacer sleeps until just
+before the frame deadline and spin-waits only the last fraction of a
+millisecond. Deadlines advance by whole frame periods, so the frame rate does
+not drift, and measured frame times are kept for percentile reports.
+"""
+
+import time
+from collections import deque
+import numpy as np
+
+
+class FramePacer:
+    """Limits the frame rate with a sleep followed by a short spin."""
+
+    def __init__(self, target_fps: float = 60, spin_ms: float = 0.5, history: int = 600):
+        """
+        Args:
+            target_fps: Frames per second tick() paces to when given no target
+            spin_ms: Last part of each frame, in milliseconds, spent spin-waiting instead of sleeping
+            history: Frame times kept for get_percentiles()
+        """
+        self.target_fps = target_fps
+        self.spin_ms = spin_ms
+        self._frame_times = deque(maxlen=history)
+        self._last_tick = time.perf_counter()
+        self._deadline = self._last_tick
+        self.late_frames = 0
+
+    def tick(self, target_fps: float = None) -> float:
+        """
+        Wait until the next frame is due, like Clock.tick.
+
+        Args:
+            target_fps: Frames per second to pace to (default: target_fps); 0 or None means no limit
+
+        Returns:
+            Milliseconds since the previous tick
+        """
+        if target_fps is None:
+            target_fps = self.target_fps
+
+        if target_fps:
+            period = 1.0 / target_fps
+            self._deadline += period
+            now = time.perf_counter()
+            if self._deadline < now:
+                # Missed the deadline; start over from now rather than rushing to catch up
+                if now - self._deadline > period:
+                    self.late_frames += 1
+                self._deadline = now
+            else:
+                sleep_until = self._deadline - self.spin_ms / 1000.0
+                if sleep_until > now:
+                    time.sleep(sleep_until - now)
+                while time.perf_counter() < self._deadline:
+                    pass
+
+        now = time.perf_counter()
+        elapsed_ms = (now - self._last_tick) * 1000.0
+        self._last_tick = now
+        if not target_fps:
+            self._deadline = now
+        self._frame_times.append(elapsed_ms)
+        return elapsed_ms
+
+    def get_fps(self) -> float:
+        """Average frames per second over the recorded frames."""
+        if not self._frame_times:
+            return 0.0
+        return 1000.0 * len(self._frame_times) / sum(self._frame_times)
+
+    def get_percentiles(self, percentiles=(50, 95, 99)) -> dict:
+        """Frame time in milliseconds at each percentile of the recorded frames."""
+        if not self._frame_times:
+            return {p: 0.0 for p in percentiles}
+        values = np.percentile(np.fromiter(self._frame_times, dtype=np.float64), percentiles)
+        return dict(zip(percentiles, values.tolist()))
+
+    def reset_stats(self):
+        """Forget the recorded frame times."""
+        self._frame_times.clear()
+        self.late_frames = 0
+
+    def get_stats(self) -> dict:
+        """Get frame rate and frame time percentiles."""
+        percentiles = self.get_percentiles((50, 95, 99))
+        return {
+            'frames': len(self._frame_times),
+            'fps': self.get_fps(),
+            'p50_ms': percentiles[50],
+            'p95_ms': percentiles[95],
+            'p99_ms': percentiles[99],
+            'max_ms': max(self._frame_times, default=0.0),
+            'late_frames': self.late_frames,
+        }
+
+    def print_stats(self):
+        """Print a frame time report."""
+        stats = self.get_stats()
+        print(f"Frame pacer: {stats['fps']:.1f} FPS over {stats['frames']} frames, "
+              f"p50 {stats['p50_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms, "
+              f"p99 {stats['p99_ms']:.2f} ms, max {stats['max_ms']:.2f} ms, "
+              f"{stats['late_frames']} late frames")
@@ -0,0 +1,260 @@
+"""
+Headless - Play the game with no window, sound device or player.
+
+Game(headless=True) runs on SDL's dummy video and audio drivers. ScriptedInput
+plays the player's part through the normal event queue: it presses the menu
+buttons that lead into a mode, throws each pitch and swings at a seeded
+fraction of them, aiming at where the pitch crosses the plate. HeadlessRunner
+drives Game.run_frame() unpaced and reports frames per second, wall time per
+pitch and, optionally, memory allocated per pitch.
+
+Pitches still play out in real time, since the game is timed by
+pygame.time.get_ticks(); frames per second measures rendering and simulation
+throughput, wall time per pitch mostly measures the pitch itself.
+
+Run from the strikefactor directory:
+    python -m engine.headless gameplay --pitches 30 --allocations
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pygame
+import pygame_gui
+
+MODES = ('gameplay', 'sandbox', 'gameday')
+
+
+class ScriptedInput:
+    """Presses buttons, throws pitches and swings like a player would."""
+
+    # Button pressed in each state on the way into (and back into) each mode
+    MODE_BUTTONS = {
+        'gameplay': {'mode_select': 'arcade_mode', 'menu': 'sale', 'inning_end': 'main_menu'},
+        'sandbox': {'mode_select': 'sandbox_mode'},
+        'gameday': {'mode_select': 'arcade_mode', 'menu': 'gameday', 'gameday': 'start_gameday'},
+    }
+    # Button pressed in each phase between GameDay half-innings
+    GAMEDAY_TRANSITION_BUTTONS = {'SIMULATING': 'start_batting', 'SHOW_SCORE': 'next_inning'}
+
+    def __init__(self, mode: str, swing_rate: float = 0.6, power_rate: float = 0.3,
+                 timing_sd_ms: float = 25.0, aim_sd_px: float = 12.0, seed: int = 0):
+        """
+        Args:
+            mode: One of MODES
+            swing_rate: Fraction of pitches swung at
+            power_rate: Fraction of swings that are power swings
+            timing_sd_ms: Spread of swing timing around perfect contact
+            aim_sd_px: Spread of the swing location around where the pitch crosses the plate
+            seed: Seed for the script's choices
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown headless mode '{mode}', expected one of {MODES}")
+        self.mode = mode
+        self.swing_rate = swing_rate
+        self.power_rate = power_rate
+        self.timing_sd_ms = timing_sd_ms
+        self.aim_sd_px = aim_sd_px
+        self.random = random.Random(seed)
+        self.finished = False
+        self._simulation = None
+        self._swing = None
+
+    @staticmethod
+    def press(game, button_name: str):
+        """Queue a click on a UI button."""
+        pygame.event.post(pygame.event.Event(pygame_gui.UI_BUTTON_PRESSED,
+                                             ui_element=game.ui_manager.buttons[button_name]))
+
+    @staticmethod
+    def key(key: int):
+        """Queue a key press and release."""
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode='', scancode=0))
+
+    def poll(self, game):
+        """Queue this frame's input; call once before each Game.run_frame()."""
+        state_name = game.state_manager.get_current_state_name()
+        state = game.state_manager.get_current_state()
+
+        if state_name == 'gameday_transition':
+            if state.phase == 'FINAL':
+                self.finished = True
+            else:
+                self.press(game, self.GAMEDAY_TRANSITION_BUTTONS[state.phase])
+        elif state_name in self.MODE_BUTTONS[self.mode]:
+            self.press(game, self.MODE_BUTTONS[self.mode][state_name])
+        elif state_name in ('gameplay', 'sandbox_gameplay'):
+            self._play(game, state)
+
+    def _play(self, game, state):
+        simulation = state.pitch_simulation
+        if simulation is None:
+            # Arcade and GameDay innings end at the third out, before another pitch is thrown
+            if game.state_manager.is_current_state('sandbox_gameplay') or game.currentouts < 3:
+                self.key(pygame.K_q)
+            return
+
+        if simulation is not self._simulation:
+            self._simulation = simulation
+            self._swing = self._plan_swing(simulation)
+
+        if self._swing and pygame.time.get_ticks() >= self._swing[0]:
+            _, key, aim = self._swing
+            self._swing = None
+            pygame.mouse.set_pos(aim)
+            self.key(key)
+
+    def _plan_swing(self, simulation):
+        """Decide whether and how to swing at a pitch; returns (time, key, aim) or None."""
+        if self.random.random() >= self.swing_rate:
+            return None
+        key = pygame.K_e if self.random.random() < self.power_rate else pygame.K_w
+        # Contact is judged 150 ms after the swing starts
+        swing_time = simulation.arrival_time - 150 + self.random.gauss(0, self.timing_sd_ms)
+        plate_x, plate_y = simulation.flight[-1, 1], simulation.flight[-1, 2]
+        aim = (int(plate_x + self.random.gauss(0, self.aim_sd_px)),
+               int(plate_y + self.random.gauss(0, self.aim_sd_px)))
+        return swing_time, key, aim
+
+
+class HeadlessReport:
+    """Frame rate, pitch wall time and allocation figures of a headless run."""
+
+    def __init__(self, mode, frames, wall_seconds, frame_stats, pitch_seconds, pitch_allocations, startup_ms):
+        self.mode = mode
+        self.frames = frames
+        self.wall_seconds = wall_seconds
+        self.frame_stats = frame_stats
+        self.pitch_seconds = pitch_seconds
+        self.pitch_allocations = pitch_allocations
+        self.startup_ms = startup_ms
+
+    def get_stats(self) -> dict:
+        """Get the report as a dictionary."""
+        pitch_seconds = np.array(self.pitch_seconds) if self.pitch_seconds else np.zeros(1)
+        stats = {
+            'mode': self.mode,
+            'startup_ms': self.startup_ms,
+            'frames': self.frames,
+            'wall_seconds': self.wall_seconds,
+            'fps': self.frames / self.wall_seconds if self.wall_seconds else 0.0,
+            'frame_p50_ms': self.frame_stats['p50_ms'],
+            'frame_p99_ms': self.frame_stats['p99_ms'],
+            'pitches': len(self.pitch_seconds),
+            'pitch_mean_s': float(pitch_seconds.mean()),
+            'pitch_max_s': float(pitch_seconds.max()),
+        }
+        if self.pitch_allocations:
+            net, peak = np.array(self.pitch_allocations).T / 1024
+            stats.update({
+                'alloc_net_kib': float(net.mean()),
+                'alloc_peak_kib': float(peak.mean()),
+                'alloc_peak_max_kib': float(peak.max()),
+            })
+        return stats
+
+    def print_report(self):
+        """Print the report."""
+        stats = self.get_stats()
+        print(f"Headless {stats['mode']}: {stats['frames']} frames in {stats['wall_seconds']:.1f} s, "
+              f"{stats['fps']:.0f} FPS (frame p50 {stats['frame_p50_ms']:.2f} ms, p99 {stats['frame_p99_ms']:.2f} ms)")
+        if stats['startup_ms'] is not None:
+            print(f"  First interactive frame {stats['startup_ms']:.0f} ms after the game was created")
+        print(f"  {stats['pitches']} pitches, {stats['pitch_mean_s']:.2f} s per pitch "
+              f"(max {stats['pitch_max_s']:.2f} s)")
+        if 'alloc_net_kib' in stats:
+            print(f"  Allocations per pitch: {stats['alloc_net_kib']:.1f} KiB retained, "
+                  f"{stats['alloc_peak_kib']:.1f} KiB peak (max {stats['alloc_peak_max_kib']:.1f} KiB)")
+
+
+class HeadlessRunner:
+    """Runs a mode headless with scripted input and measures it."""
+
+    def __init__(self, mode: str, pitches: int = 20, fps: float = 0, seed: int = 0,
+                 trace_allocations: bool = False, max_seconds: float = 900.0):
+        """
+        Args:
+            mode: One of MODES
+            pitches: Stop after this many pitches (GameDay also stops at the end of the game)
+            fps: Frame rate to pace to; 0 runs as fast as possible
+            seed: Seed for the script and the game's random choices
+            trace_allocations: Measure memory allocated per pitch with tracemalloc (slows the game down)
+            max_seconds: Stop after this much wall time
+        """
+        self.mode = mode
+        self.pitches = pitches
+        self.fps = fps
+        self.seed = seed
+        self.trace_allocations = trace_allocations
+        self.max_seconds = max_seconds
+
+    def run(self) -> HeadlessReport:
+        """Play until enough pitches are thrown and return the report."""
+        from main import Game
+
+        random.seed(self.seed)
+        np.random.seed(self.seed)
+        script = ScriptedInput(self.mode, seed=self.seed)
+
+        # Stats and pitches go to a scratch directory, not the player's data
+        with tempfile.TemporaryDirectory() as data_dir:
+            game = Game(headless=True, data_dir=data_dir)
+            game.frame_pacer.reset_stats()
+            if self.trace_allocations:
+                tracemalloc.start()
+
+            pitch_seconds, pitch_allocations = [], []
+            pitch_start = None
+            frames = 0
+            start = time.perf_counter()
+            while (len(pitch_seconds) < self.pitches and not script.finished
+                   and time.perf_counter() - start < self.max_seconds):
+                script.poll(game)
+                if not game.run_frame(self.fps):
+                    break
+                frames += 1
+
+                pitching = game.is_pitch_in_progress()
+                if pitching and pitch_start is None:
+                    pitch_start = time.perf_counter()
+                    if self.trace_allocations:
+                        tracemalloc.reset_peak()
+                        allocated_before = tracemalloc.get_traced_memory()[0]
+                elif not pitching and pitch_start is not None:
+                    pitch_seconds.append(time.perf_counter() - pitch_start)
+                    pitch_start = None
+                    if self.trace_allocations:
+                        current, peak = tracemalloc.get_traced_memory()
+                        pitch_allocations.append((current - allocated_before, peak - allocated_before))
+
+            wall_seconds = time.perf_counter() - start
+            if self.trace_allocations:
+                tracemalloc.stop()
+            frame_stats = game.frame_pacer.get_stats()
+            game.cleanup()
+
+        return HeadlessReport(self.mode, frames, wall_seconds, frame_stats, pitch_seconds, pitch_allocations,
+                              game.startup_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play StrikeFactor headless with scripted input and report throughput.")
+    parser.add_argument('modes', nargs='+', choices=MODES)
+    parser.add_argument('--pitches', type=int, default=20)
+    parser.add_argument('--fps', type=float, default=0, help="frame rate to pace to; 0 is unpaced")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--allocations', action='store_true', help="measure allocations per pitch (slower)")
+    args = parser.parse_args()
+
+    reports = [HeadlessRunner(mode, args.pitches, args.fps, args.seed, args.allocations).run()
+               for mode in args.modes]
+    for report in reports:
+        report.print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Lazy Assets - Load sprites, sounds and pitchers on first use.
+
+A LazyAsset wraps a loader and runs it at most once: on the first get(), or
+ahead of time on a background thread via prefetch(), the same way the model
+registry loads AI models. LazyPitcher stands in for a Pitcher until something
+touches it, so startup only builds what the first screen needs and pitchers
+the player never picks are never decoded.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable
+
+
+class LazyAsset:
+    """A value loaded at most once, on first use or ahead of time in the background."""
+
+    def __init__(self, name: str, loader: Callable):
+        self.name = name
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.value = None
+        self.loaded = False
+        self.load_time_ms = 0.0
+
+    def get(self):
+        """Get the value, loading it (or waiting for a prefetch to finish) on first use."""
+        if self.loaded:
+            return self.value
+
+        with self.lock:
+            if not self.loaded:
+                start = time.perf_counter()
+                self.value = self.loader()
+                self.load_time_ms = (time.perf_counter() - start) * 1000
+                self.loaded = True
+        return self.value
+
+    def prefetch(self) -> threading.Thread:
+        """Load the value on a background thread; returns None if it is already loaded."""
+        return prefetch_assets([self], thread_name=f"prefetch-{self.name}")
+
+
+def prefetch_assets(assets: Iterable[LazyAsset], thread_name: str = "asset-prefetch") -> threading.Thread:
+    """Load the given assets one after another on a background thread; returns None if all are loaded."""
+    pending = [asset for asset in assets if not asset.loaded]
+    if not pending:
+        return None
+
+    def load_all():
+        for asset in pending:
+            try:
+                asset.get()
+            except Exception as e:
+                # Leave it unloaded; the next get() retries and raises on the caller's thread
+                print(f"Failed to prefetch '{asset.name}': {e}")
+
+    thread = threading.Thread(target=load_all, name=thread_name, daemon=True)
+    thread.start()
+    return thread
+
+
+def get_load_stats(assets: Dict[str, LazyAsset]) -> Dict[str, dict]:
+    """Get whether and how fast each named asset loaded."""
+    return {
+        name: {'loaded': asset.loaded, 'load_time_ms': asset.load_time_ms}
+        for name, asset in assets.items()
+    }
+
+
+class LazyPitcher:
+    """
+    Stand-in for a Pitcher that builds it on first attribute access.
+
+    Callers use it exactly like the pitcher; every attribute is forwarded to
+    the real one, which is constructed (sprites decoded, AI attached) the
+    first time it is needed unless prefetch() already did it.
+    """
+
+    def __init__(self, name: str, loader: Callable):
+        object.__setattr__(self, '_asset', LazyAsset(name, loader))
+
+    def __getattr__(self, attr):
+        # Only reached for attributes the proxy itself doesn't have
+        return getattr(self._asset.get(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._asset.get(), attr, value)
+
+    def __repr__(self):
+        state = 'loaded' if self._asset.loaded else 'not loaded'
+        return f"<LazyPitcher {self._asset.name} ({state})>"
+
+    def is_loaded(self) -> bool:
+        """Check if the pitcher has been built."""
+        return self._asset.loaded
+
+    def prefetch(self) -> threading.Thread:
+        """Build the pitcher on a background thread."""
+        return self._asset.prefetch()
+
+    def get_load_time_ms(self) -> float:
+        """Milliseconds it took to build the pitcher (0 until it is built)."""
+        return self._asset.load_time_ms
@@ -0,0 +1,180 @@
+"""
+Persistence - Write-behind saving of JSON files and JSONL journals.
+
+The game thread hands over a snapshot and returns immediately. A background
+thread writes the latest snapshot of each file at most once per interval, so
+many saves in a row cost one write. JSON files are replaced atomically through
+a temp file, so a crash leaves either the old or the new file and never a
+partial one; the new file keeps the old one's permissions. Journals are
+append-only JSONL files; a torn last line from a crash is skipped when the
+journal is read back.
+"""
+
+import json
+import os
+import secrets
+import threading
+from typing import Dict, Iterable, List
+
+
+def _create_temp(path: str):
+    """
+    Create an empty temp file next to path.
+
+    Returns:
+        Tuple of (file descriptor, temp file path)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        temp_path = os.path.join(directory, f"{os.path.basename(path)}.{secrets.token_hex(4)}.tmp")
+        try:
+            # 0666 as open() uses, so the umask applies (mkstemp would create it 0600)
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+
+def _replace(temp_path: str, path: str):
+    """Rename a temp file over path, keeping the permissions of the file it replaces."""
+    try:
+        os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+    except FileNotFoundError:
+        pass
+    os.replace(temp_path, path)
+
+
+def atomic_write_text(path: str, text: str):
+    """Write a file by writing a temp file next to it and renaming it over the original."""
+    fd, temp_path = _create_temp(path)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        _replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def atomic_write_bytes(path: str, chunks: Iterable[bytes]):
+    """Write binary chunks to a file atomically, the same way as atomic_write_text()."""
+    fd, temp_path = _create_temp(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        _replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def atomic_write_json(path: str, data, indent: int = 2):
+    """Write JSON atomically."""
+    atomic_write_text(path, json.dumps(data, indent=indent))
+
+
+def read_jsonl(path: str) -> List[dict]:
+    """Read every complete record of a JSONL journal; a missing file is an empty journal."""
+    records = []
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn write from a crash; everything before it is intact
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+class PersistenceService:
+    """Coalesces saves and writes them on a background thread."""
+
+    def __init__(self, interval: float = 2.0):
+        """
+        Args:
+            interval: Longest time in seconds a save waits before it is written
+        """
+        self.interval = interval
+        self._condition = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._pending_json: Dict[str, object] = {}
+        self._journal_ops = []
+        self._closed = False
+        self.writes = 0
+        self._thread = threading.Thread(target=self._run, name="persistence", daemon=True)
+        self._thread.start()
+
+    def save_json(self, path: str, data):
+        """Schedule data to be written to path; only the latest data per path is written."""
+        with self._condition:
+            self._pending_json[path] = data
+            self._condition.notify()
+
+    def append_jsonl(self, path: str, record: dict):
+        """Schedule one record to be appended to a JSONL journal."""
+        with self._condition:
+            self._journal_ops.append((path, 'a', json.dumps(record) + "\n"))
+            self._condition.notify()
+
+    def replace_jsonl(self, path: str, records: List[dict]):
+        """Schedule a journal to be rewritten atomically with the given records."""
+        text = "".join(json.dumps(record) + "\n" for record in records)
+        with self._condition:
+            self._journal_ops.append((path, 'w', text))
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or self._pending_json or self._journal_ops)
+                if self._closed:
+                    return
+                # Let further saves within the interval coalesce into this write
+                self._condition.wait_for(lambda: self._closed, timeout=self.interval)
+            self.flush()
+
+    def flush(self):
+        """Write everything scheduled so far on the calling thread."""
+        with self._io_lock:
+            with self._condition:
+                pending_json, self._pending_json = self._pending_json, {}
+                journal_ops, self._journal_ops = self._journal_ops, []
+
+            for path, mode, text in journal_ops:
+                try:
+                    if mode == 'w':
+                        atomic_write_text(path, text)
+                    else:
+                        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                        with open(path, 'a') as f:
+                            f.write(text)
+                    self.writes += 1
+                except OSError as e:
+                    print(f"✗ Error writing {path}: {e}")
+
+            for path, data in pending_json.items():
+                try:
+                    atomic_write_json(path, data)
+                    self.writes += 1
+                except (OSError, TypeError, ValueError) as e:
+                    print(f"✗ Error writing {path}: {e}")
+
+    def close(self):
+        """Stop the background thread and write anything still pending."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
@@ -0,0 +1,233 @@
+"""
+Profiler - Per-frame phase timings, an on-screen frame graph and trace export.
+
+Code marks phases of a frame with `with profiler.section("name"):`. While the
+profiler is enabled each section is timed with perf_counter_ns and kept with
+its frame for the last few seconds; while it is disabled section() returns a
+shared no-op context and nothing is recorded. The overlay draws a rolling
+frame-time graph with p50/p99 lines and the slowest phases, and save_trace()
+writes the recorded frames as a Chrome trace (chrome://tracing, Perfetto).
+"""
+
+import os
+import time
+from collections import deque
+from datetime import datetime
+import numpy as np
+import pygame
+from config import get_path
+from engine.persistence import atomic_write_json
+
+
+class _NullSection:
+    """Context returned by section() while the profiler is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """Times one phase and records it with the current frame."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._depth += 1
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        self.profiler._depth -= 1
+        self.profiler._events.append((self.name, self.start, end - self.start, self.profiler._depth))
+        return False
+
+
+class FrameProfiler:
+    """Records named phase timings per frame while enabled."""
+
+    GRAPH_SIZE = (360, 120)
+    GRAPH_POSITION = (10, 10)
+    GRAPH_FRAMES = 240
+    PHASES_SHOWN = 8
+    # The overlay is redrawn this often, so drawing it barely shows up in the frames it measures
+    OVERLAY_REFRESH_MS = 250
+
+    def __init__(self, history_seconds: float = 10.0, trace_dir: str = None):
+        """
+        Args:
+            history_seconds: Seconds of frames kept for the overlay and save_trace()
+            trace_dir: Directory save_trace() writes to by default (default: data/traces/)
+        """
+        self.history_seconds = history_seconds
+        self.trace_dir = trace_dir or get_path("data/traces")
+        self.enabled = False
+        self._frames = deque()
+        self._events = []
+        self._depth = 0
+        self._frame_start = None
+        self._font = None
+        self._overlay = None
+        self._overlay_time = 0
+
+    def set_enabled(self, enabled: bool):
+        """Start or stop recording; stopping keeps what was recorded for save_trace()."""
+        self.enabled = enabled
+        self._events = []
+        self._depth = 0
+        self._frame_start = None
+        self._overlay = None
+
+    def toggle(self):
+        """Toggle recording and the overlay."""
+        self.set_enabled(not self.enabled)
+        print(f"Profiler {'enabled' if self.enabled else 'disabled'}")
+
+    def section(self, name: str):
+        """Get a context manager that times a named phase of the current frame."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def begin_frame(self):
+        """Mark the start of a frame."""
+        if self.enabled:
+            self._frame_start = time.perf_counter_ns()
+            self._events = []
+
+    def end_frame(self):
+        """Mark the end of a frame and keep its phases."""
+        if not self.enabled or self._frame_start is None:
+            return
+        end = time.perf_counter_ns()
+        self._frames.append((self._frame_start, end - self._frame_start, self._events))
+        self._events = []
+        self._frame_start = None
+
+        cutoff = end - int(self.history_seconds * 1e9)
+        while self._frames and self._frames[0][0] < cutoff:
+            self._frames.popleft()
+
+    # ==================== Statistics ====================
+
+    def get_frame_times(self) -> np.ndarray:
+        """Recorded frame times in milliseconds, oldest first."""
+        return np.fromiter((duration for _, duration, _ in self._frames), dtype=np.int64, count=len(self._frames)) / 1e6
+
+    def get_phase_times(self, last_frames: int = None) -> dict:
+        """Mean milliseconds per frame spent in each phase, over all or the last few frames."""
+        frames = list(self._frames)[-last_frames:] if last_frames else self._frames
+        totals = {}
+        for _, _, events in frames:
+            for name, _, duration, _ in events:
+                totals[name] = totals.get(name, 0) + duration
+        count = max(len(frames), 1)
+        return {name: total / count / 1e6 for name, total in totals.items()}
+
+    def get_stats(self) -> dict:
+        """Get frame time percentiles and per-phase means."""
+        frame_times = self.get_frame_times()
+        p50, p99 = np.percentile(frame_times, (50, 99)).tolist() if len(frame_times) else (0.0, 0.0)
+        return {
+            'frames': len(frame_times),
+            'p50_ms': p50,
+            'p99_ms': p99,
+            'phases_ms': self.get_phase_times(),
+        }
+
+    def print_stats(self):
+        """Print frame time percentiles and the slowest phases."""
+        stats = self.get_stats()
+        print(f"Profiler: {stats['frames']} frames, p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+        for name, ms in sorted(stats['phases_ms'].items(), key=lambda item: -item[1]):
+            print(f"  {name:24s} {ms:7.3f} ms/frame")
+
+    # ==================== Trace export ====================
+
+    def to_trace(self) -> dict:
+        """Get the recorded frames in Chrome trace event format."""
+        events = []
+        for start, duration, phases in self._frames:
+            events.append({'name': 'frame', 'cat': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1,
+                           'ts': start / 1000, 'dur': duration / 1000})
+            for name, phase_start, phase_duration, depth in phases:
+                events.append({'name': name, 'cat': 'phase', 'ph': 'X', 'pid': 1, 'tid': 1,
+                               'ts': phase_start / 1000, 'dur': phase_duration / 1000,
+                               'args': {'depth': depth + 1}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save_trace(self, path: str = None) -> str:
+        """
+        Write the last history_seconds of frames as a Chrome trace JSON file.
+
+        Args:
+            path: Output file (default: trace_<timestamp>.json in trace_dir)
+
+        Returns:
+            The path written
+        """
+        if path is None:
+            path = os.path.join(self.trace_dir, f"trace_{datetime.now():%Y%m%d_%H%M%S}.json")
+        atomic_write_json(path, self.to_trace(), indent=None)
+        print(f"✓ Saved {len(self._frames)} frames of profile trace to {path}")
+        return path
+
+    # ==================== Overlay ====================
+
+    def render(self, screen):
+        """Draw the frame-time graph and slowest phases while enabled."""
+        if not self.enabled or not self._frames:
+            return
+        now = pygame.time.get_ticks()
+        if self._overlay is None or now - self._overlay_time >= self.OVERLAY_REFRESH_MS:
+            self._overlay = self._render_overlay()
+            self._overlay_time = now
+        screen.blit(self._overlay, self.GRAPH_POSITION)
+
+    def _render_overlay(self) -> pygame.Surface:
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        width, height = self.GRAPH_SIZE
+        frame_times = self.get_frame_times()
+        p50, p99 = np.percentile(frame_times, (50, 99)).tolist()
+        recent = frame_times[-self.GRAPH_FRAMES:]
+        worst = float(recent.max())
+        scale_ms = max(worst, p99, 1000 / 60) * 1.1
+
+        panel = pygame.Surface((width, height + 20 + 16 * self.PHASES_SHOWN), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        bar_width = width / self.GRAPH_FRAMES
+        for i, ms in enumerate(recent.tolist()):
+            bar_height = min(ms / scale_ms, 1.0) * height
+            color = (90, 200, 120) if ms <= p99 else (230, 90, 80)
+            pygame.draw.rect(panel, color, (i * bar_width, height - bar_height, max(bar_width, 1), bar_height))
+        for ms, color in ((p50, (240, 240, 240)), (p99, (250, 200, 60))):
+            line_y = height - min(ms / scale_ms, 1.0) * height
+            pygame.draw.line(panel, color, (0, line_y), (width, line_y))
+
+        label = self._font.render(f"p50 {p50:.2f} ms   p99 {p99:.2f} ms   max {worst:.2f} ms",
+                                  True, (255, 255, 255))
+        panel.blit(label, (4, height + 4))
+        phases = sorted(self.get_phase_times(self.GRAPH_FRAMES).items(), key=lambda item: -item[1])
+        for i, (name, ms) in enumerate(phases[:self.PHASES_SHOWN]):
+            text = self._font.render(f"{name}: {ms:.3f} ms", True, (210, 210, 210))
+            panel.blit(text, (4, height + 20 + 16 * i))
+        return panel
+
+
+# Shared profiler instrumented throughout the game
+profiler = FrameProfiler()
@@ -2,6 +2,8 @@ import pygame
 import os
 from config import get_path, resource_path
 import random
+from engine.asset_bundle import asset_bundle
+from engine.lazy_assets import LazyAsset, get_load_stats, prefetch_assets
 
 class SoundManager:
     def __init__(self, sound_dir="assets/sounds"):
@@ -11,7 +13,7 @@ class SoundManager:
         self.load_sounds()
         
     def load_sounds(self):
-        # Load all game sounds
+        # Register all game sounds; each is decoded on first play, or ahead of time by prefetch()
         sound_files = {
             'pop1': "POPSFX.mp3",
             'pop2': "POP2.mp3",
@@ -34,13 +36,22 @@ class SoundManager:
             # Prepend the directory path
             full_path = resource_path(get_path(os.path.join(self.sound_dir, filename)))
             if os.path.exists(full_path):
-                self.sounds[name] = pygame.mixer.Sound(full_path)
+                source = f"{self.sound_dir}/{filename}"
+                self.sounds[name] = LazyAsset(name, lambda source=source: asset_bundle.load_sound(source))
             else:
                 print(f"Warning: Sound file not found at {full_path}")
             
     def play(self, sound_name):
         if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+            self.sounds[sound_name].get().play()
+
+    def prefetch(self):
+        """Decode every sound on a background thread, so the first play doesn't stall a frame."""
+        return prefetch_assets(self.sounds.values(), thread_name="prefetch-sounds")
+
+    def get_load_stats(self):
+        """Get whether and how fast each sound was decoded."""
+        return get_load_stats(self.sounds)
             
     def schedule_sound(self, sound_name, delay=1000):
         """Schedule a sound to be played after a delay"""
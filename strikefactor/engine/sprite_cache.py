@@ -0,0 +1,96 @@
+"""
+Sprite Cache - Pre-scaled ball animation frames.
+
+The ball is drawn at a size that depends on its distance, but the scaled
+sprite only ever takes a handful of integer pixel sizes. Each (frame, width,
+height) is scaled once and kept in an LRU cache, so drawing the ball is a
+dictionary lookup plus a blit and looks exactly like scaling every frame.
+"""
+
+from collections import OrderedDict
+import pygame
+from config import BALL_MIN_SIZE, BALL_MAX_SIZE, MAX_DISTANCE
+
+# Source ball sprites are 64x66; a ball of size 54 is drawn at full resolution
+BALL_SPRITE_SIZE = (64, 66)
+BALL_REFERENCE_SIZE = 54
+# Offset from the top-left of a full resolution sprite to the ball's center
+BALL_CENTER_OFFSET = (29.22, 32.62)
+
+
+def ball_size_at(z: float, max_distance: float = MAX_DISTANCE,
+                 min_size: float = BALL_MIN_SIZE, max_size: float = BALL_MAX_SIZE) -> float:
+    """Apparent ball size at a given z-distance."""
+    return min_size + (max_size - min_size) * (1 - z / max_distance)
+
+
+def ball_scale(size: float, reference_size: float = BALL_REFERENCE_SIZE):
+    """Get (ratio, width, height) of the scaled sprite for a ball size."""
+    ratio = size / reference_size
+    return ratio, int(ratio * BALL_SPRITE_SIZE[0]), int(ratio * BALL_SPRITE_SIZE[1])
+
+
+class BallSpriteCache:
+    """LRU cache of ball animation frames scaled to integer pixel sizes."""
+
+    def __init__(self, frames: list, max_entries: int = 4096):
+        """
+        Args:
+            frames: Full resolution ball animation frames
+            max_entries: Scaled sprites to keep before evicting the least recently used
+        """
+        self.frames = frames
+        self.max_entries = max_entries
+        self._sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, frame_index: int, width: int, height: int) -> pygame.Surface:
+        """Get a frame scaled to width x height, scaling it on first use."""
+        key = (frame_index, width, height)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = self._sprites[key] = pygame.transform.scale(self.frames[frame_index], (width, height))
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+            self.evictions += 1
+        return sprite
+
+    def prewarm(self, min_size: float = BALL_MIN_SIZE, max_size: float = BALL_MAX_SIZE,
+                reference_size: float = BALL_REFERENCE_SIZE, steps: int = 1000):
+        """Scale every frame to every pixel size a ball between min_size and max_size can take."""
+        sizes = set()
+        for step in range(steps + 1):
+            _, width, height = ball_scale(min_size + (max_size - min_size) * step / steps, reference_size)
+            sizes.add((width, height))
+        for width, height in sorted(sizes):
+            for frame_index in range(len(self.frames)):
+                self.get(frame_index, width, height)
+        # Warming up is not a real miss
+        self.hits = self.misses = 0
+
+    def get_stats(self) -> dict:
+        """Get hit rate and memory use of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._sprites),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'memory_bytes': sum(sprite.get_width() * sprite.get_height() * sprite.get_bytesize()
+                                for sprite in self._sprites.values()),
+        }
+
+    def print_stats(self):
+        """Print a hit rate and memory report."""
+        stats = self.get_stats()
+        print(f"Ball sprite cache: {stats['entries']} sprites, {stats['memory_bytes'] / 1024:.1f} KiB, "
+              f"hit rate {stats['hit_rate']:.1%} ({stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['evictions']} evictions)")
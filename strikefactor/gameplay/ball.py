@@ -2,12 +2,14 @@ import pygame
 import math
 import os
 from config import get_path, resource_path
+from engine.sprite_cache import BallSpriteCache, BALL_CENTER_OFFSET, ball_scale, ball_size_at
 
 class Ball:
     def __init__(self, screen):
         self.screen = screen
         self.position = [0, 0, 4600]  # x, y, z (distance)
         self.ball_frames = self.load_ball_frames()
+        self.sprite_cache = BallSpriteCache(self.ball_frames)
         self.frame_counter = 0
         self.max_distance = 4600
         self.min_size = 3
@@ -34,12 +36,10 @@ class Ball:
         return vx, vy
         
     def draw(self):
-        dist = self.position[2] / self.max_distance
-        size = self.min_size + (self.max_size - self.min_size) * (1 - dist)
-        ratio = size / 54
+        size = ball_size_at(self.position[2], self.max_distance, self.min_size, self.max_size)
+        ratio, width, height = ball_scale(size)
         
-        image = pygame.transform.scale(self.ball_frames[self.frame_counter], 
-                                      (int(ratio * 64), int(ratio * 66)))
-        self.screen.blit(image, (self.position[0] - (29.22 * ratio), 
-                                self.position[1] - (32.62 * ratio)))
+        image = self.sprite_cache.get(self.frame_counter, width, height)
+        self.screen.blit(image, (self.position[0] - (BALL_CENTER_OFFSET[0] * ratio), 
+                                self.position[1] - (BALL_CENTER_OFFSET[1] * ratio)))
         self.frame_counter = (self.frame_counter + 1) % len(self.ball_frames)
\ No newline at end of file
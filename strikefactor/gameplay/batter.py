@@ -1,25 +1,61 @@
-import pygame
-from config import get_path, resource_path
+from engine.asset_bundle import asset_bundle
+from engine.animation import load_animations
+from engine.lazy_assets import LazyAsset, get_load_stats, prefetch_assets
 
 class Batter:
+    # Sprite path and frame count of each animation set, by handedness
+    ANIMATION_SETS = {
+        'R': {
+            'batter': ('assets/images/batter_right_swing/TROUT', 15),
+            'batterhigh': ('assets/images/batter_right_high_swing/HIGHSWING', 7),
+        },
+        'L': {
+            'batterleft': ('assets/images/batter_left_swing/TROUTLEFT', 15),
+            'batterlefthigh': ('assets/images/batter_left_high_swing/HIGHSWINGLEFT', 7),
+        },
+    }
+    # Keyframes of the leg kick and swings, per handedness
+    ANIMATIONS = load_animations('gameplay/animations/batter.json')
+
     def __init__(self, screen):
         self.screen = screen
         self.handedness = 'R'
         self.x = 330
         self.y = 190
-        self.batter = self.loadimg('assets/images/batter_right_swing/TROUT', 15)
-        self.batterhigh = self.loadimg('assets/images/batter_right_high_swing/HIGHSWING', 7)
-        self.batterleft = self.loadimg('assets/images/batter_left_swing/TROUTLEFT', 15)
-        self.batterlefthigh = self.loadimg('assets/images/batter_left_high_swing/HIGHSWINGLEFT', 7)
+        # Each set is decoded the first time it is drawn, or ahead of time by prefetch()
+        self.animation_sets = {
+            set_name: LazyAsset(set_name, lambda path=path, number=number: self.loadimg(path, number))
+            for sets in self.ANIMATION_SETS.values()
+            for set_name, (path, number) in sets.items()
+        }
+
+    @property
+    def batter(self):
+        return self.animation_sets['batter'].get()
+
+    @property
+    def batterhigh(self):
+        return self.animation_sets['batterhigh'].get()
+
+    @property
+    def batterleft(self):
+        return self.animation_sets['batterleft'].get()
+
+    @property
+    def batterlefthigh(self):
+        return self.animation_sets['batterlefthigh'].get()
 
     def loadimg(self, name, number):
-        name = get_path(name)
-        counter = 1
-        storage = []
-        while counter <= number:
-            storage.append(pygame.image.load(resource_path(f'{name}{counter}.png')).convert_alpha())
-            counter += 1
-        return storage
+        return asset_bundle.load_images([f'{name}{counter}.png' for counter in range(1, number + 1)])
+
+    def prefetch(self, hand=None):
+        """Decode the animation sets for a hand (default: the current one) on a background thread."""
+        sets = self.ANIMATION_SETS[hand or self.handedness]
+        return prefetch_assets([self.animation_sets[name] for name in sets], thread_name="prefetch-batter")
+
+    def get_load_stats(self):
+        """Get whether and how fast each animation set was decoded."""
+        return get_load_stats(self.animation_sets)
         
     def set_handedness(self, hand):
         self.handedness = hand
@@ -35,6 +71,7 @@ class Batter:
         else:
             self.handedness = 'R'
             self.x = 330
+        self.prefetch()
         
     def draw_stance(self, number=1, xoffset=0, yoffset=0):
         if self.handedness == 'R':
@@ -48,61 +85,23 @@ class Batter:
         else:
             self.screen.blit(self.batterlefthigh[number - 1], (self.x + xoffset, self.y + yoffset))
             
+    def draw_animation(self, name, elapsed):
+        """Draw the pose of one of the batter's animations, elapsed milliseconds after it started."""
+        sequence = self.ANIMATIONS[name]
+        frame, xoffset, yoffset = sequence[self.handedness].pose_at(elapsed)
+        if sequence['sprites'] == 'high':
+            self.draw_high_swing(frame, xoffset, yoffset)
+        else:
+            self.draw_stance(frame, xoffset, yoffset)
+
     # Default stance if no swing
     def leg_kick(self, currenttime, start_time):
-        if currenttime <= start_time + 50:
-            self.draw_stance(1, 0, 0)
-        elif currenttime > start_time + 50 and currenttime <= start_time + 200:
-            self.draw_stance(2, 11 if self.handedness == 'R' else 10, -5)
-        elif currenttime > start_time + 200 and currenttime <= start_time + 300:
-            self.draw_stance(3, 7 if self.handedness == 'R' else 8, -10)
-        elif currenttime > start_time + 300 and currenttime <= start_time + 475:
-            self.draw_stance(4, -21 if self.handedness == 'R' else -7, 11)
-        elif currenttime > start_time + 475 and currenttime <= start_time + 550:
-            self.draw_stance(5, -20 if self.handedness == 'R' else 10, 21)
-        elif currenttime > start_time + 550 and currenttime <= start_time + 940:
-            self.draw_stance(6, 21 if self.handedness == 'R' else 1, 25)
-        elif currenttime > start_time + 940 and currenttime <= start_time + 1000:
-            self.draw_stance(13, 12 if self.handedness == 'R' else -12, 27)
-        elif currenttime > start_time + 1000 and currenttime <= start_time + 1100:
-            self.draw_stance(14, 8 if self.handedness == 'R' else -8, 29)
-        elif currenttime > start_time + 1100:
-            self.draw_stance(15, 6 if self.handedness == 'R' else -6, 24)
-        return
-    
+        self.draw_animation('leg_kick', currenttime - start_time)
+
     # Low swing animation
     def swing_start(self, timenow, swing_startime):
-        if timenow <= swing_startime + 110:
-            self.draw_stance(6, 21 if self.handedness == 'R' else 1, 25)
-        elif timenow > swing_startime + 110 and timenow <= swing_startime + 150:
-            self.draw_stance(7, 7 if self.handedness == 'R' else -70, 84)
-        elif timenow > swing_startime + 150 and timenow <= swing_startime + 200:
-            self.draw_stance(8, 12 if self.handedness == 'R' else -83, 84)
-        elif timenow > swing_startime + 200 and timenow <= swing_startime + 210:
-            self.draw_stance(9, 12 if self.handedness == 'R' else 18, 84)
-        elif timenow > swing_startime + 210 and timenow <= swing_startime + 225:
-            self.draw_stance(10, -150 if self.handedness == 'R' else 4, 84)
-        elif timenow > swing_startime + 225 and timenow <= swing_startime + 240:
-            self.draw_stance(11, -177 if self.handedness == 'R' else 7, -69)
-        elif timenow > swing_startime + 240:
-            self.draw_stance(12, 28 if self.handedness == 'R' else -90, 48)
-        return
-
+        self.draw_animation('swing_start', timenow - swing_startime)
 
     # High swing animation
     def high_swing_start(self, timenow, swing_startime):
-        if timenow <= swing_startime + 110:
-            self.draw_high_swing(1, 15 if self.handedness == 'R' else -15, 0)
-        elif timenow > swing_startime + 110 and timenow <= swing_startime + 150:
-            self.draw_high_swing(2, 14 if self.handedness == 'R' else -101, 70)
-        elif timenow > swing_startime + 150 and timenow <= swing_startime + 200:
-            self.draw_high_swing(3, 19 if self.handedness == 'R' else -108, 70)
-        elif timenow > swing_startime + 200 and timenow <= swing_startime + 210:
-            self.draw_high_swing(4, 14 if self.handedness == 'R' else 22, 70)
-        elif timenow > swing_startime + 210 and timenow <= swing_startime + 225:
-            self.draw_high_swing(5, -116 if self.handedness == 'R' else 17, 70)
-        elif timenow > swing_startime + 225 and timenow <= swing_startime + 240:
-            self.draw_high_swing(6, -168 if self.handedness == 'R' else -11, -1)
-        elif timenow > swing_startime + 240:
-            self.draw_high_swing(7, 31 if self.handedness == 'R' else -176, 70)
-        return
\ No newline at end of file
+        self.draw_animation('high_swing_start', timenow - swing_startime)
@@ -3,43 +3,102 @@ import pygame.gfxdraw
 import colorsys
 import json
 import os
-from datetime import datetime
+from engine.profiler import profiler
+from gameplay.pitch_store import PitchStore
 
 class FieldRenderer:
     """Renders the static components of the baseball field."""
+
+    # Home plate and base outlines in screen coordinates
+    HOMEPLATE_POINTS = [
+        (565, 660),     # Top left
+        (695, 660),     # Top right
+        (695, 670),     # Middle right
+        (630, 685),     # Bottom
+        (565, 670),     # Middle left
+    ]
+    BASE_POINTS = [
+        [(1115, 585), (1140, 610), (1115, 635), (1090, 610)],   # First base (bottom right)
+        [(1080, 550), (1105, 575), (1080, 600), (1055, 575)],   # Second base (top)
+        [(1045, 585), (1070, 610), (1045, 635), (1020, 610)],   # Third base (bottom left)
+    ]
+
+    # Heatmap segment ids with their (column, row) in the strike zone
+    HEATMAP_SEGMENTS = [
+        (0, 0, 0),      # top_left
+        (1, 1, 0),      # top_center
+        (2, 2, 0),      # top_right
+        (3, 0, 1),      # mid_left
+        (4, 1, 1),      # center
+        (5, 2, 1),      # mid_right
+        (6, 0, 2),      # bot_left
+        (7, 1, 2),      # bot_center
+        (8, 2, 2),      # bot_right
+    ]
     
-    def __init__(self, screen, strikezone_rect=(565, 410, 130, 150)):
+    # Laps kept in the lap history
+    MAX_LAP_HISTORY = 100
+
+    def __init__(self, screen, strikezone_rect=(565, 410, 130, 150), pitch_store=None, data_dir=None):
         """
         Initialize the field renderer.
         
         Args:
             screen: Pygame surface to draw on
             strikezone_rect: Rectangle defining the strike zone (x, y, width, height)
+            pitch_store: PitchStore the batting stats and laps are read from (default: one in data_dir)
+            data_dir: Directory of the pitch database and the stats files it replaced (default: data/)
         """
         self.screen = screen
+        data_dir = data_dir or os.path.join(os.path.dirname(__file__), '..', 'data')
+        self.pitch_store = pitch_store or PitchStore(os.path.join(data_dir, 'pitches.db'))
         self.strikezone = pygame.Rect(strikezone_rect)
         self.strikezonedrawn = 1  # 1: Hidden, 2: Outline only, 3: Grid, 4: Heatmap, 5: Heatmap with Averages
-        
-        # Heatmap data structure: 9 segments [top_left, top_center, top_right, mid_left, center, mid_right, bot_left, bot_center, bot_right]
-        self.heatmap_data = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-        self.heatmap_attempts = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-        
-        # Additional batting statistics
-        self.total_swings = 0
-        self.total_hits = 0
-        self.total_pitches = 0
-        self.total_at_bats = 0  # At-bats: hits + outs + strikeouts (excludes walks, fouls)
-        
-        # Data file path
-        self.data_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'batting_stats.json')
 
-        # Lap history file path
-        self.lap_history_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'lap_history.json')
-        self.lap_start_time = datetime.now()
+        # Pre-rendered layers: name -> (key the layer was rendered for, [(surface, position), ...])
+        self._layers = {}
+        self._font = None
+
+        # Batting stats and lap history from before the pitch store, imported into it once
+        self.data_file = os.path.join(data_dir, 'batting_stats.json')
+        self.lap_history_file = os.path.join(data_dir, 'lap_history.jsonl')
+        self.legacy_lap_history_file = os.path.join(data_dir, 'lap_history.json')
+        if self.pitch_store.needs_history_import:
+            self._import_legacy_history()
+
+        print(f"✓ Batting statistics loaded from {self.pitch_store.db_path}")
+        print(f"  Total pitches: {self.total_pitches}, Total at-bats: {self.total_at_bats}, Total hits: {self.total_hits}")
+
+    # ==================== Batting Statistics ====================
+    # The open lap's totals, counted by the pitch store as pitches are recorded
+
+    @property
+    def heatmap_data(self):
+        """Hits per segment: [top_left, top_center, top_right, mid_left, center, mid_right, bot_left, bot_center, bot_right]"""
+        return self.pitch_store.lap_totals['heatmap_data']
+
+    @property
+    def heatmap_attempts(self):
+        """Swings per segment, in the same order as heatmap_data."""
+        return self.pitch_store.lap_totals['heatmap_attempts']
+
+    @property
+    def total_swings(self):
+        return self.pitch_store.lap_totals['total_swings']
+
+    @property
+    def total_hits(self):
+        return self.pitch_store.lap_totals['total_hits']
+
+    @property
+    def total_pitches(self):
+        return self.pitch_store.lap_totals['total_pitches']
+
+    @property
+    def total_at_bats(self):
+        """At-bats: hits + outs + strikeouts (excludes walks, fouls)"""
+        return self.pitch_store.lap_totals['total_at_bats']
 
-        # Load existing data if available
-        self.load_data()
-        
     def set_strikezone_mode(self, mode):
         """Set the strike zone display mode (1, 2, 3, 4, or 5)."""
         if 1 <= mode <= 5:
@@ -49,54 +108,86 @@ class FieldRenderer:
         """Cycle through strike zone display modes."""
         self.strikezonedrawn = self.strikezonedrawn + 1 if self.strikezonedrawn < 5 else 1
         return self.strikezonedrawn
-    
-    def draw_strikezone(self):
-        """Draw the strike zone based on current mode."""
+
+    def invalidate_layers(self):
+        """Drop all pre-rendered layers so they are redrawn on next use."""
+        self._layers.clear()
+
+    def _get_layer(self, name, key, render):
+        """Get the blits for a layer, re-rendering it only when its key has changed."""
+        layer = self._layers.get(name)
+        if layer is None or layer[0] != key:
+            layer = self._layers[name] = (key, render())
+        return layer[1]
+
+    def _get_font(self):
+        """Font for the heatmap label and averages, created on first use."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 24)
+        return self._font
+
+    @staticmethod
+    def _render_polygons(polygons, widths, colors):
+        """Render filled or outlined polygons onto a transparent surface fitted around them."""
+        points = [point for polygon in polygons for point in polygon]
+        left = min(x for x, _ in points)
+        top = min(y for _, y in points)
+        surface = pygame.Surface((max(x for x, _ in points) - left + 1,
+                                  max(y for _, y in points) - top + 1), pygame.SRCALPHA)
+        for polygon, width, color in zip(polygons, widths, colors):
+            pygame.draw.polygon(surface, color, [(x - left, y - top) for x, y in polygon], width)
+        return surface, (left, top)
+
+    def _render_strikezone(self):
+        """Render the strike zone for the current mode as a list of blits."""
         if self.strikezonedrawn == 1:
             # Hidden, don't draw
-            return
-            
+            return []
+
+        # One spare pixel on the right and bottom for the grid line end points
+        x, y, width, height = self.strikezone
+        surface = pygame.Surface((width + 1, height + 1), pygame.SRCALPHA)
+        zone = pygame.Rect(0, 0, width, height)
+        blits = [(surface, (x, y))]
+
+        if self.strikezonedrawn in (4, 5):
+            show_averages = self.strikezonedrawn == 5
+            self._draw_heatmap(surface, zone, show_averages)
+
+            # Add a visual indicator that the heatmap is active, drawn straight onto the screen
+            label = "HEATMAP + AVERAGES" if show_averages else "HEATMAP ON"
+            blits.append((self._get_font().render(label, True, (255, 255, 255)), (x, y - 30)))
+            return blits
+
         # Draw strike zone outline
-        pygame.draw.rect(self.screen, "white", self.strikezone, 1)
-        
+        pygame.draw.rect(surface, "white", zone, 1)
+
         # Draw strike zone grid lines
         if self.strikezonedrawn == 3:
-            x, y, width, height = self.strikezone
-            
             # Horizontal dividing lines (divide into thirds)
-            pygame.draw.line(self.screen, "white", 
-                            (x, y + (height/3)), 
-                            (x + width, y + (height/3)))
-            pygame.draw.line(self.screen, "white", 
-                            (x, y + 2*(height/3)), 
-                            (x + width, y + 2*(height/3)))
-            
+            pygame.draw.line(surface, "white", (0, height/3), (width, height/3))
+            pygame.draw.line(surface, "white", (0, 2*(height/3)), (width, 2*(height/3)))
+
             # Vertical dividing lines (divide into thirds)
-            pygame.draw.line(self.screen, "white", 
-                            (x + (width/3), y), 
-                            (x + (width/3), y + height))
-            pygame.draw.line(self.screen, "white", 
-                            (x + 2*(width/3), y), 
-                            (x + 2*(width/3), y + height))
-            
-        # Draw heatmap
-        elif self.strikezonedrawn == 4:
-            self._draw_heatmap()
-        
-        # Draw heatmap with batting averages
-        elif self.strikezonedrawn == 5:
-            self._draw_heatmap_with_averages()
+            pygame.draw.line(surface, "white", (width/3, 0), (width/3, height))
+            pygame.draw.line(surface, "white", (2*(width/3), 0), (2*(width/3), height))
+
+        return blits
+    
+    def draw_strikezone(self):
+        """Draw the strike zone based on current mode."""
+        if self.strikezonedrawn in (4, 5):
+            # Heatmaps change with the hit and attempt counters
+            key = (self.strikezonedrawn, tuple(self.heatmap_data), tuple(self.heatmap_attempts))
+        else:
+            key = self.strikezonedrawn
+        self.screen.blits(self._get_layer('strikezone', key, self._render_strikezone), doreturn=False)
     
     def draw_homeplate(self):
         """Draw the home plate."""
-        x, y = 565, 660
-        pygame.draw.polygon(self.screen, "white", [
-            (x, y),                  # Top left
-            (x + 130, y),            # Top right
-            (x + 130, y + 10),       # Middle right
-            (x + 65, y + 25),        # Bottom
-            (x, y + 10)              # Middle left
-        ], 0)
+        blits = self._get_layer('homeplate', None,
+                                lambda: [self._render_polygons([self.HOMEPLATE_POINTS], [0], ["white"])])
+        self.screen.blits(blits, doreturn=False)
     
     def draw_bases(self, bases_status):
         """
@@ -105,20 +196,11 @@ class FieldRenderer:
         Args:
             bases_status: List of colors for the bases ['white'/'yellow', ...]
         """
-        # Draw first base (bottom right)
-        pygame.draw.polygon(self.screen, bases_status[0], [
-            (1115, 585), (1140, 610), (1115, 635), (1090, 610)
-        ], 0 if bases_status[0] == 'yellow' else 1)
-        
-        # Draw second base (top)
-        pygame.draw.polygon(self.screen, bases_status[1], [
-            (1080, 550), (1105, 575), (1080, 600), (1055, 575)
-        ], 0 if bases_status[1] == 'yellow' else 1)
-        
-        # Draw third base (bottom left)
-        pygame.draw.polygon(self.screen, bases_status[2], [
-            (1045, 585), (1070, 610), (1045, 635), (1020, 610)
-        ], 0 if bases_status[2] == 'yellow' else 1)
+        key = tuple(bases_status[:3])
+        # Occupied bases are filled, empty ones outlined
+        blits = self._get_layer('bases', key, lambda: [self._render_polygons(
+            self.BASE_POINTS, [0 if status == 'yellow' else 1 for status in key], key)])
+        self.screen.blits(blits, doreturn=False)
     
     def draw_field(self, bases_status):
         """
@@ -127,9 +209,12 @@ class FieldRenderer:
         Args:
             bases_status: List of colors for the bases ['white'/'yellow', ...]
         """
-        self.draw_strikezone()
-        self.draw_homeplate()
-        self.draw_bases(bases_status)
+        with profiler.section("field_renderer.draw_strikezone"):
+            self.draw_strikezone()
+        with profiler.section("field_renderer.draw_homeplate"):
+            self.draw_homeplate()
+        with profiler.section("field_renderer.draw_bases"):
+            self.draw_bases(bases_status)
     
     def get_zone_segment(self, x, y):
         """
@@ -172,47 +257,6 @@ class FieldRenderer:
             else:
                 return 8  # bot_right
     
-    def record_hit(self, x, y):
-        """Record a hit at the given position."""
-        segment = self.get_zone_segment(x, y)
-        # print(f"Recording HIT at ({x:.1f}, {y:.1f}) -> segment {segment}")
-        if 0 <= segment <= 8:
-            self.heatmap_data[segment] += 1
-            self.total_hits += 1
-            # print(f"✓ Hit recorded! Segment {segment} now has {self.heatmap_data[segment]} hits / {self.heatmap_attempts[segment]} attempts")
-            
-            # Auto-save data after each hit
-            self.save_data()
-    
-    def record_attempt(self, x, y):
-        """Record an attempt (swing) at the given position."""
-        segment = self.get_zone_segment(x, y)
-        # print(f"Recording ATTEMPT at ({x:.1f}, {y:.1f}) -> segment {segment}")
-        if 0 <= segment <= 8:
-            self.heatmap_attempts[segment] += 1
-            self.total_swings += 1
-            # print(f"✓ Attempt recorded! Segment {segment} now has {self.heatmap_attempts[segment]} attempts")
-    
-    def record_pitch(self):
-        """Record that a pitch was thrown (for tracking total pitches)."""
-        self.total_pitches += 1
-
-    def record_at_bat(self):
-        """
-        Record an official at-bat.
-
-        In real baseball, at-bats include plate appearances that result in:
-        - Hits (singles, doubles, triples, home runs)
-        - Outs (flyouts, groundouts, lineouts, strikeouts)
-
-        At-bats EXCLUDE:
-        - Walks (base on balls)
-        - Hit by pitch
-        - Sacrifice flies/bunts
-        - Catcher's interference
-        """
-        self.total_at_bats += 1
-
     def get_hit_rate(self, segment):
         """Get the hit rate for a segment (hits/attempts)."""
         if self.heatmap_attempts[segment] == 0:
@@ -255,75 +299,18 @@ class FieldRenderer:
         rgb = colorsys.hsv_to_rgb(hue, saturation, value)
         return (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
     
-    def _draw_heatmap(self):
-        """Draw the batting heatmap."""
-        x, y, width, height = self.strikezone
-        
-        # Calculate segment dimensions
-        segment_width = width // 3
-        segment_height = height // 3
-        
-        # Draw each segment with its color
-        segments = [
-            (0, 0, 0),      # top_left
-            (1, 1, 0),      # top_center  
-            (2, 2, 0),      # top_right
-            (3, 0, 1),      # mid_left
-            (4, 1, 1),      # center
-            (5, 2, 1),      # mid_right
-            (6, 0, 2),      # bot_left
-            (7, 1, 2),      # bot_center
-            (8, 2, 2),      # bot_right
-        ]
-        
-        for segment_id, col, row in segments:
-            hit_rate = self.get_hit_rate(segment_id)
-            color = self._get_heatmap_color(hit_rate)
-            
-            # Calculate segment rectangle
-            seg_x = x + col * segment_width
-            seg_y = y + row * segment_height
-            
-            # Fill the segment with the heatmap color
-            segment_rect = pygame.Rect(seg_x, seg_y, segment_width, segment_height)
-            pygame.draw.rect(self.screen, color, segment_rect)
-            
-            # Draw segment border
-            pygame.draw.rect(self.screen, "white", segment_rect, 1)
-            
-        # Draw the overall strikezone border
-        pygame.draw.rect(self.screen, "white", self.strikezone, 2)
-        
-        # Add a visual indicator that heatmap is active
-        font = pygame.font.Font(None, 24)
-        text = font.render("HEATMAP ON", True, (255, 255, 255))
-        self.screen.blit(text, (self.strikezone.x, self.strikezone.y - 30))
-    
-    def _draw_heatmap_with_averages(self):
-        """Draw the batting heatmap with numerical averages displayed."""
-        x, y, width, height = self.strikezone
+    def _draw_heatmap(self, surface, zone, show_averages=False):
+        """Draw the batting heatmap, optionally with batting averages, into zone on surface."""
+        x, y, width, height = zone
         
         # Calculate segment dimensions
         segment_width = width // 3
         segment_height = height // 3
         
-        # Draw each segment with its color and batting average text
-        segments = [
-            (0, 0, 0),      # top_left
-            (1, 1, 0),      # top_center  
-            (2, 2, 0),      # top_right
-            (3, 0, 1),      # mid_left
-            (4, 1, 1),      # center
-            (5, 2, 1),      # mid_right
-            (6, 0, 2),      # bot_left
-            (7, 1, 2),      # bot_center
-            (8, 2, 2),      # bot_right
-        ]
-        
         # Font for displaying averages
-        font = pygame.font.Font(None, 24)
+        font = self._get_font()
         
-        for segment_id, col, row in segments:
+        for segment_id, col, row in self.HEATMAP_SEGMENTS:
             hit_rate = self.get_hit_rate(segment_id)
             color = self._get_heatmap_color(hit_rate)
             
@@ -333,10 +320,13 @@ class FieldRenderer:
             
             # Fill the segment with the heatmap color
             segment_rect = pygame.Rect(seg_x, seg_y, segment_width, segment_height)
-            pygame.draw.rect(self.screen, color, segment_rect)
+            pygame.draw.rect(surface, color, segment_rect)
             
             # Draw segment border
-            pygame.draw.rect(self.screen, "white", segment_rect, 1)
+            pygame.draw.rect(surface, "white", segment_rect, 1)
+
+            if not show_averages:
+                continue
             
             # Display batting average text in the center of each segment
             if self.heatmap_attempts[segment_id] > 0:
@@ -364,98 +354,46 @@ class FieldRenderer:
             bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
             bg_surface.set_alpha(128)  # 50% transparency
             bg_surface.fill((0, 0, 0))  # Black background
-            self.screen.blit(bg_surface, bg_rect)
+            surface.blit(bg_surface, bg_rect)
             
             # Draw the text
-            self.screen.blit(text_surface, (text_x, text_y))
+            surface.blit(text_surface, (text_x, text_y))
             
         # Draw the overall strikezone border
-        pygame.draw.rect(self.screen, "white", self.strikezone, 2)
-        
-        # Add a visual indicator that heatmap with averages is active
-        font = pygame.font.Font(None, 24)
-        text = font.render("HEATMAP + AVERAGES", True, (255, 255, 255))
-        self.screen.blit(text, (self.strikezone.x, self.strikezone.y - 30))
-    
-    def reset_heatmap_data(self):
-        """Reset all heatmap data and batting statistics."""
-        self.heatmap_data = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-        self.heatmap_attempts = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-        self.total_swings = 0
-        self.total_hits = 0
-        self.total_pitches = 0
-        self.total_at_bats = 0
-
-        # Save the reset state
-        self.save_data()
-        print("✓ All batting statistics have been reset")
+        pygame.draw.rect(surface, "white", zone, 2)
     
     def add_test_heatmap_data(self):
         """Add test data for heatmap visualization."""
         # Add realistic batting average test data (hits per segment)
         # These should show varying performance levels across the zone
-        self.heatmap_data = [2, 8, 1, 6, 12, 3, 1, 4, 2]      # hits per segment  
-        self.heatmap_attempts = [20, 25, 18, 30, 35, 28, 15, 22, 17]  # attempts per segment
+        self.heatmap_data[:] = [2, 8, 1, 6, 12, 3, 1, 4, 2]      # hits per segment  
+        self.heatmap_attempts[:] = [20, 25, 18, 30, 35, 28, 15, 22, 17]  # attempts per segment
         # This gives batting averages of: [0.10, 0.32, 0.06, 0.20, 0.34, 0.11, 0.07, 0.18, 0.12]
         # Should show: blue, red, blue, white, red, blue, blue, blue/white, blue
-        
-    def save_data(self):
-        """Save heatmap and batting statistics to file."""
-        try:
-            # Ensure data directory exists
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-            
-            data = {
-                'heatmap_data': self.heatmap_data,
-                'heatmap_attempts': self.heatmap_attempts,
-                'total_swings': self.total_swings,
-                'total_hits': self.total_hits,
-                'total_pitches': self.total_pitches,
-                'total_at_bats': self.total_at_bats,
-                'last_updated': datetime.now().isoformat(),
-                'version': '1.1'
-            }
-            
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
-            # print(f"✓ Batting statistics saved to {self.data_file}")
-            
-        except Exception as e:
-            print(f"✗ Error saving batting statistics: {e}")
-            
-    def load_data(self):
-        """Load heatmap and batting statistics from file."""
+
+    def _import_legacy_history(self):
+        """Import batting_stats.json and the lap history into the pitch store; the files are left as they are."""
+        current = None
+        laps = []
         try:
             if os.path.exists(self.data_file):
                 with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Load heatmap data
-                self.heatmap_data = data.get('heatmap_data', [0] * 9)
-                self.heatmap_attempts = data.get('heatmap_attempts', [0] * 9)
-                
-                # Load batting statistics
-                self.total_swings = data.get('total_swings', 0)
-                self.total_hits = data.get('total_hits', 0)
-                self.total_pitches = data.get('total_pitches', 0)
-                self.total_at_bats = data.get('total_at_bats', 0)
-
-                print(f"✓ Batting statistics loaded from {self.data_file}")
-                print(f"  Total pitches: {self.total_pitches}, Total at-bats: {self.total_at_bats}, Total hits: {self.total_hits}")
-
-                # Display overall batting average if we have data (BA = H / AB)
-                if self.total_at_bats > 0:
-                    overall_avg = self.total_hits / self.total_at_bats
-                    print(f"  Overall batting average: {overall_avg:.3f}")
-                    
-            else:
-                print("No saved batting statistics found. Starting fresh.")
-                
-        except Exception as e:
-            print(f"✗ Error loading batting statistics: {e}")
+                    current = json.load(f)
+            if os.path.exists(self.lap_history_file):
+                with open(self.lap_history_file, 'r') as f:
+                    laps = [json.loads(line) for line in f if line.strip()]
+            elif os.path.exists(self.legacy_lap_history_file):
+                with open(self.legacy_lap_history_file, 'r') as f:
+                    laps = json.load(f).get('laps', [])
+        except (OSError, ValueError) as e:
+            print(f"✗ Error loading saved batting statistics: {e}")
             print("Starting with fresh data.")
-            
+            current, laps = None, []
+
+        self.pitch_store.import_history(laps, current)
+        if current is not None or laps:
+            print(f"✓ Imported batting statistics and {len(laps)} laps into {self.pitch_store.db_path}")
+
     def get_overall_batting_average(self):
         """
         Get overall batting average across all zones.
@@ -511,119 +449,28 @@ class FieldRenderer:
     def create_lap(self) -> dict:
         """
         Create a new lap entry from current session stats.
-        Stores the current stats in lap history and resets current stats.
+        Records the current stats in the lap history and starts the next lap from zero.
 
         Returns:
             dict: The created lap entry data
         """
-        # Calculate batting average before creating lap
-        batting_avg = self.get_overall_batting_average()
-
-        # Calculate duration since last lap (or session start)
-        lap_end_time = datetime.now()
-        duration = (lap_end_time - self.lap_start_time).total_seconds()
+        lap_entry = self.pitch_store.close_lap()
 
-        # Load existing lap history
-        lap_history = self.load_lap_history()
-
-        # Determine lap number
-        lap_number = len(lap_history.get('laps', [])) + 1
-
-        # Create lap entry
-        lap_entry = {
-            'lap_number': lap_number,
-            'timestamp': lap_end_time.isoformat(),
-            'heatmap_data': self.heatmap_data.copy(),
-            'heatmap_attempts': self.heatmap_attempts.copy(),
-            'total_swings': self.total_swings,
-            'total_hits': self.total_hits,
-            'total_pitches': self.total_pitches,
-            'total_at_bats': self.total_at_bats,
-            'batting_average': round(batting_avg, 3),
-            'duration_seconds': duration
-        }
-
-        # Add to history
-        if 'laps' not in lap_history:
-            lap_history['laps'] = []
-            lap_history['version'] = '1.0'
-            lap_history['created_date'] = lap_end_time.isoformat()
-
-        lap_history['laps'].append(lap_entry)
-        lap_history['last_updated'] = lap_end_time.isoformat()
-
-        # Enforce max history limit (100 laps)
-        MAX_LAP_HISTORY = 100
-        if len(lap_history['laps']) > MAX_LAP_HISTORY:
-            lap_history['laps'] = lap_history['laps'][-MAX_LAP_HISTORY:]
-
-        # Save lap history
-        self.save_lap_history(lap_history)
-
-        # Reset current stats (using existing method)
-        self.reset_heatmap_data()
-
-        # Reset lap timer
-        self.lap_start_time = datetime.now()
-
-        print(f"✓ Lap {lap_number} created: BA {batting_avg:.3f}, {self.total_hits} hits in {self.total_at_bats} ABs")
+        print(f"✓ Lap {lap_entry['lap_number']} created: BA {lap_entry['batting_average']:.3f}, "
+              f"{lap_entry['total_hits']} hits in {lap_entry['total_at_bats']} ABs")
 
         return lap_entry
 
-    def load_lap_history(self) -> dict:
-        """
-        Load lap history from file.
-
-        Returns:
-            dict: Lap history data or empty structure if file doesn't exist
-        """
-        try:
-            if os.path.exists(self.lap_history_file):
-                with open(self.lap_history_file, 'r') as f:
-                    return json.load(f)
-            else:
-                return {
-                    'version': '1.0',
-                    'created_date': datetime.now().isoformat(),
-                    'last_updated': datetime.now().isoformat(),
-                    'laps': []
-                }
-        except Exception as e:
-            print(f"✗ Error loading lap history: {e}")
-            return {'version': '1.0', 'laps': []}
-
-    def save_lap_history(self, lap_history: dict):
-        """
-        Save lap history to file.
-
-        Args:
-            lap_history: The lap history data to save
-        """
-        try:
-            os.makedirs(os.path.dirname(self.lap_history_file), exist_ok=True)
-            with open(self.lap_history_file, 'w') as f:
-                json.dump(lap_history, f, indent=2)
-            print(f"✓ Lap history saved to {self.lap_history_file}")
-        except Exception as e:
-            print(f"✗ Error saving lap history: {e}")
-
     def get_lap_history(self) -> list:
         """
-        Get all lap entries.
+        Get the last MAX_LAP_HISTORY lap entries.
 
         Returns:
-            list: List of lap entry dictionaries
+            list: List of lap entry dictionaries, oldest first
         """
-        history = self.load_lap_history()
-        return history.get('laps', [])
+        return self.pitch_store.lap_summaries(self.MAX_LAP_HISTORY)
 
     def clear_lap_history(self):
         """Clear all lap history."""
-        empty_history = {
-            'version': '1.0',
-            'created_date': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat(),
-            'laps': []
-        }
-        self.save_lap_history(empty_history)
-        print("✓ Lap history cleared")
\ No newline at end of file
+        self.pitch_store.clear_laps()
+        print("✓ Lap history cleared")
@@ -10,6 +10,7 @@ import sys
 from abc import ABC, abstractmethod
 from typing import Optional
 from gameplay.gameday_manager import GameDayManager
+from gameplay.pitch_prefetch import PitchPrefetcher
 
 
 class GameState(ABC):
@@ -140,7 +141,7 @@ class MenuState(GameState):
         """Initialize menu state."""
         self.game.ui_manager.hide_banner()
         self.game.scoreKeeper.reset()
-        self.game.pitch_trajectories = []
+        self.game.trajectory_store.clear()
         self.game.last_pitch_information = []
 
         # Set button visibility based on current menu state
@@ -237,6 +238,9 @@ class GameplayState(GameState):
     def __init__(self, game):
         super().__init__(game)
         self.pitch_simulation = None # Is in simulation state?
+        # The next pitch is chosen and solved on idle frames, before the pitch key is pressed
+        self.pitch_prefetcher = PitchPrefetcher(
+            game, lambda: self.game.current_pitcher.ai.choose_action(self.game.current_state))
         
     def enter(self):
         """Initialize gameplay state."""
@@ -246,6 +250,7 @@ class GameplayState(GameState):
     def exit(self):
         """Clean up gameplay state."""
         self.pitch_simulation = None
+        self.pitch_prefetcher.invalidate()
         
     def _refresh_display(self):
         """Refresh the game display with current stats."""
@@ -270,52 +275,58 @@ class GameplayState(GameState):
     def update(self, time_delta: float):
         """Update gameplay logic."""
         if self.pitch_simulation and self.pitch_simulation.running:
-            self.pitch_simulation.update()
+            self.pitch_simulation.update(time_delta)
 
         if self.pitch_simulation and not self.pitch_simulation.running:
             self.pitch_simulation = None
             self.game.ui_manager.set_button_visibility('in_game')
+
+        if self.pitch_simulation is None:
+            self.pitch_prefetcher.prepare()
                 
     def handle_event(self, event):
         """Handle gameplay events."""
         if event.type == pygame.QUIT:
             return False
             
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_q and not self.pitch_simulation:
-                self._initiate_pitch()
+        if self.pitch_simulation:
+            self.pitch_simulation.handle_event(event)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_q:
+            self._initiate_pitch()
                 
         self.game.ui_manager.process_events(event)
         return True
         
     def _initiate_pitch(self):
-        """Start a new pitch simulation."""
+        """Start the prefetched pitch."""
         self.game.first_pitch_thrown = True
-        selection = self.game.current_pitcher.ai.choose_action(self.game.current_state)
-        self.game.pitch_chosen = selection
-        
-        # This will be handled by the pitch simulation
-        self.game.current_pitcher.pitch(self._create_pitch_simulation, selection)
+        plan = self.pitch_prefetcher.take()
+        self.game.pitch_chosen = plan.selection
+        self._create_pitch_simulation(plan)
         
-    def _create_pitch_simulation(self, release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype):
-        """Create and start a pitch simulation."""
+    def _create_pitch_simulation(self, plan):
+        """Create and start a pitch simulation from a solved pitch; update() advances it every frame."""
         from .pitch_simulation import PitchSimulation
         self.pitch_simulation = PitchSimulation(
-            self.game, release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype
+            self.game, plan.release_point, plan.pitchername, plan.ax, plan.ay, plan.vx, plan.vy,
+            plan.traveltime, plan.pitchtype, flight=plan.flight
         )
-        self.pitch_simulation.run()
+        self.pitch_simulation.start()
         
     def render(self, screen):
         """Render the gameplay state."""
         screen.fill("black")
+        if self.pitch_simulation:
+            self.pitch_simulation.render(screen)
+            return
+
         self.game.current_pitcher.draw_pitcher(0, 0)
-        self.game.field_renderer.draw_strikezone()
         self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
         self.game.batter.draw_stance(1)
         
         # Draw pitch positions if in view mode
         if self.game.menu_state == 'view_pitches':
-            for pitch_pos in self.game.pitches_display:
+            for pitch_pos in self.game.trajectory_store.final_locations:
                 pygame.gfxdraw.aacircle(
                     screen, int(pitch_pos[0]), int(pitch_pos[1]), 
                     self.game.fourseamballsize, (255, 255, 255)
@@ -462,6 +473,7 @@ class VisualizationState(GameState):
         self.current_frame = 0
         self.last_time = 0
         self.running = True
+        self.trajectories = []
         
     def enter(self):
         """Initialize visualization state."""
@@ -469,6 +481,8 @@ class VisualizationState(GameState):
         self.current_frame = 0
         self.last_time = pygame.time.get_ticks()
         self.running = True
+        # Trails are regenerated from their flights once, not every frame
+        self.trajectories = self.game.trajectory_store.overlay_trajectories()
         
     def exit(self):
         """Clean up visualization state."""
@@ -505,7 +519,7 @@ class VisualizationState(GameState):
             return
             
         # Draw pitch trajectories up to current frame
-        for pitch in self.game.pitch_trajectories:
+        for pitch in self.trajectories:
             for i in range(min(self.current_frame, len(pitch))):
                 if i < len(pitch):
                     pygame.draw.ellipse(
@@ -521,7 +535,6 @@ class VisualizationState(GameState):
                          int(pitch[-1][2]), int(pitch[-1][2]))
                     )
                     
-        self.game.field_renderer.draw_strikezone()
         self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
         self.game.batter.draw_stance(1)
 
@@ -536,15 +549,7 @@ class ViewPitchesState(GameState):
         """Initialize view pitches state."""
         self.game.ui_manager.set_button_visibility('view_pitches')
 
-        # Use enhanced records if available, otherwise fall back to legacy
-        if hasattr(self.game, 'enhanced_pitch_records') and self.game.enhanced_pitch_records:
-            self.game.ui_manager.update_pitch_info_enhanced(
-                self.game.enhanced_pitch_records
-            )
-        else:
-            self.game.ui_manager.update_pitch_info(
-                self.game.pitch_trajectories, self.game.last_pitch_information
-            )
+        self.game.ui_manager.update_pitch_info_enhanced(self.game.trajectory_store.records)
         self.game.ui_manager.show_view_window()
         
     def exit(self):
@@ -566,11 +571,10 @@ class ViewPitchesState(GameState):
         """Render the view pitches state."""
         screen.fill("black")
         self.game.current_pitcher.draw_pitcher(0, 0)
-        self.game.field_renderer.draw_strikezone()
         self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
         
         # Draw all pitch positions
-        for pitch_pos in self.game.pitches_display:
+        for pitch_pos in self.game.trajectory_store.final_locations:
             pygame.gfxdraw.aacircle(
                 screen, int(pitch_pos[0]), int(pitch_pos[1]), 
                 self.game.fourseamballsize, (255, 255, 255)
@@ -611,7 +615,6 @@ class InningEndState(GameState):
         """Render the inning end state - same as gameplay but no new pitches allowed."""
         screen.fill("black")
         self.game.current_pitcher.draw_pitcher(0, 0)
-        self.game.field_renderer.draw_strikezone()
         self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
         self.game.batter.draw_stance(1)
         
@@ -668,6 +671,8 @@ class SandboxGameplayState(GameState):
         super().__init__(game)
         self.pitch_simulation = None
         self.selected_pitch = None  # Stores the user-selected pitch type
+        # The selected pitch is solved on idle frames, before the pitch key is pressed
+        self.pitch_prefetcher = PitchPrefetcher(game, lambda: self.selected_pitch, lambda: self.selected_pitch)
 
     def enter(self):
         """Initialize sandbox gameplay state."""
@@ -686,6 +691,7 @@ class SandboxGameplayState(GameState):
     def exit(self):
         """Clean up sandbox gameplay state."""
         self.pitch_simulation = None
+        self.pitch_prefetcher.invalidate()
 
     def _refresh_display(self):
         """Refresh the game display with current stats."""
@@ -732,7 +738,7 @@ class SandboxGameplayState(GameState):
     def update(self, time_delta: float):
         """Update sandbox gameplay logic."""
         if self.pitch_simulation and self.pitch_simulation.running:
-            self.pitch_simulation.update()
+            self.pitch_simulation.update(time_delta)
 
         if self.pitch_simulation and not self.pitch_simulation.running:
             self.pitch_simulation = None
@@ -740,14 +746,18 @@ class SandboxGameplayState(GameState):
             self._update_pitch_buttons()
             self._refresh_display()
 
+        if self.pitch_simulation is None and self.selected_pitch:
+            self.pitch_prefetcher.prepare()
+
     def handle_event(self, event):
         """Handle sandbox gameplay events."""
         if event.type == pygame.QUIT:
             return False
 
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_q and not self.pitch_simulation:
-                self._initiate_pitch()
+        if self.pitch_simulation:
+            self.pitch_simulation.handle_event(event)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_q:
+            self._initiate_pitch()
 
         self.game.ui_manager.process_events(event)
         return True
@@ -761,21 +771,25 @@ class SandboxGameplayState(GameState):
         self.game.pitch_chosen = self.selected_pitch
 
         # Use the selected pitch instead of AI selection
-        self.game.current_pitcher.pitch(self._create_pitch_simulation, self.selected_pitch)
+        self._create_pitch_simulation(self.pitch_prefetcher.take())
 
-    def _create_pitch_simulation(self, release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype):
-        """Create and start a pitch simulation."""
+    def _create_pitch_simulation(self, plan):
+        """Create and start a pitch simulation from a solved pitch; update() advances it every frame."""
         from .pitch_simulation import PitchSimulation
         self.pitch_simulation = PitchSimulation(
-            self.game, release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype
+            self.game, plan.release_point, plan.pitchername, plan.ax, plan.ay, plan.vx, plan.vy,
+            plan.traveltime, plan.pitchtype, flight=plan.flight
         )
-        self.pitch_simulation.run()
+        self.pitch_simulation.start()
 
     def render(self, screen):
         """Render the sandbox gameplay state."""
         screen.fill("black")
+        if self.pitch_simulation:
+            self.pitch_simulation.render(screen)
+            return
+
         self.game.current_pitcher.draw_pitcher(0, 0)
-        self.game.field_renderer.draw_strikezone()
         self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
         self.game.batter.draw_stance(1)
 
@@ -857,6 +871,7 @@ class GameDayTransitionState(GameState):
         self.phase = "SHOW_SCORE"  # Phases: SHOW_SCORE, SIMULATING, FINAL
         self.simulation_complete = False
         self.opponent_events = []
+        self.win_probability = None
 
     def enter(self):
         """Called when entering transition state."""
@@ -888,6 +903,8 @@ class GameDayTransitionState(GameState):
                 if new_pitcher:
                     self._load_and_switch_pitcher(new_pitcher)
 
+            self.win_probability = self.game.gameday_manager.get_win_probability()
+
         # Show appropriate buttons based on phase
         if self.phase == "FINAL":
             self.game.ui_manager.buttons['final_menu'].show()
@@ -957,31 +974,27 @@ class GameDayTransitionState(GameState):
         if gameday_mgr.game_over:
             self.phase = "FINAL"
             self.game.ui_manager.set_visibility_state('gameday_final')
+            self.win_probability = None
+        else:
+            self.win_probability = gameday_mgr.get_win_probability()
 
         self.simulation_complete = True
 
     def _load_and_switch_pitcher(self, pitcher_name: str):
         """Load and switch to a new pitcher."""
-        import pickle
-        import sys
-        from config import get_path
+        from ai.model_registry import model_registry
 
         # Set the new pitcher in the pitcher manager
         self.game.pitcher_manager.set_current_pitcher(pitcher_name)
         self.game.current_pitcher = self.game.pitcher_manager.get_current_pitcher()
 
-        # Load AI for the new pitcher
-        import ai.AI_2 as AI_2
-        sys.modules['AI_2'] = AI_2
-
         # Get the pitcher's actual pitch arsenal
         pitcher_pitch_names = set(self.game.current_pitcher.get_pitch_names())
         ai_loaded = False
 
         try:
-            ai_file = get_path(f"ai/{pitcher_name}_ai.pkl")
-            with open(ai_file, "rb") as f:
-                ai = pickle.load(f)
+            # Shared instance, usually already prefetched when GameDay started
+            ai = model_registry.get(f"{pitcher_name}_ai")
 
             # Validate that the AI's action space matches the pitcher's arsenal
             ai_actions = set(ai.actions)
@@ -993,7 +1006,7 @@ class GameDayTransitionState(GameState):
                 print(f"  AI actions: {sorted(ai_actions)}")
                 print(f"  Pitcher arsenal: {sorted(pitcher_pitch_names)}")
                 print(f"  Creating new AI with correct action space")
-        except FileNotFoundError:
+        except (KeyError, FileNotFoundError):
             print(f"Warning: AI file not found for {pitcher_name}, using default AI")
 
         # If AI wasn't loaded successfully or had wrong actions, create a new one
@@ -1010,6 +1023,7 @@ class GameDayTransitionState(GameState):
         # Check if game is over
         if self.game.gameday_manager.game_over:
             self.phase = "FINAL"
+            self.win_probability = None
             # Hide all buttons
             for button in self.game.ui_manager.buttons.values():
                 button.hide()
@@ -1045,8 +1059,7 @@ class GameDayTransitionState(GameState):
         self.game.inning_ended = False
 
         # Clear pitch data from previous inning
-        self.game.pitch_trajectories = []
-        self.game.pitchDataManager.records = []
+        self.game.trajectory_store.restart_overlay()
 
         # Transition to gameplay
         self.game.state_manager.change_state('gameplay')
@@ -1092,6 +1105,10 @@ class GameDayTransitionState(GameState):
         pitcher_surface = pitcher_font.render(pitcher_text, True, (150, 255, 150))
         screen.blit(pitcher_surface, (400, 290))
 
+        if self.win_probability is not None:
+            win_text = f"Win probability: {self.win_probability:.0%}"
+            screen.blit(pitcher_font.render(win_text, True, (150, 200, 255)), (400, 318))
+
         # Show recent events if simulating or just simulated
         if self.phase == "SIMULATING" and self.simulation_complete:
             event_font = pygame.font.Font(None, 28)
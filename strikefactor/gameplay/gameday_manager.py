@@ -4,8 +4,22 @@ Manages opponent at-bats, pitcher substitutions, and event logging.
 """
 
 import random
+from itertools import accumulate
 from typing import List, Dict, Tuple, Optional
-from helpers import ScoreKeeper
+import numpy as np
+from gameplay.scoring import ScoreKeeper, SINGLE, DOUBLE, TRIPLE, HOME_RUN
+
+
+def relief_probability(rules, runs_allowed, pitch_count, innings_pitched):
+    """
+    Chance of a pitching change under a list of relief rules.
+
+    Rules are (stat, threshold, chance) checked in order; the first threshold
+    the pitcher has reached sets the chance. Works on scalars or NumPy arrays.
+    """
+    stats = {'runs_allowed': runs_allowed, 'pitch_count': pitch_count, 'innings_pitched': innings_pitched}
+    return np.select([np.asarray(stats[stat]) >= threshold for stat, threshold, _ in rules],
+                     [chance for _, _, chance in rules], 0.0)
 
 
 class GameEvent:
@@ -83,6 +97,35 @@ class GameDayManager:
         'TRIPLE': 0.01,
         'HOME RUN': 0.02
     }
+    _OUTCOME_NAMES = tuple(OPPONENT_OUTCOMES)
+    _OUTCOME_CUM_WEIGHTS = tuple(accumulate(OPPONENT_OUTCOMES.values()))
+    HIT_TYPES = {'SINGLE': SINGLE, 'DOUBLE': DOUBLE, 'TRIPLE': TRIPLE, 'HOME RUN': HOME_RUN}
+
+    # Opponent relief rules: runs allowed applies to any pitcher, then starter or reliever limits
+    COMMON_RELIEF_RULES = (('runs_allowed', 5, 0.8), ('runs_allowed', 3, 0.4))
+    STARTER_RELIEF_RULES = COMMON_RELIEF_RULES + (
+        ('pitch_count', 90, 0.6), ('pitch_count', 100, 0.8), ('pitch_count', 110, 0.95))
+    # Relievers should pitch 1-3 innings max (3-9 outs)
+    RELIEVER_RELIEF_RULES = COMMON_RELIEF_RULES + (
+        ('innings_pitched', 3.0, 0.9), ('innings_pitched', 2.0, 0.6), ('innings_pitched', 1.0, 0.3),
+        ('pitch_count', 40, 0.8), ('pitch_count', 30, 0.5))
+
+    # Player's team relief: (innings pitched choices, chance to change)
+    PLAYER_STARTER_RELIEF = ((5.0, 6.0), 0.6)
+    PLAYER_RELIEVER_RELIEF = ((1.0, 2.0), 0.7)
+
+    # Opponent pitchers (player bats against these - actual game pitchers)
+    OPPONENT_PITCHER_PRESET = {
+        'starter': 'yamamoto',
+        'relievers': ['sasaki', 'degrom', 'mcclanahan'],
+        'pitch_count_thresholds': [90, 100, 110]  # More aggressive relief thresholds
+    }
+    # Player's team pitchers (opponent bats against these - simulated only)
+    PLAYER_PITCHER_PRESET = {
+        'starters': ['yesavage', 'scherzer', 'snell'],
+        'relievers': ['hoffman', 'lauer', 'vesia', 'chapman'],
+        'relief_thresholds': [1, 2]  # Relievers pitch 1-2 innings max
+    }
 
     def __init__(self, player_name: str = "Player"):
         self.player_name = player_name
@@ -101,11 +144,7 @@ class GameDayManager:
         self.opponent_scorekeeper = ScoreKeeper()  # For opponent's at-bats
 
         # Opponent pitchers (player bats against these - actual game pitchers)
-        self.opponent_pitcher_preset = {
-            'starter': 'yamamoto',
-            'relievers': ['sasaki', 'degrom', 'mcclanahan'],
-            'pitch_count_thresholds': [90, 100, 110]  # More aggressive relief thresholds
-        }
+        self.opponent_pitcher_preset = self.OPPONENT_PITCHER_PRESET
         self.current_pitcher_name = self.opponent_pitcher_preset['starter']
         self.opponent_pitcher_stats: Dict[str, PitcherStats] = {}
         self.opponent_pitcher_stats[self.current_pitcher_name] = PitcherStats(self.current_pitcher_name)
@@ -113,11 +152,7 @@ class GameDayManager:
         self.available_opponent_relievers = self.opponent_pitcher_preset['relievers'].copy()
 
         # Player's team pitchers (opponent bats against these - simulated only)
-        self.player_pitcher_preset = {
-            'starters': ['yesavage', 'scherzer', 'snell'],
-            'relievers': ['hoffman', 'lauer', 'vesia', 'chapman'],
-            'relief_thresholds': [1, 2]  # Relievers pitch 1-2 innings max
-        }
+        self.player_pitcher_preset = self.PLAYER_PITCHER_PRESET
         self.current_player_pitcher_name = random.choice(self.player_pitcher_preset['starters'])
         self.player_pitcher_stats: Dict[str, PitcherStats] = {}
         self.player_pitcher_stats[self.current_player_pitcher_name] = PitcherStats(self.current_player_pitcher_name)
@@ -168,45 +203,10 @@ class GameDayManager:
 
         # Check if current pitcher is a reliever (not the starter)
         is_starter = (self.current_pitcher_name == self.opponent_pitcher_preset['starter'])
+        rules = self.STARTER_RELIEF_RULES if is_starter else self.RELIEVER_RELIEF_RULES
 
-        # Common: Check runs allowed for any pitcher type
-        if stats.runs_allowed >= 5:
-            return random.random() < 0.8  # 80% chance after 5+ runs
-        if stats.runs_allowed >= 3:
-            return random.random() < 0.4  # 40% chance after 3+ runs
-
-        if is_starter:
-            # STARTER thresholds - more conservative
-            if stats.pitch_count >= 90:
-                return random.random() < 0.6
-            if stats.pitch_count >= 100:
-                return random.random() < 0.8
-            if stats.pitch_count >= 110:
-                return random.random() < 0.95
-        else:
-            # RELIEVER thresholds - VERY AGGRESSIVE
-            # Relievers should pitch 1-3 innings max (3-9 outs)
-            innings_pitched = stats.get_innings_pitched()
-
-            # After 3 innings: 90% chance to pull
-            if innings_pitched >= 3.0:
-                return random.random() < 0.9
-
-            # After 2 innings: 60% chance
-            if innings_pitched >= 2.0:
-                return random.random() < 0.6
-
-            # After 1 inning: 30% chance
-            if innings_pitched >= 1.0:
-                return random.random() < 0.3
-
-            # Pitch count thresholds for relievers - MUCH LOWER
-            if stats.pitch_count >= 40:
-                return random.random() < 0.8  # 80% chance at 40 pitches
-            if stats.pitch_count >= 30:
-                return random.random() < 0.5  # 50% chance at 30 pitches
-
-        return False
+        chance = relief_probability(rules, stats.runs_allowed, stats.pitch_count, stats.get_innings_pitched())
+        return bool(chance > 0 and random.random() < chance)
 
     def substitute_relief_pitcher(self) -> Optional[str]:
         """Substitute in a relief pitcher (opponent team). Returns new pitcher name or None."""
@@ -238,15 +238,10 @@ class GameDayManager:
         # For starters, consider relief after 5-6 innings
         # For relievers, consider relief after 1-2 innings
         is_reliever = self.current_player_pitcher_name in self.player_pitcher_preset['relievers']
+        innings_choices, chance = self.PLAYER_RELIEVER_RELIEF if is_reliever else self.PLAYER_STARTER_RELIEF
 
-        if is_reliever:
-            # Relievers: 1-2 innings max
-            if stats.get_innings_pitched() >= random.choice([1.0, 2.0]):
-                return random.random() < 0.7  # 70% chance to change
-        else:
-            # Starters: 5-6 innings
-            if stats.get_innings_pitched() >= random.choice([5.0, 6.0]):
-                return random.random() < 0.6  # 60% chance to change
+        if stats.get_innings_pitched() >= random.choice(innings_choices):
+            return random.random() < chance
 
         return False
 
@@ -275,9 +270,7 @@ class GameDayManager:
         Returns (outcome, runs_scored).
         """
         # Choose outcome based on probabilities
-        outcomes = list(self.OPPONENT_OUTCOMES.keys())
-        probabilities = list(self.OPPONENT_OUTCOMES.values())
-        outcome = random.choices(outcomes, weights=probabilities, k=1)[0]
+        outcome = random.choices(self._OUTCOME_NAMES, cum_weights=self._OUTCOME_CUM_WEIGHTS)[0]
 
         # Track PLAYER'S pitcher stats (opponent is batting against player's pitcher)
         pitcher_stats = self.get_active_player_pitcher_stats()
@@ -301,7 +294,7 @@ class GameDayManager:
             pitcher_stats.record_outcome(outcome, runs_scored)
 
         elif outcome in ['SINGLE', 'DOUBLE', 'TRIPLE', 'HOME RUN']:
-            hit_type = {'SINGLE': 1, 'DOUBLE': 2, 'TRIPLE': 3, 'HOME RUN': 4}[outcome]
+            hit_type = self.HIT_TYPES[outcome]
             before_score = self.opponent_scorekeeper.get_score()
             self.opponent_scorekeeper.update_hit_event(hit_type)
             runs_scored = self.opponent_scorekeeper.get_score() - before_score
@@ -413,6 +406,11 @@ class GameDayManager:
         """Get the most recent events."""
         return self.event_log[-count:] if len(self.event_log) > count else self.event_log
 
+    def get_win_probability(self, n_games: int = 2000) -> float:
+        """Estimate the player's chance of winning from the current game state."""
+        from gameplay.gameday_simulator import GameDaySimulator
+        return GameDaySimulator().simulate(n_games, self).win_probability
+
     def get_winner(self) -> str:
         """Get the winner of the game (call after game is over)."""
         if self.player_score > self.opponent_score:
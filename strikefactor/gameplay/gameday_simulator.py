@@ -0,0 +1,236 @@
+"""
+GameDay Simulator - Monte Carlo engine for complete GameDay games.
+
+Plays many 9-inning games at once with NumPy. Every game keeps its own bases,
+outs, score and pitcher state in arrays, at-bats are drawn from the
+GameDayManager outcome probabilities and advanced through the ScoreKeeper
+transition tables, and pitching changes follow the GameDayManager relief rules.
+Both halves of every inning are simulated, so it needs no display and can
+start from a game in progress for a live win probability.
+"""
+
+from typing import Dict, Optional
+import numpy as np
+from gameplay.gameday_manager import GameDayManager, relief_probability
+from gameplay.scoring import (BASE_STATES, TRANSITIONS, WALK, SINGLE, DOUBLE, TRIPLE, HOME_RUN,
+                              ScoreKeeper)
+
+# Outs extend the transition tables as one more event: bases stay, no runs score
+OUT = len(TRANSITIONS)
+NEXT_BASES = np.array([[new_bases for new_bases, _ in row] for row in TRANSITIONS]
+                      + [list(range(BASE_STATES))], dtype=np.int8)
+RUNS_SCORED = np.array([[runs for _, runs in row] for row in TRANSITIONS]
+                       + [[0] * BASE_STATES], dtype=np.int8)
+
+OUTCOME_EVENTS = {
+    'WALK': WALK, 'SINGLE': SINGLE, 'DOUBLE': DOUBLE, 'TRIPLE': TRIPLE, 'HOME RUN': HOME_RUN,
+    'STRIKEOUT': OUT, 'GROUNDOUT': OUT, 'FLYOUT': OUT, 'LINEOUT': OUT,
+}
+
+# Pitches thrown per simulated at-bat, as in GameDayManager.simulate_opponent_at_bat
+PITCHES_PER_AT_BAT = (3, 6)
+
+
+class GameDaySummary:
+    """Results of a batch of simulated games, from the player's point of view."""
+
+    def __init__(self, player_runs: np.ndarray, opponent_runs: np.ndarray,
+                 opponent_relievers_used: np.ndarray, player_relievers_used: np.ndarray,
+                 starter_outs: np.ndarray):
+        self.n_games = len(player_runs)
+        self.player_runs = player_runs
+        self.opponent_runs = opponent_runs
+        self.opponent_relievers_used = opponent_relievers_used
+        self.player_relievers_used = player_relievers_used
+        self.starter_outs = starter_outs
+
+        self.win_probability = float(np.mean(player_runs > opponent_runs))
+        self.loss_probability = float(np.mean(player_runs < opponent_runs))
+        self.tie_probability = 1.0 - self.win_probability - self.loss_probability
+
+    def run_distribution(self, team: str = 'player') -> np.ndarray:
+        """Fraction of games in which a team ('player' or 'opponent') scored 0, 1, 2, ... runs."""
+        runs = self.player_runs if team == 'player' else self.opponent_runs
+        return np.bincount(runs) / self.n_games
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get the headline numbers of the batch."""
+        return {
+            'games': self.n_games,
+            'win_probability': self.win_probability,
+            'loss_probability': self.loss_probability,
+            'tie_probability': self.tie_probability,
+            'player_runs': float(self.player_runs.mean()),
+            'opponent_runs': float(self.opponent_runs.mean()),
+            'opponent_relievers_used': float(self.opponent_relievers_used.mean()),
+            'player_relievers_used': float(self.player_relievers_used.mean()),
+            'starter_innings': float(self.starter_outs.mean() / 3),
+        }
+
+    def print_summary(self):
+        """Print win probability, average runs and the run distributions."""
+        stats = self.get_stats()
+        print(f"{self.n_games:,} games: win {stats['win_probability']:.1%}, "
+              f"loss {stats['loss_probability']:.1%}, tie {stats['tie_probability']:.1%}")
+        print(f"Runs per game: player {stats['player_runs']:.2f}, opponent {stats['opponent_runs']:.2f}")
+        print(f"Opponent starter: {stats['starter_innings']:.2f} IP, "
+              f"{stats['opponent_relievers_used']:.2f} relievers used "
+              f"(player team {stats['player_relievers_used']:.2f})")
+        for team in ('player', 'opponent'):
+            distribution = ", ".join(f"{runs}: {share:.1%}" for runs, share
+                                     in enumerate(self.run_distribution(team)[:11]))
+            print(f"{team.title()} runs: {distribution}")
+
+
+class GameDaySimulator:
+    """Simulates batches of complete GameDay games in lockstep."""
+
+    def __init__(self, opponent_outcomes: Dict[str, float] = None,
+                 player_outcomes: Dict[str, float] = None, innings: int = 9, seed: Optional[int] = None):
+        """
+        Args:
+            opponent_outcomes: At-bat outcome probabilities for the opponent's lineup
+                (default: GameDayManager.OPPONENT_OUTCOMES)
+            player_outcomes: At-bat outcome probabilities for the player's half-innings
+                (default: same as the opponent)
+            innings: Innings per game
+            seed: Seed for the random generator
+        """
+        opponent_outcomes = opponent_outcomes or GameDayManager.OPPONENT_OUTCOMES
+        self.opponent_outcomes = self._outcome_table(opponent_outcomes)
+        self.player_outcomes = self._outcome_table(player_outcomes or opponent_outcomes)
+        self.innings = innings
+        self.rng = np.random.default_rng(seed)
+
+        self.opponent_relievers = len(GameDayManager.OPPONENT_PITCHER_PRESET['relievers'])
+        self.player_relievers = len(GameDayManager.PLAYER_PITCHER_PRESET['relievers'])
+
+    @staticmethod
+    def _outcome_table(outcomes: Dict[str, float]):
+        """Cumulative probabilities and transition events for a set of outcomes."""
+        cumulative = np.cumsum(list(outcomes.values()), dtype=np.float64)
+        cumulative /= cumulative[-1]
+        cumulative[-1] = 1.0
+        events = np.array([OUTCOME_EVENTS[outcome] for outcome in outcomes], dtype=np.int8)
+        return cumulative, events
+
+    def _play_half_inning(self, outcome_table, bases: np.ndarray, outs: np.ndarray):
+        """Play every game's half-inning to 3 outs; returns (runs, pitches, outs recorded)."""
+        cumulative, events = outcome_table
+        n_games = len(bases)
+        runs = np.zeros(n_games, dtype=np.int64)
+        pitches = np.zeros(n_games, dtype=np.int64)
+        starting_outs = outs.copy()
+
+        active = np.flatnonzero(outs < 3)
+        while len(active):
+            event = events[np.searchsorted(cumulative, self.rng.random(len(active)), side='right')]
+            current = bases[active]
+            runs[active] += RUNS_SCORED[event, current]
+            bases[active] = NEXT_BASES[event, current]
+            outs[active] += event == OUT
+            pitches[active] += self.rng.integers(PITCHES_PER_AT_BAT[0], PITCHES_PER_AT_BAT[1] + 1, len(active))
+            active = active[outs[active] < 3]
+
+        return runs, pitches, outs - starting_outs
+
+    def simulate(self, n_games: int, manager: GameDayManager = None,
+                 score_keeper: ScoreKeeper = None) -> GameDaySummary:
+        """
+        Simulate n_games complete games.
+
+        Args:
+            n_games: Number of games to simulate
+            manager: Continue from this game in progress instead of the first pitch
+            score_keeper: Bases and runs of the half-inning in progress (default: the
+                manager's scorekeeper for the batting team); the player's runs in it
+                must not be in player_score yet
+
+        Returns:
+            GameDaySummary of the final scores
+        """
+        inning, is_top, outs, bases = 1, True, 0, 0
+        player_score, opponent_score = 0, 0
+        runs_allowed, pitch_count, outs_recorded = 0, 0, 0
+        is_starter, opponent_relievers_left = True, self.opponent_relievers
+        player_pitcher_outs, is_player_reliever, player_relievers_left = 0, False, self.player_relievers
+
+        if manager is not None:
+            inning = self.innings + 1 if manager.game_over else manager.current_inning
+            is_top, outs = manager.is_top_inning, manager.current_outs
+            if score_keeper is None:
+                score_keeper = manager.opponent_scorekeeper if is_top else manager.player_scorekeeper
+            bases = score_keeper.base_state
+            opponent_score = manager.opponent_score
+            # The player's runs join player_score only when their half-inning ends
+            player_score = manager.player_score + (0 if is_top else score_keeper.get_score())
+
+            stats = manager.get_active_pitcher_stats()
+            runs_allowed, pitch_count, outs_recorded = stats.runs_allowed, stats.pitch_count, stats.outs_recorded
+            is_starter = manager.current_pitcher_name == manager.opponent_pitcher_preset['starter']
+            opponent_relievers_left = len(manager.available_opponent_relievers)
+
+            player_pitcher_outs = manager.get_active_player_pitcher_stats().outs_recorded
+            is_player_reliever = manager.current_player_pitcher_name in manager.player_pitcher_preset['relievers']
+            player_relievers_left = len(manager.available_player_relievers)
+
+        def full(value, dtype=np.int64):
+            return np.full(n_games, value, dtype=dtype)
+
+        outs, bases = full(outs), full(bases, np.int8)
+        player_score, opponent_score = full(player_score), full(opponent_score)
+        runs_allowed, pitch_count, outs_recorded = full(runs_allowed), full(pitch_count), full(outs_recorded)
+        is_starter, opponent_relievers_left = full(is_starter, bool), full(opponent_relievers_left)
+        starter_outs = np.where(is_starter, outs_recorded, 0)
+        player_pitcher_outs = full(player_pitcher_outs)
+        is_player_reliever, player_relievers_left = full(is_player_reliever, bool), full(player_relievers_left)
+        opponent_relievers_start, player_relievers_start = opponent_relievers_left.copy(), player_relievers_left.copy()
+
+        while inning <= self.innings:
+            if is_top:
+                runs, _, recorded = self._play_half_inning(self.opponent_outcomes, bases, outs)
+                opponent_score += runs
+                player_pitcher_outs += recorded
+
+                if inning < self.innings:
+                    # Player's team relief, as in should_consider_player_relief_pitcher
+                    starter_choices, starter_chance = GameDayManager.PLAYER_STARTER_RELIEF
+                    reliever_choices, reliever_chance = GameDayManager.PLAYER_RELIEVER_RELIEF
+                    threshold = np.where(is_player_reliever, self.rng.choice(reliever_choices, n_games),
+                                         self.rng.choice(starter_choices, n_games))
+                    chance = np.where(is_player_reliever, reliever_chance, starter_chance)
+                    change = ((player_relievers_left > 0) & (player_pitcher_outs / 3.0 >= threshold)
+                              & (self.rng.random(n_games) < chance))
+                    player_pitcher_outs[change] = 0
+                    is_player_reliever |= change
+                    player_relievers_left -= change
+            else:
+                runs, pitches, recorded = self._play_half_inning(self.player_outcomes, bases, outs)
+                player_score += runs
+                runs_allowed += runs
+                pitch_count += pitches
+                outs_recorded += recorded
+                starter_outs += np.where(is_starter, recorded, 0)
+
+                if inning < self.innings:
+                    # Opponent relief, as in should_consider_relief_pitcher
+                    innings_pitched = outs_recorded / 3.0
+                    chance = np.where(
+                        is_starter,
+                        relief_probability(GameDayManager.STARTER_RELIEF_RULES, runs_allowed, pitch_count, innings_pitched),
+                        relief_probability(GameDayManager.RELIEVER_RELIEF_RULES, runs_allowed, pitch_count, innings_pitched))
+                    change = (opponent_relievers_left > 0) & (self.rng.random(n_games) < chance)
+                    runs_allowed[change] = 0
+                    pitch_count[change] = 0
+                    outs_recorded[change] = 0
+                    is_starter &= ~change
+                    opponent_relievers_left -= change
+                inning += 1
+
+            is_top = not is_top
+            outs[:] = 0
+            bases[:] = 0
+
+        return GameDaySummary(player_score, opponent_score,
+                              opponent_relievers_start - opponent_relievers_left,
+                              player_relievers_start - player_relievers_left, starter_outs)
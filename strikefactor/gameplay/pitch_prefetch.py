@@ -0,0 +1,99 @@
+"""
+Pitch Prefetch - Prepare the next pitch while the player waits for it.
+
+Between pitches the gameplay states call prepare() every idle frame. The
+first call after a pitch picks the next pitch type, runs the pitcher's pitch
+method for its speed, target and velocities, and integrates the flight. The
+plan is keyed by everything it depends on: the pitcher and its AI, the AI
+state and count, the batter's handedness and anything the state adds (the
+sandbox's selected pitch). take() hands the plan over on the pitch key when
+its key still matches, so the key press only constructs the PitchSimulation;
+a stale or missing plan is rebuilt on the spot.
+"""
+
+from typing import Callable
+from utils.physics import precompute_pitch_flight
+from engine.profiler import profiler
+
+
+class PitchPlan:
+    """A fully solved pitch, ready to be thrown."""
+
+    def __init__(self, key, selection, release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype, flight):
+        self.key = key
+        self.selection = selection
+        self.release_point = release_point
+        self.pitchername = pitchername
+        self.ax = ax
+        self.ay = ay
+        self.vx = vx
+        self.vy = vy
+        self.traveltime = traveltime
+        self.pitchtype = pitchtype
+        self.flight = flight
+
+
+class PitchPrefetcher:
+    """Keeps the next pitch solved ahead of the pitch key."""
+
+    def __init__(self, game, choose_pitch: Callable[[], str], extra_key: Callable = None):
+        """
+        Args:
+            game: The game
+            choose_pitch: Returns the pitch to throw next, e.g. the AI's choice
+            extra_key: Returns anything else the choice depends on; the plan is rebuilt when it changes
+        """
+        self.game = game
+        self.choose_pitch = choose_pitch
+        self.extra_key = extra_key
+        self.plan = None
+        self.builds = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self) -> tuple:
+        pitcher = self.game.current_pitcher
+        return (pitcher, pitcher.get_ai(), self.game.current_state,
+                self.game.currentballs, self.game.currentstrikes, self.game.currentouts,
+                self.game.batter.get_handedness(), self.extra_key() if self.extra_key else None)
+
+    def prepare(self) -> bool:
+        """
+        Solve the next pitch unless an up-to-date plan is ready; call on idle frames.
+
+        Returns:
+            True if a plan was built
+        """
+        key = self._key()
+        if self.plan is not None and self.plan.key == key:
+            return False
+        with profiler.section("pitch.prefetch"):
+            self.plan = self._build(key)
+        self.builds += 1
+        return True
+
+    def take(self) -> PitchPlan:
+        """Hand over the plan for the pitch being thrown now, solving it first if it is missing or stale."""
+        if self.prepare():
+            self.misses += 1
+        else:
+            self.hits += 1
+        plan, self.plan = self.plan, None
+        return plan
+
+    def invalidate(self):
+        """Drop the prepared plan."""
+        self.plan = None
+
+    def _build(self, key) -> PitchPlan:
+        selection = self.choose_pitch()
+        # Pitch methods hand their solved parameters to a simulation callback; keep them instead
+        solved = []
+        self.game.current_pitcher.pitch(lambda *params: solved.append(params), selection)
+        release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype = solved[0]
+        flight = precompute_pitch_flight(release_point, vx, vy, ax, ay, traveltime)
+        return PitchPlan(key, selection, release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype, flight)
+
+    def get_stats(self) -> dict:
+        """Get how often the pitch key found a ready plan."""
+        return {'builds': self.builds, 'hits': self.hits, 'misses': self.misses}
@@ -1,17 +1,14 @@
 import pygame
 import pygame.gfxdraw
-import pandas as pd
-from utils.physics import collision
+from utils.physics import collision, precompute_pitch_flight, pitch_flight_position
 from main import Game
-from helpers import EnhancedPitchRecord
 
-# Load the model once, ideally passed in or as a singleton
-import pickle
-from config import get_path, calculate_z_delta
-model = pickle.load(open(get_path("ai/ai_umpire.pkl"), "rb"))
+from ai.model_registry import model_registry
+from engine.profiler import profiler
+from gameplay.trajectory_store import TrajectoryRecord
 
 class PitchSimulation:
-    def __init__(self, game, release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype):
+    def __init__(self, game, release_point, pitchername, ax, ay, vx, vy, traveltime, pitchtype, flight=None):
         self.game: Game = game
         self.release_point = release_point
         self.pitchername = pitchername
@@ -36,8 +33,12 @@ class PitchSimulation:
         self.pitch_results_done = False
         self.is_strike = False
         self.is_hit = False
+        self.is_at_bat = False
         self.previous_state = self.game.current_state
         self.recording_state = 0
+        self.trail_status = ''     # Status of the latest trail point
+        self.trail_end_ms = -1.0   # Milliseconds after release of the latest trail point
+        self.ball_stop_ms = 0.0    # Latest flight time the ball was moved to
         
         self.new_entry = {
             'Pitcher': self.pitchername, 'PitchType': self.pitchtype, 'FirstX': 0, 'FirstY': 0,
@@ -57,65 +58,96 @@ class PitchSimulation:
         self.starttime = pygame.time.get_ticks()
         self.last_time = self.starttime
         self.windup = self.game.current_pitcher.get_windup()
-        self.arrival_time = self.starttime + self.windup + self.traveltime
+        self.release_time = self.starttime + self.windup
+        self.arrival_time = self.release_time + self.traveltime
 
-        # Get engine FPS setting for physics calculations
+        # The whole flight is integrated once, usually ahead of time by the pitch prefetcher; frames only look it up
+        if flight is None:
+            flight = precompute_pitch_flight(self.release_point, self.vx, self.vy,
+                                             self.ax, self.ay, self.traveltime)
+        self.flight = flight
+        self.plate_time = self.release_time + self.flight[-1, 0]
+
+        # Engine FPS only sets the update rate, the path is the same at any rate
         self.engine_fps = self.game.settings_manager.get_engine_fps()
+        self.step_ms = 1000.0 / self.engine_fps
+        self.sim_time = self.starttime
+        self.phase = 'windup'
 
-    def run(self):
+    def start(self):
+        """Start the pitch; the main loop then drives it through handle_event, update and render."""
         self.game.ui_manager.hide_banner()
         self.game.ui_manager.set_button_visibility('pitching')
 
-        while self.running:
-            self.update()
+    def handle_event(self, event):
+        """Handle a main loop event; a swing is timed by when its key event was pumped."""
+        if event.type != pygame.KEYDOWN:
+            return
+        event_time = getattr(event, 'timestamp', pygame.time.get_ticks())
+        if self._is_ball_in_flight(event_time) and event_time < self.arrival_time - 100:
+            self._handle_swing_input(event, event_time)
 
-    def update(self):
-        """Main simulation update loop."""
-        self.game.sound_manager.update()
-        self.game.screen.fill("black")
-        time_delta = self.game.clock.tick_busy_loop(self.engine_fps)/1000.0
-        self.game.ui_manager.draw()
-        self.game.ui_manager.update(time_delta)
-        
+    def update(self, time_delta: float = 0.0):
+        """Advance the pitch to the current time, in steps no longer than one engine frame."""
         current_time = pygame.time.get_ticks()
-        self.game.current_pitcher.draw_pitcher(self.starttime, current_time)
-        
-        if self.starttime + self.windup < current_time < self.arrival_time:
-            pass  # loops tracking if needed
-            
+        with profiler.section("pitch.update"):
+            while self.running and self.sim_time < current_time:
+                self.sim_time = min(self.sim_time + self.step_ms, current_time)
+                self._step(self.sim_time)
+
+    def _step(self, current_time):
+        """Run one engine step of the pitch at the given time."""
         # Update pitch trajectory
         self._update_pitch_trajectory(current_time)
         
         # Handle different phases of the pitch
         if current_time <= self.starttime + self.windup:
-            self._handle_windup_phase(current_time)
+            self.phase = 'windup'
         elif self._is_ball_in_flight(current_time):
+            self.phase = 'flight'
             self._handle_ball_flight_phase(current_time)
         elif self._is_contact_time(current_time):
+            self.phase = 'contact'
             self._handle_contact_phase(current_time)
         elif self._is_follow_through_time(current_time):
+            self.phase = 'follow_through'
             self._handle_follow_through_phase(current_time)
         elif current_time > self.arrival_time + 700:
             self._finish_pitch()
+
+    def render(self, screen):
+        """Draw the pitcher, batter, ball and field for the current phase."""
+        current_time = pygame.time.get_ticks()
+        with profiler.section("draw_pitcher"):
+            self.game.current_pitcher.draw_pitcher(self.starttime, current_time)
+        with profiler.section("draw_batter"):
+            self._draw_batter(current_time)
+        if self.phase == 'flight' and self.game.ball[2] > 300:
+            with profiler.section("draw_ball"):
+                self.game.blitfunc(screen, self.game.ball)
+        self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
+        if self.phase in ('contact', 'follow_through'):
+            pygame.gfxdraw.aacircle(screen, int(self.game.ball[0]), int(self.game.ball[1]),
+                                    self.game.fourseamballsize, (255,255,255))
             
     def _update_pitch_trajectory(self, current_time):
         """Update pitch trajectory tracking."""
         elapsed_time = current_time - self.last_time
         
+        # Only the trail's length and outcome are tracked; its points are regenerated from the flight
         if elapsed_time >= 10 and current_time - self.starttime > self.windup or (current_time - self.starttime > self.windup and not self.pitch_results_done):
             self.last_time = current_time
+            self.trail_end_ms = current_time - self.release_time
             if current_time > self.starttime + self.traveltime + self.windup and hasattr(self, 'outcome') and self.outcome in ['FLYOUT', 'GROUNDOUT']:
-                entry = [self.game.ball[0], self.game.ball[1], self.game.fourseamballsize, (198, 169, 251), "out"]  # Purple for outs
+                self.trail_status = 'out'
             elif current_time > self.starttime + self.traveltime + self.windup and self.is_hit:
-                entry = [self.game.ball[0], self.game.ball[1], self.game.fourseamballsize, (71, 204, 252), "hit"]
+                self.trail_status = 'hit'
             elif current_time > self.starttime + self.traveltime + self.windup and self.pitch_results_done and self.is_strike:
-                entry = [self.game.ball[0], self.game.ball[1], self.game.fourseamballsize, (227, 75, 80), "strike"]
+                self.trail_status = 'strike'
             elif current_time > self.starttime + self.traveltime + self.windup and self.pitch_results_done and not self.is_strike:
-                entry = [self.game.ball[0], self.game.ball[1], self.game.fourseamballsize, (75, 227, 148), "ball"]
+                self.trail_status = 'ball'
             else:
-                dist = self.game.ball[2]/300
-                entry = [self.game.ball[0], self.game.ball[1], min(max(11/dist, 4), 11), (255,255,255), ""]
-            self.game.last_pitch_information.append(entry)
+                self.trail_status = ''
             
         # Record trajectory points
         if self.recording_state == 0 and self.windup < (current_time - self.starttime) < self.windup + 200:
@@ -127,13 +159,6 @@ class PitchSimulation:
             self.new_entry['SecondX'] = self.game.ball[0]
             self.new_entry['SecondY'] = self.game.ball[1]
             
-    def _handle_windup_phase(self, current_time):
-        """Handle pitcher windup phase."""
-        self.game.batter.leg_kick(current_time, self.starttime + self.windup - 300)
-        self.game.field_renderer.draw_strikezone()
-        self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
-        pygame.display.flip()
-        
     def _is_ball_in_flight(self, current_time):
         """Check if ball is in flight and available for hitting."""
         return ((current_time > self.starttime + self.windup
@@ -142,21 +167,12 @@ class PitchSimulation:
                 or (self.on_time > 0 and current_time <= self.contact_time and self.made_contact == "no_swing"))
                 
     def _handle_ball_flight_phase(self, current_time):
-        """Handle ball flight phase with input detection."""
+        """Handle ball flight phase; swings arrive through handle_event."""
         if not self.sizz:
             self.sizz = True
             self.game.sound_manager.play('sizzle')
             
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                if current_time < self.arrival_time - 100:
-                    self._handle_swing_input(event, current_time)
-                    
-        self._draw_batter(current_time)
-        self._update_ball_position()
-        self.game.field_renderer.draw_strikezone()
-        self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
-        pygame.display.flip()
+        self._set_ball_position(current_time)
         
         # Ball reaching glove sound
         if ((current_time > (self.arrival_time - 30) and self.soundplayed == 0 and self.on_time == 0) or 
@@ -168,7 +184,7 @@ class PitchSimulation:
     def _handle_swing_input(self, event, current_time):
         """Handle swing input from player."""
         mousepos = pygame.mouse.get_pos()
-        self.swing_starttime = pygame.time.get_ticks()
+        self.swing_starttime = current_time
         self.contact_time = self.swing_starttime + 150
         
         if event.key == pygame.K_w and self.game.swing_started == 0:
@@ -195,13 +211,6 @@ class PitchSimulation:
                 
     def _handle_contact_phase(self, current_time):
         """Handle contact evaluation phase."""
-        self._draw_batter(current_time)
-        self.game.field_renderer.draw_strikezone()
-        self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
-        pygame.gfxdraw.aacircle(self.game.screen, int(self.game.ball[0]), int(self.game.ball[1]), 
-                               self.game.fourseamballsize, (255,255,255))
-        pygame.display.flip()
-        
         if not self.pitch_results_done:
             self._evaluate_contact()
             
@@ -219,6 +228,7 @@ class PitchSimulation:
     def _evaluate_contact(self):
         """Evaluate the contact outcome based on timing."""
         mousepos = pygame.mouse.get_pos()
+        self._set_ball_position(self.contact_time)
         
         if self.on_time == 1:  # Foul ball timing
             outcome = self.game.hit_outcome_manager.get_ball_to_bat_contact_outcome(
@@ -292,7 +302,7 @@ class PitchSimulation:
         self.outcome = out_type
 
         # Record at-bat (outs count as at-bats in baseball)
-        self.game.field_renderer.record_at_bat()
+        self.is_at_bat = True
 
         # Display the out result
         self.game.ui_manager.show_banner(out_type)
@@ -314,7 +324,7 @@ class PitchSimulation:
         self.game.hits += 1
 
         # Record at-bat (hits count as at-bats in baseball)
-        self.game.field_renderer.record_at_bat()
+        self.is_at_bat = True
 
         if self.game.hit_outcome_manager.get_homerun_text() != '':
             self.game.ui_manager.show_banner("{}".format(self.game.hit_outcome_manager.get_homerun_text()))
@@ -349,12 +359,8 @@ class PitchSimulation:
             self.game.sound_manager.glovepop()
             self.soundplayed += 1
             
-        self._draw_batter(current_time)
-        self.game.field_renderer.draw_strikezone()
-        self.game.field_renderer.draw_field(self.game.scoreKeeper.get_bases())
-        pygame.gfxdraw.aacircle(self.game.screen, int(self.game.ball[0]), int(self.game.ball[1]), 
-                               self.game.fourseamballsize, (255,255,255))
-        pygame.display.flip()
+        # Once the ball is past the batter it is shown (and called) at the plate
+        self._set_ball_position(max(current_time, self.plate_time))
         
         if not self.pitch_results_done:
             self._make_ball_strike_call()
@@ -363,9 +369,12 @@ class PitchSimulation:
         """Make the umpire's ball/strike call."""
         self.pitch_results_done = True
         
+        umpire_zone = model_registry.get("umpire_zone")
+        with profiler.section("umpire.is_strike"):
+            called_strike = umpire_zone.is_strike(self.game.ball[0], self.game.ball[1])
+
         # Check if it's a ball (outside zone and not swung at)
-        if not model.predict(pd.DataFrame([[self.game.ball[0], self.game.ball[1]]], 
-                                         columns=['finalx', 'finaly'])) and self.game.swing_started == 0:
+        if not called_strike and self.game.swing_started == 0:
             self._handle_ball_call()
         else:
             self._handle_strike_call()
@@ -423,7 +432,7 @@ class PitchSimulation:
             self.game.currentouts += 1
 
             # Record at-bat (strikeouts count as at-bats in baseball)
-            self.game.field_renderer.record_at_bat()
+            self.is_at_bat = True
 
             if self.game.swing_started == 0:
                 self.new_entry['called_strike'] = True
@@ -461,26 +470,22 @@ class PitchSimulation:
         else:
             self.game.batter.leg_kick(current_time, self.starttime + self.windup - 300)
             
-    def _update_ball_position(self):
-        """Update ball position and physics."""
-        dist = self.game.ball[2]/300
-        if dist > 1:
-            self.game.blitfunc(self.game.screen, self.game.ball)
-            # Scale factor: original physics calibrated for 60 FPS
-            fps_scale = 60 / self.engine_fps
-            self.game.ball[1] += self.vy * (1/dist) * fps_scale
-            self.game.ball[2] -= calculate_z_delta(self.engine_fps, self.traveltime)
-            self.game.ball[0] += self.vx * (1/dist) * fps_scale
-            self.vy += (self.ay*300) * (1/dist) * fps_scale
-            self.vx += (self.ax*300) * (1/dist) * fps_scale
-            
+    def _set_ball_position(self, current_time):
+        """Move the ball to its precomputed position at the given time."""
+        self.ball_stop_ms = min(current_time - self.release_time, self.flight[-1, 0])
+        x, y, z, _ = pitch_flight_position(self.flight, self.ball_stop_ms)
+        self.game.ball[0] = x
+        self.game.ball[1] = y
+        self.game.ball[2] = z
+
     def _finish_pitch(self):
         """Finish the pitch and clean up."""
         self.running = False
         self.game.ui_manager.set_button_visibility('in_game')
         from ui.components import create_pci_cursor
         pygame.mouse.set_cursor(create_pci_cursor())
-        self.cleanup()
+        with profiler.section("pitch.cleanup"):
+            self.cleanup()
 
     def _calculate_velocity_mph(self) -> float:
         """Calculate pitch velocity in MPH from travel time.
@@ -524,60 +529,43 @@ class PitchSimulation:
         self.new_entry['FinalX'] = self.game.ball[0]
         self.new_entry['FinalY'] = self.game.ball[1]
         
-        # Record that a pitch was thrown for statistics
-        self.game.field_renderer.record_pitch()
-        
-        # Record heatmap data using final ball position
+        # Record the pitch; the heatmap and batting stats are counted from it by the pitch store
         final_x = self.game.ball[0]
         final_y = self.game.ball[1]
-        
-        # Record attempt if player swung
-        if self.game.swing_started > 0:
-            self.game.field_renderer.record_attempt(final_x, final_y)
+        self.game.pitch_store.record_pitch(
+            pitcher=self.game.current_pitcher.name, pitch_key=self.game.pitch_chosen, pitch_type=self.pitchtype,
+            prev_pitch=self.new_data_entry['PrevPitch'], balls=self.new_data_entry['Balls'],
+            strikes=self.new_data_entry['Strikes'], outs=self.new_data_entry['Outs'],
+            handedness=self.new_data_entry['Handedness'], runner_first=self.new_data_entry['RunnerFirst'],
+            runner_second=self.new_data_entry['RunnerSecond'], runner_third=self.new_data_entry['RunnerThird'],
+            first_x=self.new_entry['FirstX'], first_y=self.new_entry['FirstY'],
+            second_x=self.new_entry['SecondX'], second_y=self.new_entry['SecondY'],
+            final_x=final_x, final_y=final_y, zone=self.game.field_renderer.get_zone_segment(final_x, final_y),
+            outcome=self.outcome, swung=self.game.swing_started > 0, hit=self.is_hit, at_bat=self.is_at_bat,
+            called_strike=self.new_entry['called_strike'], foul=self.new_entry['foul'],
+            swinging_strike=self.new_entry['swinging_strike'], ball=self.new_entry['ball'],
+            in_zone=self.new_entry['in_zone'])
             
-        # Record hit if it was a successful hit
-        if self.is_hit:
-            self.game.field_renderer.record_hit(final_x, final_y)
-            
-        # Save data periodically (every 10 pitches) to prevent too frequent saves
-        if self.game.field_renderer.total_pitches % 10 == 0:
-            self.game.field_renderer.save_data()
-        
-        # Update records
-        if self.game.records.empty:
-            self.game.records = pd.DataFrame([self.new_entry])
-        else:
-            self.game.records = pd.concat([self.game.records, pd.DataFrame([self.new_entry])], ignore_index=True)
-            
-        # Update pitch trajectory colors
-        if self.game.last_pitch_information:
-            last_ball = self.game.last_pitch_information[-1]
-            for pitch in self.game.last_pitch_information:
-                if pitch[0] == last_ball[0] and pitch[1] == last_ball[1]:
-                    pitch[3] = last_ball[3]
-                    
+        # The pitch's trail, as the parameters it is regenerated from
+        self.game.last_pitch_information = TrajectoryRecord(
+            self.release_point, self.vx, self.vy, self.ax, self.ay, self.traveltime,
+            stop_ms=self.ball_stop_ms, duration_ms=self.trail_end_ms, fps=self.engine_fps,
+            status=self.trail_status)
+
         # Update data and AI
         self.game.last_pitch_type_thrown = self.pitchtype
-        self.game.pitchDataManager.insert_row(self.new_data_entry)
         
         new_state = (self.game.currentouts, self.game.currentstrikes, self.game.currentballs,
                     self.game.scoreKeeper.get_runners_on_base(), self.game.hits, self.game.scoreKeeper.get_score())
         self.game.current_pitcher.get_ai().update(self.previous_state, self.game.pitch_chosen, 
                                                  new_state, self.game.outcome_value[self.outcome])
         self.game.current_state = new_state
-        self.game.pitch_trajectories.append(self.game.last_pitch_information)
-        self.game.pitches_display.append((self.game.ball[0], self.game.ball[1]))
         self.game.current_pitches += 1
 
-        # Create enhanced pitch record for visualization
-        if hasattr(self.game, 'enhanced_pitch_records'):
-            enhanced_record = EnhancedPitchRecord(
-                trajectory=self.game.last_pitch_information.copy(),
-                pitch_type=self.pitchtype,
-                velocity_mph=self._calculate_velocity_mph(),
-                outcome=self._get_outcome_display(),
-                final_location=(self.game.ball[0], self.game.ball[1]),
-                index=len(self.game.enhanced_pitch_records),
-                selected=False
-            )
-            self.game.enhanced_pitch_records.append(enhanced_record)
\ No newline at end of file
+        # Record the pitch for visualization
+        self.game.trajectory_store.add(
+            self.game.last_pitch_information,
+            pitch_type=self.pitchtype,
+            velocity_mph=self._calculate_velocity_mph(),
+            outcome=self._get_outcome_display(),
+            final_location=(self.game.ball[0], self.game.ball[1]))
\ No newline at end of file
@@ -0,0 +1,516 @@
+"""
+Pitch Store - Every pitch of every session in a local SQLite database.
+
+Pitches are queued from the frame loop and written by a background thread in
+batched transactions, so recording a pitch never waits on the disk. The
+pitches table is indexed on pitcher, pitch type, count, outcome, session and
+lap, and the query methods return SQL aggregates shaped for the heatmap, the
+scouting panel and the lap log.
+
+A lap is a stretch of batting that ends when the player records it; the open
+lap carries over from one launch to the next. Its totals are loaded with
+heatmap_counts() and pitch_count() when the store opens and kept up to date
+in memory as pitches are recorded, so the heatmap never queries on a frame.
+Batting stats and laps saved before the store existed are imported once by
+import_history() and shown as if they had been recorded here.
+
+Export pitches as CSV from the strikefactor directory:
+    python -m gameplay.pitch_store --csv pitches.csv
+"""
+
+import argparse
+import csv
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from config import get_path
+
+PITCH_COLUMNS = (
+    'session_id', 'lap', 'recorded_at', 'pitcher', 'pitch_key', 'pitch_type', 'prev_pitch',
+    'balls', 'strikes', 'outs', 'handedness', 'runner_first', 'runner_second', 'runner_third',
+    'first_x', 'first_y', 'second_x', 'second_y', 'final_x', 'final_y', 'zone',
+    'outcome', 'swung', 'hit', 'at_bat', 'called_strike', 'foul', 'swinging_strike', 'ball', 'in_zone',
+)
+
+# Yes/no columns, stored as 0/1 and written as 0 when a pitch leaves them out
+FLAG_COLUMNS = frozenset((
+    'runner_first', 'runner_second', 'runner_third', 'swung', 'hit', 'at_bat',
+    'called_strike', 'foul', 'swinging_strike', 'ball', 'in_zone',
+))
+
+# Strike zone segments of the heatmap (FieldRenderer.get_zone_segment)
+ZONES = 9
+
+# user_version of a database whose tables are current and whose old batting history is imported
+SCHEMA_VERSION = 2
+
+TABLES = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    mode TEXT
+);
+CREATE TABLE IF NOT EXISTS laps (
+    id INTEGER PRIMARY KEY,
+    number INTEGER,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    duration_seconds REAL,
+    hidden INTEGER NOT NULL DEFAULT 0,
+    -- Pitches and at-bats counted before the pitch store, imported from batting_stats.json
+    carried_pitches INTEGER NOT NULL DEFAULT 0,
+    carried_at_bats INTEGER NOT NULL DEFAULT 0
+);
+-- Hits and swings per zone counted before the pitch store
+CREATE TABLE IF NOT EXISTS lap_zones (
+    lap_id INTEGER NOT NULL REFERENCES laps(id),
+    zone INTEGER NOT NULL,
+    hits INTEGER NOT NULL,
+    swings INTEGER NOT NULL,
+    PRIMARY KEY (lap_id, zone)
+);
+CREATE TABLE IF NOT EXISTS pitches (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    lap INTEGER NOT NULL DEFAULT 0,
+    recorded_at REAL NOT NULL,
+    pitcher TEXT,
+    -- The pitcher's arsenal key ('FF_chase', 'SLD'); pitch_type is the pitch it throws ('FF', 'SL')
+    pitch_key TEXT,
+    pitch_type TEXT,
+    prev_pitch TEXT,
+    balls INTEGER,
+    strikes INTEGER,
+    outs INTEGER,
+    handedness TEXT,
+    runner_first INTEGER,
+    runner_second INTEGER,
+    runner_third INTEGER,
+    first_x REAL,
+    first_y REAL,
+    second_x REAL,
+    second_y REAL,
+    final_x REAL,
+    final_y REAL,
+    zone INTEGER,
+    outcome TEXT,
+    swung INTEGER,
+    hit INTEGER,
+    at_bat INTEGER NOT NULL DEFAULT 0,
+    called_strike INTEGER,
+    foul INTEGER,
+    swinging_strike INTEGER,
+    ball INTEGER,
+    in_zone INTEGER
+);
+"""
+
+INDEXES = """
+-- Covers pitch_type_summary() so the scouting panel never reads the table itself
+DROP INDEX IF EXISTS idx_pitches_pitcher;
+CREATE INDEX IF NOT EXISTS idx_pitches_arsenal
+    ON pitches(pitcher, pitch_key, pitch_type, ball, swinging_strike, swung, in_zone, hit);
+CREATE INDEX IF NOT EXISTS idx_pitches_pitch_type ON pitches(pitch_type);
+CREATE INDEX IF NOT EXISTS idx_pitches_count ON pitches(balls, strikes);
+CREATE INDEX IF NOT EXISTS idx_pitches_outcome ON pitches(outcome);
+CREATE INDEX IF NOT EXISTS idx_pitches_session ON pitches(session_id, lap);
+-- Covers the lap totals behind the heatmap and the lap log
+CREATE INDEX IF NOT EXISTS idx_pitches_lap ON pitches(lap, zone, swung, hit, at_bat);
+"""
+
+# Columns added since the first schema, with their definitions for ALTER TABLE
+ADDED_COLUMNS = {
+    'at_bat': 'INTEGER NOT NULL DEFAULT 0',
+    'pitch_key': 'TEXT',
+}
+
+# Columns the query methods accept as equality filters
+FILTER_COLUMNS = ('session_id', 'lap', 'pitcher', 'pitch_key', 'pitch_type', 'balls', 'strikes', 'outs', 'outcome',
+                  'zone', 'at_bat')
+
+
+def _where(filters: Dict) -> Tuple[str, list]:
+    """Build a WHERE clause from column=value filters, ignoring None values."""
+    clauses, params = [], []
+    for column, value in filters.items():
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f"Cannot filter pitches on '{column}'")
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def _empty_totals() -> dict:
+    """Batting totals of a lap with nothing in it, keyed as in FieldRenderer and the lap log."""
+    return {
+        'heatmap_data': [0] * ZONES,
+        'heatmap_attempts': [0] * ZONES,
+        'total_swings': 0,
+        'total_hits': 0,
+        'total_pitches': 0,
+        'total_at_bats': 0,
+    }
+
+
+class PitchStore:
+    """SQLite pitch-by-pitch store with a write-behind writer thread."""
+
+    def __init__(self, db_path: str = None, batch_size: int = 64, flush_interval: float = 1.0):
+        """
+        Args:
+            db_path: SQLite database file (default: data/pitches.db)
+            batch_size: Pitches written per transaction at most
+            flush_interval: Seconds a queued pitch may wait before it is written
+        """
+        self.db_path = db_path or get_path("data/pitches.db")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.session_id = None
+        self.session_started_at = time.time()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._conn = self._connect()
+        self._conn.executescript(TABLES)
+        self._upgrade()
+        self._conn.executescript(INDEXES)
+
+        self.lap, self._lap_started_at = self._open_lap()
+        self.lap_totals = self.load_lap_totals(self.lap)
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="pitch-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL lets the frame loop read while the writer thread commits
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _upgrade(self):
+        """Bring a database from an older version of the game up to the current tables."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(pitches)")}
+        with self._conn:
+            for column, definition in ADDED_COLUMNS.items():
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE pitches ADD COLUMN {column} {definition}")
+            if self.schema_version < 1:
+                # Lap numbers used to restart every session, and those pitches are already counted in the
+                # batting_stats.json that import_history() carries over, so they join no lap
+                self._conn.execute("UPDATE pitches SET lap = 0")
+                self._conn.execute("PRAGMA user_version = 1")
+
+    @property
+    def schema_version(self) -> int:
+        return self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+    @property
+    def needs_history_import(self) -> bool:
+        """True until import_history() has run on this database."""
+        return self.schema_version < SCHEMA_VERSION
+
+    def _open_lap(self) -> Tuple[int, float]:
+        """Get the id and start time of the lap pitches are recorded into, starting one if none is open."""
+        row = self._conn.execute(
+            "SELECT id, started_at FROM laps WHERE ended_at IS NULL ORDER BY id DESC LIMIT 1").fetchone()
+        if row is not None:
+            return row
+        with self._conn:
+            started_at = time.time()
+            cursor = self._conn.execute("INSERT INTO laps (started_at) VALUES (?)", (started_at,))
+        return cursor.lastrowid, started_at
+
+    # ==================== Writing ====================
+
+    def start_session(self, mode: str = None) -> int:
+        """Start a new session; pitches recorded from now on belong to it."""
+        self.flush()
+        self.session_started_at = time.time()
+        with self._conn:
+            cursor = self._conn.execute("INSERT INTO sessions (started_at, mode) VALUES (?, ?)",
+                                        (self.session_started_at, mode))
+        self.session_id = cursor.lastrowid
+        return self.session_id
+
+    def record_pitch(self, **values):
+        """Queue one pitch for writing and count it in the open lap; keys are PITCH_COLUMNS names."""
+        if self.session_id is None:
+            self.start_session()
+        values.setdefault('session_id', self.session_id)
+        values.setdefault('lap', self.lap)
+        values.setdefault('recorded_at', time.time())
+        row = tuple(values.get(column, 0 if column in FLAG_COLUMNS else None) for column in PITCH_COLUMNS)
+        self._queue.put(row)
+
+        if values['lap'] == self.lap:
+            self._count(values)
+
+    def _count(self, pitch: dict):
+        """Add a pitch to the open lap's totals, the same way load_lap_totals() counts the table."""
+        totals = self.lap_totals
+        totals['total_pitches'] += 1
+        totals['total_at_bats'] += bool(pitch.get('at_bat'))
+        zone = pitch.get('zone')
+        if zone is not None and 0 <= zone < ZONES:
+            swung, hit = bool(pitch.get('swung')), bool(pitch.get('hit'))
+            totals['heatmap_attempts'][zone] += swung
+            totals['heatmap_data'][zone] += hit
+            totals['total_swings'] += swung
+            totals['total_hits'] += hit
+
+    def _write_loop(self):
+        """Drain the queue in batches, one transaction per batch."""
+        conn = self._connect()
+        insert = f"INSERT INTO pitches ({', '.join(PITCH_COLUMNS)}) VALUES ({', '.join('?' * len(PITCH_COLUMNS))})"
+        running = True
+        while running:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            rows = [row for row in batch if row is not None]
+            running = len(rows) == len(batch)
+            if rows:
+                try:
+                    with conn:
+                        conn.executemany(insert, rows)
+                except sqlite3.Error as e:
+                    print(f"Failed to write {len(rows)} pitches: {e}")
+            for _ in batch:
+                self._queue.task_done()
+        conn.close()
+
+    def flush(self):
+        """Block until every queued pitch has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Write any queued pitches and close the database."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self._conn.close()
+
+    # ==================== Laps ====================
+
+    def close_lap(self) -> dict:
+        """
+        Record the open lap in the lap log and start the next one.
+
+        Returns:
+            The recorded lap, shaped like the entries of lap_summaries()
+        """
+        ended_at = time.time()
+        # Like the lap timer before the store, a lap's duration only counts time since the game started
+        duration = ended_at - max(self._lap_started_at, self.session_started_at)
+        with self._conn:
+            number = self._conn.execute(
+                "SELECT COALESCE(MAX(number), 0) + 1 FROM laps WHERE ended_at IS NOT NULL AND hidden = 0").fetchone()[0]
+            self._conn.execute("UPDATE laps SET number = ?, ended_at = ?, duration_seconds = ? WHERE id = ?",
+                               (number, ended_at, duration, self.lap))
+            cursor = self._conn.execute("INSERT INTO laps (started_at) VALUES (?)", (ended_at,))
+
+        lap = self._lap_entry(number, ended_at, duration, self.lap_totals)
+        self.lap, self._lap_started_at = cursor.lastrowid, ended_at
+        self.lap_totals = _empty_totals()
+        return lap
+
+    def clear_laps(self):
+        """Hide every recorded lap from the lap log; their pitches stay in the store."""
+        with self._conn:
+            self._conn.execute("UPDATE laps SET hidden = 1 WHERE ended_at IS NOT NULL")
+
+    def import_history(self, laps: List[dict], current: Optional[dict] = None):
+        """
+        Carry over batting stats saved before the pitch store, once per database.
+
+        Args:
+            laps: Lap entries of the old lap history, oldest first
+            current: The old batting_stats.json totals, which become part of the open lap
+        """
+        if not self.needs_history_import:
+            return
+        self.flush()
+        with self._conn:
+            for lap in laps:
+                ended_at = datetime.fromisoformat(lap['timestamp']).timestamp()
+                duration = lap.get('duration_seconds', 0.0)
+                cursor = self._conn.execute(
+                    "INSERT INTO laps (number, started_at, ended_at, duration_seconds, carried_pitches, carried_at_bats)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (lap.get('lap_number'), ended_at - duration, ended_at, duration,
+                     lap.get('total_pitches', 0), lap.get('total_at_bats', 0)))
+                self._insert_lap_zones(cursor.lastrowid, lap)
+
+            # The open lap moves after the imported ones, keeping any pitches already in it
+            current = current or {}
+            cursor = self._conn.execute(
+                "INSERT INTO laps (started_at, carried_pitches, carried_at_bats) VALUES (?, ?, ?)",
+                (self._lap_started_at, current.get('total_pitches', 0), current.get('total_at_bats', 0)))
+            self._insert_lap_zones(cursor.lastrowid, current)
+            self._conn.execute("UPDATE pitches SET lap = ? WHERE lap = ?", (cursor.lastrowid, self.lap))
+            self._conn.execute("DELETE FROM laps WHERE id = ?", (self.lap,))
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        self.lap = cursor.lastrowid
+        self.lap_totals = self.load_lap_totals(self.lap)
+
+    def _insert_lap_zones(self, lap_id: int, stats: dict):
+        hits = stats.get('heatmap_data') or [0] * ZONES
+        swings = stats.get('heatmap_attempts') or [0] * ZONES
+        self._conn.executemany("INSERT INTO lap_zones (lap_id, zone, hits, swings) VALUES (?, ?, ?, ?)",
+                               [(lap_id, zone, hits[zone], swings[zone]) for zone in range(ZONES)
+                                if hits[zone] or swings[zone]])
+
+    @staticmethod
+    def _lap_entry(number: int, ended_at: float, duration: float, totals: dict) -> dict:
+        at_bats = totals['total_at_bats']
+        return {
+            'lap_number': number,
+            'timestamp': datetime.fromtimestamp(ended_at).isoformat(),
+            'heatmap_data': list(totals['heatmap_data']),
+            'heatmap_attempts': list(totals['heatmap_attempts']),
+            'total_swings': totals['total_swings'],
+            'total_hits': totals['total_hits'],
+            'total_pitches': totals['total_pitches'],
+            'total_at_bats': at_bats,
+            'batting_average': round(totals['total_hits'] / at_bats, 3) if at_bats else 0.0,
+            'duration_seconds': duration,
+        }
+
+    # ==================== Queries ====================
+
+    def _query(self, sql: str, params=()) -> List[tuple]:
+        return self._conn.execute(sql, params).fetchall()
+
+    def pitch_count(self, **filters) -> int:
+        """Number of pitches matching the filters."""
+        where, params = _where(filters)
+        return self._query(f"SELECT COUNT(*) FROM pitches{where}", params)[0][0]
+
+    def outcome_counts(self, **filters) -> Dict[str, int]:
+        """Pitches per outcome matching the filters."""
+        where, params = _where(filters)
+        rows = self._query(f"SELECT outcome, COUNT(*) FROM pitches{where} GROUP BY outcome", params)
+        return dict(rows)
+
+    def heatmap_counts(self, **filters) -> Tuple[List[int], List[int]]:
+        """Hits and swings per strike zone segment, as FieldRenderer's heatmap_data and heatmap_attempts."""
+        where, params = _where(filters)
+        where += (" AND " if where else " WHERE ") + f"zone BETWEEN 0 AND {ZONES - 1}"
+        hits, attempts = [0] * ZONES, [0] * ZONES
+        rows = self._query(f"SELECT zone, SUM(hit), SUM(swung) FROM pitches{where} GROUP BY zone", params)
+        for zone, zone_hits, zone_swings in rows:
+            hits[zone], attempts[zone] = zone_hits, zone_swings
+        return hits, attempts
+
+    def load_lap_totals(self, lap: int) -> dict:
+        """
+        Batting totals of one lap, including any carried over from before the store.
+
+        Swings and hits only count in the strike zone, as the heatmap always counted them;
+        pitches and at-bats count everywhere.
+        """
+        totals = _empty_totals()
+        hits, attempts = self.heatmap_counts(lap=lap)
+        for zone, zone_hits, zone_swings in self._query(
+                "SELECT zone, hits, swings FROM lap_zones WHERE lap_id = ?", (lap,)):
+            hits[zone] += zone_hits
+            attempts[zone] += zone_swings
+        carried_pitches, carried_at_bats = self._query(
+            "SELECT carried_pitches, carried_at_bats FROM laps WHERE id = ?", (lap,))[0]
+
+        totals['heatmap_data'], totals['heatmap_attempts'] = hits, attempts
+        totals['total_hits'], totals['total_swings'] = sum(hits), sum(attempts)
+        totals['total_pitches'] = self.pitch_count(lap=lap) + carried_pitches
+        totals['total_at_bats'] = self.pitch_count(lap=lap, at_bat=1) + carried_at_bats
+        return totals
+
+    def lap_summaries(self, limit: Optional[int] = None) -> List[dict]:
+        """The recorded laps still in the lap log, oldest first; only the last `limit` if given."""
+        self.flush()
+        rows = self._query(
+            "SELECT id, number, ended_at, duration_seconds FROM laps WHERE ended_at IS NOT NULL AND hidden = 0"
+            " ORDER BY id DESC LIMIT ?", (-1 if limit is None else limit,))
+        return [self._lap_entry(number, ended_at, duration, self.load_lap_totals(lap))
+                for lap, number, ended_at, duration in reversed(rows)]
+
+    def pitch_type_summary(self, pitcher: str, **filters) -> Dict[str, dict]:
+        """
+        Usage, strike, whiff and in-zone rates per arsenal pitch for one pitcher.
+
+        Keyed by the pitcher's arsenal keys (Pitcher.get_pitch_names()); pitches recorded before
+        the arsenal key was stored are keyed by their pitch type.
+        """
+        where, params = _where(dict(filters, pitcher=pitcher))
+        rows = self._query(
+            "SELECT COALESCE(pitch_key, pitch_type) AS pitch, COUNT(*), SUM(ball = 0), SUM(swinging_strike),"
+            f" SUM(swung), SUM(in_zone), SUM(hit) FROM pitches{where} GROUP BY pitch", params)
+        total = sum(row[1] for row in rows)
+        return {
+            pitch_type: {
+                'pitches': count,
+                'usage': count / total,
+                'strike_pct': strikes / count * 100,
+                'whiff_pct': whiffs / swings * 100 if swings else 0.0,
+                'in_zone_pct': in_zone / count * 100,
+                'hits': hits,
+            }
+            for pitch_type, count, strikes, whiffs, swings, in_zone, hits in rows
+        }
+
+    def export_csv(self, path: str, **filters) -> int:
+        """
+        Write the pitches matching the filters to a CSV file with a header row.
+
+        Returns:
+            Number of pitches written
+        """
+        self.flush()
+        where, params = _where(filters)
+        cursor = self._conn.execute(f"SELECT {', '.join(PITCH_COLUMNS)} FROM pitches{where} ORDER BY id", params)
+        count = 0
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(PITCH_COLUMNS)
+            for row in cursor:
+                writer.writerow(row)
+                count += 1
+        return count
+
+    def to_dataframe(self, **filters):
+        """The pitches matching the filters as a pandas DataFrame, one column per PITCH_COLUMNS name."""
+        import pandas as pd
+        self.flush()
+        where, params = _where(filters)
+        return pd.read_sql_query(f"SELECT {', '.join(PITCH_COLUMNS)} FROM pitches{where} ORDER BY id",
+                                 self._conn, params=params)
+
+
+def main():
+    """Export the pitch store as CSV."""
+    parser = argparse.ArgumentParser(description="Export recorded pitches")
+    parser.add_argument("--db", default=None, help="Pitch database (default: data/pitches.db)")
+    parser.add_argument("--csv", required=True, help="CSV file to write")
+    parser.add_argument("--pitcher", default=None, help="Only this pitcher's pitches")
+    parser.add_argument("--session", type=int, default=None, help="Only this session's pitches")
+    args = parser.parse_args()
+
+    store = PitchStore(args.db)
+    count = store.export_csv(args.csv, pitcher=args.pitcher, session_id=args.session)
+    store.close()
+    print(f"✓ Exported {count} pitches to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
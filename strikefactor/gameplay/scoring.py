@@ -0,0 +1,137 @@
+"""
+Scoring - Base runners and run scoring for a half-inning.
+Kept free of pygame so headless simulations and training can use it.
+"""
+
+import random
+
+# Runner class
+class Runner:
+
+    # 0 = Home plate, 1 = First base, 2 = Second base, 3 = Third base
+    onBase = False
+    base = 0
+
+    def __init__(self, hit_type):
+        self.base = hit_type
+        if hit_type == 4:
+            self.onBase = False
+            self.scored = True
+        else:
+            self.onBase = True
+            self.scored = False
+        self.speed = random.randint(1, 3)
+
+    def walk(self):
+        self.base += 1
+        if self.base > 3:
+            self.scored = True
+            self.onBase = False
+
+    def advance(self, hit):
+        self.base += hit
+        if self.base > 3:
+            self.scored = True
+            self.onBase = False
+
+    def extraBases(self, hit):
+        self.base += hit + 1
+        if self.base > 3:
+            self.scored = True
+            self.onBase = False
+
+
+# Base states are 3-bit masks: bit 0 = first base, bit 1 = second, bit 2 = third
+BASE_STATES = 8
+MAX_OUTS = 3
+
+# Events index the transition tables; hits use their base count like Runner(hit_type)
+WALK = 0
+SINGLE = 1
+DOUBLE = 2
+TRIPLE = 3
+HOME_RUN = 4
+
+
+def _hit_transition(bases, hit_type):
+    """Every runner and the batter advance hit_type bases."""
+    advanced = (bases << hit_type) | (1 << (hit_type - 1))
+    return advanced & 0b111, bin(advanced >> 3).count("1")
+
+
+def _walk_transition(bases):
+    """The batter takes first and only forced runners move up one base."""
+    open_base = 1
+    while open_base & bases:
+        open_base <<= 1
+    advanced = bases | open_base
+    return advanced & 0b111, advanced >> 3
+
+
+# TRANSITIONS[event][bases] -> (new bases, runs scored)
+TRANSITIONS = tuple(
+    tuple(_walk_transition(bases) if event == WALK else _hit_transition(bases, event)
+          for bases in range(BASE_STATES))
+    for event in (WALK, SINGLE, DOUBLE, TRIPLE, HOME_RUN)
+)
+
+# Runners on base for each base state
+RUNNER_COUNTS = tuple(bin(bases).count("1") for bases in range(BASE_STATES))
+
+# Base colours drawn by the FieldRenderer for each base state
+BASE_COLORS = tuple(
+    tuple('yellow' if bases & (1 << base) else 'white' for base in range(3))
+    for bases in range(BASE_STATES)
+)
+
+
+def base_out_state(bases, outs):
+    """Encode bases and outs as one of the 24 base-out states."""
+    return outs * BASE_STATES + bases
+
+
+def split_base_out_state(state):
+    """Decode a base-out state into (bases, outs)."""
+    return state % BASE_STATES, state // BASE_STATES
+
+
+# Scorekeeper class
+class ScoreKeeper:
+    """Tracks bases as a bitmask and advances them through the TRANSITIONS tables."""
+
+    def __init__(self):
+        self.base_state = 0
+        self.score = 0
+
+    def _apply(self, event):
+        self.base_state, scored = TRANSITIONS[event][self.base_state]
+        self.score += scored
+        return scored
+
+    # Takes in hit_type, then returns tuple of (bases, score)
+    def update_hit_event(self, hit_type):
+        scored = self._apply(hit_type)
+        return (BASE_COLORS[self.base_state], scored)
+
+    def update_walk_event(self):
+        self._apply(WALK)
+
+    def place_runner(self, base):
+        """Put a runner on a base (1-3) without scoring, e.g. when setting up a scenario."""
+        self.base_state |= 1 << (base - 1)
+
+    def get_bases(self):
+        return BASE_COLORS[self.base_state]
+
+    def isRunnerOnBase(self, base):
+        return bool(self.base_state & (1 << (base - 1)))
+
+    def get_score(self):
+        return self.score
+
+    def reset(self):
+        self.base_state = 0
+        self.score = 0
+
+    def get_runners_on_base(self):
+        return RUNNER_COUNTS[self.base_state]
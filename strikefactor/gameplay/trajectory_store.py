@@ -0,0 +1,306 @@
+"""
+Trajectory Store - Pitch trajectories of the session, kept as flight parameters.
+
+A pitch's trail is fully determined by its flight (release point, velocity,
+break and travel time), the engine rate it was sampled at, when the ball
+stopped moving (at the plate, or where it was hit) and how the pitch ended.
+PitchSimulation records those as a TrajectoryRecord, and the store keeps each
+pitch as one 64-byte row of RECORD_DTYPE next to its EnhancedPitchRecord for
+PitchViz.
+
+A record's trajectory is a StoredTrajectory: its length is known from the
+row, and indexing or iterating it regenerates the [x, y, size, color, status]
+points with one vectorized pass over the flight. The points of the
+`capacity` most recently drawn pitches are cached so PitchViz and the
+trajectory overlay redraw them without regenerating.
+"""
+
+import sys
+from collections import OrderedDict
+from typing import List
+import numpy as np
+from helpers import EnhancedPitchRecord
+from utils.physics import precompute_pitch_flight, precompute_pitch_flights
+
+# Pitches whose points stay cached unless the settings say otherwise
+DEFAULT_CAPACITY = 50
+
+# Trail point colors by status; points are white until the ball arrives or stops
+TRAIL_COLORS = {
+    '': (255, 255, 255),
+    'out': (198, 169, 251),
+    'hit': (71, 204, 252),
+    'strike': (227, 75, 80),
+    'ball': (75, 227, 148),
+}
+TRAIL_STATUSES = tuple(TRAIL_COLORS)
+
+# Marker size of points after the ball arrives (game.fourseamballsize)
+ARRIVED_SIZE = 11
+
+# One recorded pitch
+RECORD_DTYPE = np.dtype([
+    ('release_x', '<f4'),
+    ('release_y', '<f4'),
+    ('vx', '<f8'),
+    ('vy', '<f8'),
+    ('ax', '<f8'),
+    ('ay', '<f8'),
+    ('traveltime', '<f8'),
+    ('stop_ms', '<f4'),
+    ('duration_ms', '<f4'),
+    ('fps', '<f4'),
+    ('status', 'u1'),
+    ('padding', 'V3'),
+])
+
+
+class TrajectoryRecord:
+    """A pitch's trail as the parameters that generate it."""
+
+    __slots__ = ('release_x', 'release_y', 'vx', 'vy', 'ax', 'ay', 'traveltime',
+                 'stop_ms', 'duration_ms', 'fps', 'status')
+
+    def __init__(self, release_point, vx, vy, ax, ay, traveltime, stop_ms, duration_ms, fps, status=''):
+        """
+        Args:
+            release_point: (x, y) the pitch was released from
+            vx, vy, ax, ay, traveltime: The pitch's flight
+            stop_ms: Milliseconds after release the ball stopped moving (reached the plate or was hit)
+            duration_ms: Milliseconds after release of the last trail point
+            fps: Engine rate the trail was sampled at
+            status: How the pitch ended, one of TRAIL_STATUSES
+        """
+        self.release_x = release_point[0]
+        self.release_y = release_point[1]
+        self.vx = vx
+        self.vy = vy
+        self.ax = ax
+        self.ay = ay
+        self.traveltime = traveltime
+        self.stop_ms = stop_ms
+        self.duration_ms = duration_ms
+        self.fps = fps
+        self.status = status
+
+    def __len__(self):
+        return int(self.duration_ms * self.fps / 1000) + 1 if self.duration_ms >= 0 else 0
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __getitem__(self, i):
+        return self.points()[i]
+
+    def __iter__(self):
+        return iter(self.points())
+
+    def points(self) -> list:
+        """
+        Regenerate the trail.
+
+        Returns:
+            List of [x, y, size, color, status] points, one per engine step from release
+        """
+        return self.points_along(precompute_pitch_flight((self.release_x, self.release_y), self.vx, self.vy,
+                                                         self.ax, self.ay, self.traveltime))
+
+    def points_along(self, flight) -> list:
+        """Regenerate the trail from the pitch's flight table (see utils.physics.precompute_pitch_flight)."""
+        times = np.arange(len(self)) * (1000 / self.fps)
+        ball_times = np.minimum(times, self.stop_ms)
+        x = np.interp(ball_times, flight[:, 0], flight[:, 1])
+        y = np.interp(ball_times, flight[:, 0], flight[:, 2])
+        arrived = times > self.traveltime
+        sizes = np.where(arrived, ARRIVED_SIZE, np.interp(ball_times, flight[:, 0], flight[:, 4]))
+        # Points where the ball came to rest take the outcome's color, as does everything after arrival
+        colored = arrived | (times >= self.stop_ms)
+
+        white, color = TRAIL_COLORS[''], TRAIL_COLORS[self.status]
+        return [
+            [x_, y_, size, color if is_colored else white, self.status if has_arrived else '']
+            for x_, y_, size, is_colored, has_arrived in zip(x.tolist(), y.tolist(), sizes.tolist(),
+                                                            colored.tolist(), arrived.tolist())
+        ]
+
+    def to_row(self) -> tuple:
+        """Pack into a RECORD_DTYPE row."""
+        return (self.release_x, self.release_y, self.vx, self.vy, self.ax, self.ay, self.traveltime,
+                self.stop_ms, self.duration_ms, self.fps, TRAIL_STATUSES.index(self.status), b'')
+
+    @classmethod
+    def from_row(cls, row) -> 'TrajectoryRecord':
+        """Unpack a RECORD_DTYPE row."""
+        (release_x, release_y, vx, vy, ax, ay, traveltime,
+         stop_ms, duration_ms, fps, status, _) = row.tolist()
+        return cls((release_x, release_y), vx, vy, ax, ay, traveltime, stop_ms, duration_ms, fps,
+                   TRAIL_STATUSES[status])
+
+
+class StoredTrajectory:
+    """A stored pitch's trail, regenerated from its row when it is not cached."""
+
+    __slots__ = ('store', 'index', 'length')
+
+    def __init__(self, store: 'TrajectoryStore', index: int, length: int):
+        self.store = store
+        self.index = index
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    def __getitem__(self, i):
+        return self.store.load(self.index)[i]
+
+    def __iter__(self):
+        return iter(self.store.load(self.index))
+
+    def copy(self) -> list:
+        return list(self.store.load(self.index))
+
+
+class TrajectoryStore:
+    """Pitch records of a session, with the points of recently drawn pitches cached."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Pitches whose regenerated points are cached
+        """
+        self.capacity = max(1, capacity)
+        self.records: List[EnhancedPitchRecord] = []
+        self.final_locations = []  # (x, y) of every pitch at the plate
+        self.overlay_start = 0     # First pitch of the trajectory overlay
+        self._rows = np.zeros(64, dtype=RECORD_DTYPE)
+        self._cached = OrderedDict()  # index -> points, least recently used first
+        self._cached_bytes = {}       # index -> estimated size in memory
+        self.regenerated = 0
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        """Iterate over the trajectories of every pitch, oldest first."""
+        return (record.trajectory for record in self.records)
+
+    def add(self, trajectory: TrajectoryRecord, pitch_type: str, velocity_mph: float, outcome: str,
+            final_location) -> EnhancedPitchRecord:
+        """
+        Record a finished pitch.
+
+        Args:
+            trajectory: The pitch's trail parameters
+            pitch_type: Pitch type, e.g. 'FF'
+            velocity_mph: Pitch speed
+            outcome: Outcome as shown in PitchViz
+            final_location: (x, y) at the plate
+
+        Returns:
+            The pitch's record
+        """
+        index = len(self.records)
+        if index == len(self._rows):
+            self._rows = np.concatenate((self._rows, np.zeros(len(self._rows), dtype=RECORD_DTYPE)))
+        self._rows[index] = trajectory.to_row()
+
+        record = EnhancedPitchRecord(
+            trajectory=StoredTrajectory(self, index, len(trajectory)),
+            pitch_type=pitch_type,
+            velocity_mph=velocity_mph,
+            outcome=outcome,
+            final_location=final_location,
+            index=index,
+            selected=False
+        )
+        self.records.append(record)
+        self.final_locations.append(final_location)
+        return record
+
+    def trajectory_record(self, index: int) -> TrajectoryRecord:
+        """Get the parameters a pitch's trail is generated from."""
+        return TrajectoryRecord.from_row(self._rows[index])
+
+    def load(self, index: int) -> list:
+        """Get a pitch's points, regenerating them if they are not cached."""
+        return self.load_many([index])[0]
+
+    def load_many(self, indices: List[int]) -> List[list]:
+        """Get several pitches' points, integrating the flights of the ones not cached together."""
+        missing = [index for index in dict.fromkeys(indices) if index not in self._cached]
+        if missing:
+            records = [self.trajectory_record(index) for index in missing]
+            flights = precompute_pitch_flights(
+                [(record.release_x, record.release_y) for record in records],
+                *np.array([(record.vx, record.vy, record.ax, record.ay, record.traveltime)
+                           for record in records]).T)
+            for index, record, flight in zip(missing, records, flights):
+                points = record.points_along(flight)
+                self._cached[index] = points
+                self._cached_bytes[index] = _points_bytes(points)
+            self.regenerated += len(missing)
+
+        loaded = []
+        for index in indices:
+            self._cached.move_to_end(index)
+            loaded.append(self._cached[index])
+        # Only now, so every pitch asked for is returned even when there are more than capacity
+        self._evict()
+        return loaded
+
+    def _evict(self):
+        while len(self._cached) > self.capacity:
+            evicted, _ = self._cached.popitem(last=False)
+            del self._cached_bytes[evicted]
+
+    def overlay_trajectories(self) -> list:
+        """Points of every pitch from overlay_start on, oldest first, for the trajectory overlay."""
+        indices = range(self.overlay_start, len(self.records))
+        trajectories = []
+        # In batches of `capacity`, so one batch's flights are integrated together and fit the cache
+        for start in range(0, len(indices), self.capacity):
+            trajectories.extend(self.load_many(list(indices[start:start + self.capacity])))
+        return trajectories
+
+    def restart_overlay(self):
+        """Start the trajectory overlay over from the next pitch; PitchViz keeps the whole session."""
+        self.overlay_start = len(self.records)
+
+    def clear(self):
+        """Forget every pitch."""
+        self.records = []
+        self.final_locations = []
+        self.overlay_start = 0
+        self._cached.clear()
+        self._cached_bytes.clear()
+
+    # ==================== Statistics ====================
+
+    def get_stats(self) -> dict:
+        """Get how many pitches are stored and cached, and the memory they hold."""
+        return {
+            'pitches': len(self.records),
+            'record_bytes': len(self.records) * RECORD_DTYPE.itemsize,
+            'cached': len(self._cached),
+            'capacity': self.capacity,
+            'cached_bytes': sum(self._cached_bytes.values()),
+            'regenerated': self.regenerated,
+        }
+
+    def print_stats(self):
+        """Print how many pitches are stored and cached, and the memory they hold."""
+        stats = self.get_stats()
+        print(f"Trajectories: {stats['pitches']} pitches ({stats['record_bytes'] / 1024:.1f} KiB), "
+              f"{stats['cached']}/{stats['capacity']} cached as points ({stats['cached_bytes'] / 1024:.0f} KiB), "
+              f"{stats['regenerated']} regenerated")
+
+
+def _points_bytes(points: list) -> int:
+    """Approximate memory held by a trail; colors and statuses are shared constants and not counted."""
+    total = sys.getsizeof(points)
+    for point in points:
+        total += sys.getsizeof(point) + sum(sys.getsizeof(value) for value in point[:3])
+    return total
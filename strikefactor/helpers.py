@@ -11,7 +11,8 @@ from pygame_gui.elements.ui_label import UILabel
 from pygame_gui.elements.ui_scrolling_container import UIScrollingContainer
 from pygame_gui.core import ObjectID
 from pygame_gui.elements.ui_horizontal_slider import UIHorizontalSlider
-import pandas as pd
+from gameplay.scoring import Runner, ScoreKeeper
+from engine.sprite_cache import BallSpriteCache, ball_scale
 
 
 # Pitch type display name mapping
@@ -45,7 +46,7 @@ OUTCOME_COLORS = {
 @dataclass
 class EnhancedPitchRecord:
     """Data class for enhanced pitch information with metadata."""
-    trajectory: list                    # Frame-by-frame trajectory data
+    trajectory: list                    # Frame-by-frame trajectory data (a StoredTrajectory once recorded)
     pitch_type: str                     # e.g., 'FF', 'SL', 'CB'
     velocity_mph: float                 # Calculated from travel time
     outcome: str                        # 'STRIKE', 'BALL', 'SINGLE', 'FLYOUT', etc.
@@ -89,111 +90,6 @@ class Button():
 
         return action
     
-# Runner class
-class Runner:
-
-    # 0 = Home plate, 1 = First base, 2 = Second base, 3 = Third base
-    onBase = False
-    base = 0
-
-    def __init__(self, hit_type):
-        self.base = hit_type
-        if hit_type == 4:
-            self.onBase = False
-            self.scored = True
-        else:
-            self.onBase = True
-            self.scored = False
-        self.speed = random.randint(1, 3)
-
-    def walk(self):
-        self.base += 1
-        if self.base > 3:
-            self.scored = True
-            self.onBase = False
-
-    def advance(self, hit):
-        self.base += hit
-        if self.base > 3:
-            self.scored = True
-            self.onBase = False
-
-    def extraBases(self, hit):
-        self.base += hit + 1
-        if self.base > 3:
-            self.scored = True
-            self.onBase = False
-
-# Scorekeeper class
-class ScoreKeeper:
-
-    def __init__(self):
-        self.runners = []
-        self.bases = ['white', 'white', 'white']
-        self.basesfilled = {1: 0, 2: 0, 3: 0}
-        self.score = 0
-
-    # Takes in hit_type, then returns tuple of (bases, score)
-    def update_hit_event(self, hit_type):
-        batter = Runner(hit_type)
-        self.runners.append(batter)
-        basesFilled = ['white', 'white', 'white']
-        scored = 0
-        for runner in self.runners[:]:
-            if runner != batter:
-                self.basesfilled[runner.base] = 0
-                runner.advance(hit_type)
-            if runner.scored:
-                self.runners.remove(runner)
-                scored += 1
-            else:
-                basesFilled[runner.base - 1] = 'yellow'
-                self.basesfilled[runner.base] = runner
-        self.score += scored
-        self.bases = basesFilled
-        self.basesfilled[batter.base] = batter
-        return (basesFilled, scored)
-
-    def updateScored(self):
-        for runner in self.runners[:]:
-            if runner.scored:
-                self.runners.remove(runner)
-                self.score += 1
-
-    def update_walk_event(self):
-        batter = Runner(1)
-        self.runners.append(batter)
-        prevrunner = batter
-        base = 1
-        while base < 4 and self.basesfilled[base] != 0 :
-            currRunner = self.basesfilled[base]
-            self.basesfilled[base].walk()
-            self.basesfilled[base] = prevrunner
-            prevrunner = currRunner
-            base += 1
-        self.basesfilled[base] = prevrunner
-        self.bases = ['white' if base == 0
-                            else 'yellow' for base in self.basesfilled.values()]
-        self.updateScored()
-
-    def get_bases(self):
-        return self.bases
-    
-    def isRunnerOnBase(self, base):
-        return self.basesfilled[base] != 0
-
-    def get_score(self):
-        return self.score
-
-    def reset(self):
-        self.runners = []
-        self.bases = ['white', 'white', 'white']
-        self.basesfilled = {1: 0, 2: 0, 3: 0}
-        self.score = 0
-
-    def get_runners_on_base(self):
-        return len(self.runners)
-
 # Data Visualisation Window Class - Enhanced with pitch history and overlay
 class StatSwing(UIWindow):
     """Enhanced pitch visualization window with filtering, selection, and trajectory overlay."""
@@ -231,6 +127,7 @@ class StatSwing(UIWindow):
         self.pitch_records: List[EnhancedPitchRecord] = []
         self.filtered_records: List[EnhancedPitchRecord] = []
         self.selected_records: List[EnhancedPitchRecord] = []
+        self.selected_trajectories: List[list] = []  # Points of each selected record, loaded on selection
         self.current_filter = 'All'
 
         # Animation state
@@ -433,6 +330,7 @@ class StatSwing(UIWindow):
     def _update_selected_records(self):
         """Update the list of selected records and redraw."""
         self.selected_records = [r for r in self.pitch_records if r.selected]
+        self.selected_trajectories = self._load_selected_trajectories()
 
         # Update slider range based on selected trajectories
         max_frames = max((len(r.trajectory) for r in self.selected_records if r.trajectory), default=1)
@@ -445,6 +343,14 @@ class StatSwing(UIWindow):
 
         self._draw_visualization()
 
+    def _load_selected_trajectories(self) -> List[list]:
+        """Get the points of the selected pitches, regenerating stored ones together rather than one by one."""
+        from gameplay.trajectory_store import StoredTrajectory
+        stored = [r.trajectory for r in self.selected_records if isinstance(r.trajectory, StoredTrajectory)]
+        loaded = iter(stored[0].store.load_many([trajectory.index for trajectory in stored]) if stored else [])
+        return [next(loaded) if isinstance(r.trajectory, StoredTrajectory) else r.trajectory
+                for r in self.selected_records]
+
     def _toggle_pitch_selection(self, pitch_index: int):
         """Toggle selection state for a pitch by its index."""
         for record in self.pitch_records:
@@ -506,8 +412,7 @@ class StatSwing(UIWindow):
             num_selected = len(self.selected_records)
             alpha = max(80, min(200, 255 // max(1, num_selected)))
 
-            for record in self.selected_records:
-                trajectory = record.trajectory
+            for record, trajectory in zip(self.selected_records, self.selected_trajectories):
                 if not trajectory:
                     continue
 
@@ -707,18 +612,6 @@ class StateEngine:
 class GUImanager:
     pass
 
-class PitchDataManager:
-
-    def __init__(self):
-        self.records = []
-
-    def insert_row(self, row):
-        self.records.append(row)
-
-    def append_to_file(self, file):
-        pd.DataFrame(self.records).to_csv(file, mode='a', header=False, index=False)
-        print("Data appended to file")
-
 class Ball:
     def __init__(self, images, screen):
         self.true_x = 0
@@ -726,6 +619,7 @@ class Ball:
         self.true_z = 0
         self.size = 0
         self.images = images
+        self.sprite_cache = BallSpriteCache(images)
         self.screen = screen
         self.projected_x = 0
         self.projected_y = 0
@@ -747,14 +641,14 @@ class Ball:
         print(f"X: {self.true_x}, Y: {self.true_y}, Z: {self.true_z}")
 
     def draw(self):
-        image = pygame.transform.scale(self.images[self.counter], (self.size, self.size))
+        image = self.sprite_cache.get(self.counter, self.size, self.size)
         self.screen.blit(image, (self.x, self.y))
         self.counter = (self.counter + 1) % len(self.images)
         return 
     
     def draw_with_pos(self, x, y, size):
-        ratio = size / 64
-        image = pygame.transform.scale(self.images[self.counter], (int(ratio * 64), int(ratio * 66)))
+        ratio, width, height = ball_scale(size, reference_size=64)
+        image = self.sprite_cache.get(self.counter, width, height)
         self.screen.blit(image, (x  - (29.22 * ratio), y - (32.62 * ratio)))
         self.counter = (self.counter + 1) % len(self.images)
         return
@@ -13,6 +13,11 @@ class KeyAction(Enum):
     VIEW_PITCHES = "view_pitches"
     MAIN_MENU = "main_menu"
     TOGGLE_TRACK = "toggle_track"
+    TOGGLE_PROFILER = "toggle_profiler"
+    SAVE_PROFILER_TRACE = "save_profiler_trace"
+
+# Actions that still work while a pitch is in flight
+MID_PITCH_ACTIONS = frozenset((KeyAction.TOGGLE_PROFILER, KeyAction.SAVE_PROFILER_TRACE))
 
 class KeyBindingManager:
     def __init__(self, settings_manager):
@@ -27,7 +32,9 @@ class KeyBindingManager:
             KeyAction.QUICK_PITCH.value: pygame.K_SPACE,
             KeyAction.VIEW_PITCHES.value: pygame.K_v,
             KeyAction.MAIN_MENU.value: pygame.K_ESCAPE,
-            KeyAction.TOGGLE_TRACK.value: pygame.K_t
+            KeyAction.TOGGLE_TRACK.value: pygame.K_t,
+            KeyAction.TOGGLE_PROFILER.value: pygame.K_F3,
+            KeyAction.SAVE_PROFILER_TRACE.value: pygame.K_F4
         }
 
         self.current_bindings = self.load_bindings()
@@ -101,7 +108,9 @@ class KeyBindingManager:
             KeyAction.QUICK_PITCH: "Quick Pitch",
             KeyAction.VIEW_PITCHES: "View Pitches",
             KeyAction.MAIN_MENU: "Main Menu",
-            KeyAction.TOGGLE_TRACK: "Toggle Track"
+            KeyAction.TOGGLE_TRACK: "Toggle Track",
+            KeyAction.TOGGLE_PROFILER: "Toggle Profiler",
+            KeyAction.SAVE_PROFILER_TRACE: "Save Profiler Trace"
         }
         return action_names.get(action, action.value.replace('_', ' ').title())
 
@@ -109,11 +118,11 @@ class KeyBindingManager:
         """Register a callback function for an action."""
         self.action_callbacks[action] = callback
 
-    def handle_key_down(self, key_code: int):
-        """Handle key press events."""
+    def handle_key_down(self, key_code: int, actions: Optional[Set[KeyAction]] = None):
+        """Handle key press events, only running the given actions if any are given."""
         self.pressed_keys.add(key_code)
 
-        for action in KeyAction:
+        for action in actions or KeyAction:
             if self.get_key_for_action(action) == key_code:
                 if action in self.action_callbacks:
                     self.action_callbacks[action]()
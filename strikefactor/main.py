@@ -1,9 +1,12 @@
 # StrikeFactor : A baseball batting simulator
+import time
+
+# Taken before the heavy imports below, for the time-to-first-frame report
+LAUNCH_TIME = time.perf_counter()
+
 import pygame
 import sys
 import os
-import pandas as pd
-import pickle
 
 # Import pitcher classes
 from pitchers.Mcclanahan import Mcclanahan
@@ -12,16 +15,24 @@ from pitchers.Degrom import Degrom
 from pitchers.Yamamoto import Yamamoto
 from pitchers.Sasaki import Sasaki
 from ai.AI_2 import ERAI
+from ai.model_registry import model_registry
 
 # Import game components
 from ui.components import create_pci_cursor
 from engine.sound_manager import SoundManager
+from engine.frame_pacer import FramePacer
+from engine.profiler import profiler
+from engine.lazy_assets import LazyPitcher
+from engine.asset_bundle import asset_bundle
+from engine.sprite_cache import BallSpriteCache, BALL_CENTER_OFFSET, ball_scale, ball_size_at
 from gameplay.batter import Batter
-from config import get_path, resource_path
+from config import get_path, OUTCOME_VALUES
 from gameplay.field_renderer import FieldRenderer
 from gameplay.hit_outcome_manager import HitOutcomeManager
+from gameplay.pitch_store import PitchStore
+from gameplay.trajectory_store import TrajectoryStore
 from ui.ui_manager import UIManager
-from helpers import ScoreKeeper, PitchDataManager
+from helpers import ScoreKeeper
 from gameplay.game_state_manager import GameStateManager
 from gameplay.random_scenario import RandomScenarioGenerator
 from settings_manager import SettingsManager
@@ -31,37 +42,24 @@ class AssetManager:
     
     def __init__(self):
         self.ball_list = self._load_ball_sprites()
+        self.ball_cache = BallSpriteCache(self.ball_list)
+        self.ball_cache.prewarm()
         
     @staticmethod
     def load_pitcher_sprites(name: str, number: int) -> list:
         """Load pitcher sprite images."""
-        name = get_path(name)
-        counter = 1
-        storage = []
-        while counter <= number:
-            storage.append(pygame.image.load(resource_path(f'{name}{counter}.png')).convert_alpha())
-            counter += 1
-        return storage
+        return asset_bundle.load_images([f'{name}{counter}.png' for counter in range(1, number + 1)])
         
     @staticmethod
     def load_pitcher_sprites_experimental(name: str, number: int) -> list:
         """Load experimental pitcher sprites with scaling."""
-        counter = 1
-        storage = []
-        name = get_path(name)
-        while counter <= number:
-            image = pygame.image.load(resource_path(f'{name}{counter}.png')).convert_alpha()
-            storage.append(pygame.transform.scale_by(image, 118 / image.get_height()))
-            counter += 1
-        return storage
+        images = asset_bundle.load_images([f'{name}{counter}.png' for counter in range(1, number + 1)])
+        return [pygame.transform.scale_by(image, 118 / image.get_height()) for image in images]
         
     def _load_ball_sprites(self) -> list:
         """Load ball animation sprites."""
-        out = []
-        ball_dir = get_path('assets/images/ball')
-        for filename in os.listdir(ball_dir):
-            out.append(pygame.image.load(f'{ball_dir}/{filename}').convert_alpha())
-        return out
+        ball_dir = 'assets/images/ball'
+        return asset_bundle.load_images([f'{ball_dir}/{filename}' for filename in os.listdir(get_path(ball_dir))])
         
     def create_ball_renderer(self):
         """Create a ball rendering function."""
@@ -69,22 +67,25 @@ class AssetManager:
         
         def render_ball(screen, ball_pos):
             nonlocal counter
-            max_distance = 4600
-            min_size = 3
-            max_size = 11
-
-            dist = ball_pos[2] / max_distance
-            size = min_size + (max_size - min_size) * (1 - dist)
-            ratio = size / 54
-
-            image = pygame.transform.scale(self.ball_list[counter], (int(ratio * 64), int(ratio * 66)))
-            screen.blit(image, (ball_pos[0] - (29.22 * ratio), ball_pos[1] - (32.62 * ratio)))
+            ratio, width, height = ball_scale(ball_size_at(ball_pos[2]))
+            image = self.ball_cache.get(counter, width, height)
+            screen.blit(image, (ball_pos[0] - (BALL_CENTER_OFFSET[0] * ratio),
+                                ball_pos[1] - (BALL_CENTER_OFFSET[1] * ratio)))
             counter = (counter + 1) % len(self.ball_list)
             
         return render_ball
 class PitcherManager:
     """Manages pitcher instances and AI."""
     
+    # Pitcher class and sprite loader name for each selectable pitcher
+    PITCHER_CLASSES = {
+        'sale': (Sale, 'load_pitcher_sprites'),
+        'degrom': (Degrom, 'load_pitcher_sprites'),
+        'yamamoto': (Yamamoto, 'load_pitcher_sprites'),
+        'sasaki': (Sasaki, 'load_pitcher_sprites'),
+        'mcclanahan': (Mcclanahan, 'load_pitcher_sprites_experimental'),
+    }
+    
     def __init__(self, screen, asset_manager: AssetManager):
         self.screen = screen
         self.asset_manager = asset_manager
@@ -93,24 +94,22 @@ class PitcherManager:
         self._initialize_pitchers()
         
     def _initialize_pitchers(self):
-        """Initialize all pitchers with their AI."""
-        # Create pitcher instances
+        """Register every pitcher; each is built with its AI on first use."""
         self.pitchers = {
-            'sale': Sale(self.screen, self.asset_manager.load_pitcher_sprites),
-            'degrom': Degrom(self.screen, self.asset_manager.load_pitcher_sprites),
-            'yamamoto': Yamamoto(self.screen, self.asset_manager.load_pitcher_sprites),
-            'sasaki': Sasaki(self.screen, self.asset_manager.load_pitcher_sprites),
-            'mcclanahan': Mcclanahan(self.screen, self.asset_manager.load_pitcher_sprites_experimental)
+            name: LazyPitcher(name, lambda name=name: self._create_pitcher(name))
+            for name in self.PITCHER_CLASSES
         }
-        
-        # Attach AI to each pitcher
-        for pitcher in self.pitchers.values():
-            ai = ERAI(pitcher.get_pitch_names())
-            pitcher.attach_ai(ai)
             
         # Set default pitcher
         self.current_pitcher = self.pitchers['sale']
         
+    def _create_pitcher(self, name: str):
+        """Build a pitcher, decoding its sprites, and attach its AI."""
+        pitcher_class, loader_name = self.PITCHER_CLASSES[name]
+        pitcher = pitcher_class(self.screen, getattr(self.asset_manager, loader_name))
+        pitcher.attach_ai(ERAI(pitcher.get_pitch_names()))
+        return pitcher
+        
     def get_pitcher(self, name: str):
         """Get a pitcher by name."""
         return self.pitchers.get(name.lower())
@@ -124,17 +123,27 @@ class PitcherManager:
     def get_current_pitcher(self):
         """Get the current active pitcher."""
         return self.current_pitcher
+        
+    def prefetch(self, name: str):
+        """Build a pitcher on a background thread ahead of its first use."""
+        pitcher = self.get_pitcher(name)
+        if pitcher is not None and not pitcher.is_loaded():
+            return pitcher.prefetch()
+        return None
+        
+    def get_stats(self) -> dict:
+        """Get whether and how fast each pitcher was built."""
+        return {
+            name: {'loaded': pitcher.is_loaded(), 'load_time_ms': pitcher.get_load_time_ms()}
+            for name, pitcher in self.pitchers.items()
+        }
 
 class GameStats:
     """Manages game statistics and state."""
     
     def __init__(self):
         self.reset_game_stats()
-        self.outcome_value = {
-            'strike': 0.5, 'ball': -0.25, 'foul': 0.3, 'strikeout': 2, 'walk': -1,
-            'SINGLE': -1.5, 'DOUBLE': -2, 'TRIPLE': -2.5, 'HOME RUN': -3,
-            'FLYOUT': 1.5, 'GROUNDOUT': 1.5
-        }
+        self.outcome_value = dict(OUTCOME_VALUES)
         
     def reset_game_stats(self):
         """Reset all game statistics."""
@@ -157,14 +166,34 @@ class GameStats:
 class Game:
     """Main game class - refactored for better OOP design."""
     
-    def __init__(self):
+    def __init__(self, headless: bool = False, data_dir: str = None, launch_time: float = None):
+        """
+        Args:
+            headless: Run with SDL's dummy video and audio drivers, with no window or sound device
+            data_dir: Directory for the pitch database behind the batting stats and lap history,
+                the asset bundle and profiler traces (default: data/)
+            launch_time: perf_counter() at launch, for the startup report (default: now)
+        """
+        init_start = time.perf_counter()
+        self.launch_time = launch_time if launch_time is not None else init_start
+        self.headless = headless
+        self.data_dir = data_dir
+        data_root = data_dir or get_path("data")
+        asset_bundle.set_path(os.path.join(data_root, "asset_cache", "assets.bundle"))
+        profiler.trace_dir = os.path.join(data_root, "traces")
         self._initialize_pygame()
         self._setup_display()
         self._initialize_components()
         self._setup_ui_callbacks()
+        self.init_ms = (time.perf_counter() - init_start) * 1000
+        self.startup_ms = None
         
     def _initialize_pygame(self):
         """Initialize pygame subsystems."""
+        if self.headless:
+            # Must be set before pygame.init(); surfaces, convert_alpha() and the mixer all still work
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.mixer.pre_init(44100, 16, 2, 4096)
         pygame.init()
         crosshair = create_pci_cursor()
@@ -173,7 +202,9 @@ class Game:
     def _setup_display(self):
         """Setup the game display."""
         self.screen = pygame.display.set_mode((1280, 720), pygame.RESIZABLE)
-        self.clock = pygame.time.Clock()
+        self.frame_pacer = FramePacer()
+        if self.headless:
+            return
         icon = pygame.image.load(get_path("assets/images/icon.png")).convert_alpha()
         pygame.display.set_icon(icon)
         pygame.display.set_caption('StrikeFactor 0.1')
@@ -189,9 +220,11 @@ class Game:
         self.batter = Batter(self.screen)
         self.batter.set_handedness("R")
         self.sound_manager = SoundManager(sound_dir="assets/sounds")
-        self.field_renderer = FieldRenderer(self.screen)
+        # Every pitch goes to the pitch store; the heatmap and lap log are read back from it
+        self.pitch_store = PitchStore(os.path.join(self.data_dir, "pitches.db") if self.data_dir else None)
+        self.pitch_store.start_session()
+        self.field_renderer = FieldRenderer(self.screen, pitch_store=self.pitch_store, data_dir=self.data_dir)
         self.scoreKeeper = ScoreKeeper()
-        self.pitchDataManager = PitchDataManager()
 
         # GameDay mode management
         self.gameday_manager = None
@@ -223,7 +256,7 @@ class Game:
         # Legacy compatibility and initial state variables (needed before state manager)
         self.ball = [0, 0, 4600]
         self.blitfunc = self.asset_manager.create_ball_renderer()
-        self.records = pd.DataFrame()
+        self.ui_manager.scouting_panel.set_pitch_store(self.pitch_store)
         self.fourseamballsize = 11
 
         # Load settings and initialize state variables
@@ -238,14 +271,15 @@ class Game:
         self.just_refreshed = 0
         self.current_gamemode = 0
         self.inning_ended = False
-        self.pitches_display = []
-        self.pitch_trajectories = []
-        self.enhanced_pitch_records = []  # Enhanced pitch data for visualization
+        # Pitch records and trajectories for visualization
+        self.trajectory_store = TrajectoryStore(self.settings_manager.get_trajectory_history())
         self.last_pitch_information = []
         self.previous_mode_before_pitchviz = None  # Track mode before entering PitchViz
 
-        # Load AI model
-        self.ai_model = pickle.load(open(get_path("ai/ai_umpire.pkl"), "rb"))
+        # Umpire and pitcher AI models load lazily; warm the umpire zone in the background
+        # so the mode-select screen renders without waiting on sklearn/pandas
+        self.model_registry = model_registry
+        self.model_registry.prefetch("umpire_zone")
         
     def _setup_ui_callbacks(self):
         """Setup UI button callbacks."""
@@ -270,6 +304,14 @@ class Game:
         self.ui_manager.register_button_callback('sandbox_pitcher_yamamoto', lambda: self._sandbox_switch_pitcher('yamamoto'))
         self.ui_manager.register_button_callback('sandbox_pitcher_mcclanahan', lambda: self._sandbox_switch_pitcher('mcclanahan'))
 
+        # Pitchers are built on first use; start building one as soon as its button is highlighted
+        for pitcher_name in PitcherManager.PITCHER_CLASSES:
+            for button_name in (pitcher_name, f'sandbox_pitcher_{pitcher_name}'):
+                self.ui_manager.register_button_hover_callback(
+                    button_name, lambda pitcher_name=pitcher_name: self.prefetch_pitcher(pitcher_name))
+        self.ui_manager.register_button_hover_callback('sandbox_mode', lambda: self.prefetch_pitcher('sale'))
+        self.ui_manager.register_button_hover_callback('gameday', lambda: self.prefetch_pitcher('yamamoto'))
+
         # Sandbox mode callbacks - pitch type selection
         self.ui_manager.register_button_callback('sandbox_pitch_1', lambda: self._sandbox_select_pitch(0))
         self.ui_manager.register_button_callback('sandbox_pitch_2', lambda: self._sandbox_select_pitch(1))
@@ -339,6 +381,10 @@ class Game:
         self._setup_key_binding_callbacks()
         
     # Properties for backward compatibility
+    @property
+    def ai_model(self):
+        return self.model_registry.get("umpire_model")
+
     @property
     def current_pitcher(self):
         return self.pitcher_manager.get_current_pitcher()
@@ -471,6 +517,11 @@ class Game:
     def outcome_value(self):
         return self.game_stats.outcome_value
         
+    def prefetch_pitcher(self, pitcher_name: str):
+        """Start building a pitcher and decoding the batter's sprites in the background before they are picked."""
+        self.pitcher_manager.prefetch(pitcher_name)
+        self.batter.prefetch()
+        
     def enter_gamemode(self, gamemode_name: str, pitcher_name: str):
         """Enter a specific game mode with a pitcher."""
         self.menu_state = gamemode_name
@@ -478,9 +529,7 @@ class Game:
         self.game_stats.reset_game_stats()
         self.inning_ended = False
         self.just_refreshed = 1
-        self.pitches_display = []
-        self.pitch_trajectories = []
-        self.enhanced_pitch_records = []
+        self.trajectory_store.clear()
         crosshair = create_pci_cursor()
         pygame.mouse.set_cursor(crosshair)
         self.state_manager.handle_menu_state_change(gamemode_name)
@@ -522,19 +571,14 @@ class Game:
         
         # Set up runners on base
         self.scoreKeeper.reset()
-        from helpers import Runner
         for base in scenario['runners']:
-            runner = Runner(base)  # Create a runner starting at this base
-            runner.base = base     # Make sure they're on the correct base
-            self.scoreKeeper.runners.append(runner)
-            self.scoreKeeper.basesfilled[base] = runner
-            self.scoreKeeper.bases[base - 1] = 'yellow'
+            self.scoreKeeper.place_runner(base)
         
         # Set menu state and initialize
         self.menu_state = f"Random: {pitcher_name.title()}"
         self.inning_ended = False
         self.just_refreshed = 1
-        self.pitches_display = []
+        self.trajectory_store.clear()
 
         # Reset cursor (like in enter_gamemode)
         crosshair = create_pci_cursor()
@@ -553,6 +597,12 @@ class Game:
         self.gameday_manager = GameDayManager(player_name="Player")
         self.in_gameday_mode = True
 
+        # Relief pitchers are swapped in mid-game; build them and load their AIs before they are needed
+        relievers = self.gameday_manager.opponent_pitcher_preset['relievers']
+        self.model_registry.prefetch(*[f"{name}_ai" for name in relievers])
+        for name in relievers:
+            self.pitcher_manager.prefetch(name)
+
         # Set starting pitcher (Yamamoto)
         self.pitcher_manager.set_current_pitcher('yamamoto')
         self.current_pitcher = self.pitcher_manager.get_current_pitcher()
@@ -581,9 +631,7 @@ class Game:
         self.scoreKeeper.reset()
 
         # Clear pitch data
-        self.pitch_trajectories = []
-        self.enhanced_pitch_records = []
-        self.pitches_display = []
+        self.trajectory_store.clear()
 
         # Set cursor
         crosshair = create_pci_cursor()
@@ -668,7 +716,7 @@ class Game:
         else:
             self.ui_manager.set_button_visibility('view_pitches')
 
-        self.ui_manager.update_pitch_info(self.pitch_trajectories, self.last_pitch_information)
+        self.ui_manager.update_pitch_info_enhanced(self.trajectory_store.records)
         self.ui_manager.show_view_window()
         self.menu_state = 'view_pitches'
         self.state_manager.change_state('view_pitches')
@@ -767,6 +815,8 @@ class Game:
         self.key_binding_manager.register_callback(KeyAction.VIEW_PITCHES, self.toggle_view_pitches)
         self.key_binding_manager.register_callback(KeyAction.MAIN_MENU, lambda: self.set_menu_state(0))
         self.key_binding_manager.register_callback(KeyAction.TOGGLE_TRACK, self.toggle_track)
+        self.key_binding_manager.register_callback(KeyAction.TOGGLE_PROFILER, profiler.toggle)
+        self.key_binding_manager.register_callback(KeyAction.SAVE_PROFILER_TRACE, profiler.save_trace)
 
     def enter_key_bindings_menu(self):
         """Enter key bindings configuration menu."""
@@ -905,6 +955,11 @@ class Game:
         # Refresh scouting panel stats after each pitch
         self.ui_manager.refresh_scouting_panel()
 
+    def is_pitch_in_progress(self) -> bool:
+        """Check if the current state is in the middle of a pitch."""
+        current_state = self.state_manager.get_current_state()
+        return getattr(current_state, 'pitch_simulation', None) is not None
+
     def check_inning_end(self):
         """Check if the inning should end."""
         if self.currentouts == 3 and not self.inning_ended:
@@ -933,13 +988,37 @@ class Game:
             
     def run(self):
         """Main game loop."""
+        while self.run_frame():
+            pass
+            
+        # Cleanup
+        self.cleanup()
+        
+    def run_frame(self, display_fps: float = None) -> bool:
+        """
+        Run one frame of the main loop.
+        
+        Args:
+            display_fps: Frame rate to pace to (default: the display FPS setting); 0 means unpaced
+            
+        Returns:
+            False once the game should quit
+        """
         running = True
-        while running:
+        profiler.begin_frame()
+        if display_fps is None:
             display_fps = self.settings_manager.get_display_fps()
-            time_delta = self.clock.tick(display_fps) / 1000.0
-            
-            # Process events
-            for event in pygame.event.get():
+        with profiler.section("frame_pacer.tick"):
+            time_delta = self.frame_pacer.tick(display_fps) / 1000.0
+        self.sound_manager.update()
+        
+        # Process events, stamped with the time they were pumped (swings are timed by it)
+        with profiler.section("events"):
+            events = pygame.event.get()
+            event_time = pygame.time.get_ticks()
+            pitching = self.is_pitch_in_progress()
+            for event in events:
+                event.timestamp = event_time
                 if event.type == pygame.QUIT:
                     running = False
                     break
@@ -949,9 +1028,12 @@ class Game:
                     # Check if we're waiting for a key rebind
                     if hasattr(self, 'key_rebind_action') and self.key_rebind_action is not None:
                         self.complete_key_rebind(event.key)
-                    else:
-                        # Normal key handling
+                    elif not pitching:
                         self.key_binding_manager.handle_key_down(event.key)
+                    else:
+                        # Mid-pitch only the profiler keys act, so a stray key can't change the pitch
+                        from key_binding_manager import MID_PITCH_ACTIONS
+                        self.key_binding_manager.handle_key_down(event.key, MID_PITCH_ACTIONS)
                 elif event.type == pygame.KEYUP:
                     self.key_binding_manager.handle_key_up(event.key)
 
@@ -959,37 +1041,80 @@ class Game:
                 if not self.state_manager.handle_event(event):
                     running = False
                     break
-                    
-            # Check for inning end only when in gameplay state (not sandbox mode - sandbox has unlimited outs)
-            if self.state_manager.is_current_state('gameplay'):
-                self.check_inning_end()
-            
-            # Update current state
+                
+        # Check for inning end only when in gameplay state (not sandbox mode - sandbox has unlimited outs)
+        # and not mid-pitch, so the pitch that made the third out is recorded first
+        if self.state_manager.is_current_state('gameplay') and not self.is_pitch_in_progress():
+            self.check_inning_end()
+        
+        # Update current state
+        with profiler.section("state.update"):
             self.state_manager.update(time_delta)
+        with profiler.section("ui_manager.update"):
             self.ui_manager.update(time_delta)
-            
-            # Render current state
+        
+        # Render current state
+        with profiler.section("state.render"):
             self.screen.fill("black")
             self.state_manager.render(self.screen)
+        with profiler.section("ui_manager.draw"):
             self.ui_manager.draw()
-            
+        profiler.render(self.screen)
+        
+        with profiler.section("display.flip"):
             pygame.display.flip()
-            
-        # Cleanup
-        self.cleanup()
+        profiler.end_frame()
+
+        if self.startup_ms is None:
+            self._finish_startup()
+        return running
+        
+    def _finish_startup(self):
+        """Report time to the first interactive frame and start decoding sounds in the background."""
+        self.startup_ms = (time.perf_counter() - self.launch_time) * 1000
+        self.sound_manager.prefetch()
+        self.print_startup_stats()
+        
+    def get_startup_stats(self) -> dict:
+        """Get startup timing and which lazily loaded assets were needed for the first frame."""
+        return {
+            'startup_ms': self.startup_ms,
+            'init_ms': self.init_ms,
+            'pitchers_loaded': [name for name, stats in self.pitcher_manager.get_stats().items() if stats['loaded']],
+            'batter_sets_loaded': [name for name, stats in self.batter.get_load_stats().items() if stats['loaded']],
+        }
+        
+    def print_startup_stats(self):
+        """Print the startup report."""
+        stats = self.get_startup_stats()
+        print(f"✓ First interactive frame {stats['startup_ms']:.0f} ms after launch "
+              f"({stats['init_ms']:.0f} ms setting up the game)")
+        print(f"  Pitchers built: {', '.join(stats['pitchers_loaded']) or 'none'}; "
+              f"batter sets decoded: {', '.join(stats['batter_sets_loaded']) or 'none'}")
         
     def cleanup(self):
         """Clean up resources."""
         print("Game shutting down...")
+        if hasattr(self, 'frame_pacer'):
+            self.frame_pacer.print_stats()
         
-        # Save final batting statistics before exit
-        if hasattr(self, 'field_renderer'):
+        # Write the last queued pitches before exit
+        if hasattr(self, 'pitch_store'):
             print("Saving final batting statistics...")
-            self.field_renderer.save_data()
+            self.pitch_store.close()
+
+        if hasattr(self, 'trajectory_store'):
+            self.trajectory_store.print_stats()
+
+        # Keep whatever was decoded this run for the next launch
+        asset_bundle.print_stats()
+        asset_bundle.save()
+        # Unmapped so a scratch data_dir can be removed, even on Windows
+        asset_bundle.close()
 
 def main():
     """Main entry point."""
-    game = Game()
+    game = Game(launch_time=LAUNCH_TIME)
     game.run()
     pygame.quit()
     sys.exit()
@@ -0,0 +1,151 @@
+"""
+Arsenal - Pitchers and their pitches declared as data.
+
+Each pitcher is a JSON file in pitchers/arsenals/:
+
+    id              Pitcher name recorded with each pitch, e.g. "chrissale"
+    name            Display name
+    windup_ms       Windup length before release
+    arm_extension   Extension in feet, which shortens the distance to the plate
+    position        Sprite position, as an offset from (screen width / 2, screen height / 3)
+    release_point   Release point, as an offset from the same point
+    sprites         {"path": sprite path prefix, "frames": frame count}
+    windup_animation  Keyframes [time_ms, frame, x_offset, y_offset] of the windup (see engine.animation)
+    pitches         Pitch name -> pitch, in the order the AI and the sandbox list them
+
+and each pitch has:
+
+    type            Pitch type recorded with each pitch, e.g. "FF"
+    ax, ay          Break; a number, or [low, high] to draw it uniformly
+    speed_mph       A number, or {"mean": ..., "sd": ...} for a normal distribution
+    target          {"x": [[low, high], ...], "y": [[low, high], ...]} plate location;
+                    one range is picked at random, then a point in it
+    velocity        Instead of target: {"vx": [[low, high], ...], "vy": [...]} drawn directly
+
+compile_arsenal() turns every pitch into a CompiledPitch: travel times at
+evenly spaced quantiles of its speed distribution, next to the velocity-solve
+coefficients of each travel time (see utils.physics.trajectory_coefficients).
+Throwing a pitch draws a quantile and a target and solves the velocity from
+the table, a few lookups instead of integrating the flight frame by frame.
+"""
+
+import json
+import random
+from functools import partial
+from statistics import NormalDist
+import pygame
+from config import get_path
+from engine.animation import Animation
+from utils.physics import calculate_travel_time, trajectory_coefficients_table
+from .pitcher import Pitcher
+
+# Quantiles of the speed distribution kept per pitch
+SPEED_QUANTILES = 256
+
+
+def load_arsenal_spec(name: str) -> dict:
+    """Load a pitcher's spec from pitchers/arsenals/<name>.json."""
+    with open(get_path(f"pitchers/arsenals/{name}.json")) as f:
+        return json.load(f)
+
+
+def _uniform(value) -> float:
+    """A fixed number, or a uniform draw from [low, high]."""
+    if isinstance(value, (int, float)):
+        return value
+    return random.uniform(value[0], value[1])
+
+
+def _from_ranges(ranges) -> float:
+    """A uniform draw from one of the ranges, picked at random."""
+    low, high = ranges[0] if len(ranges) == 1 else random.choice(ranges)
+    return random.uniform(low, high)
+
+
+class CompiledPitch:
+    """One pitch of an arsenal with its travel time and velocity-solve tables."""
+
+    def __init__(self, pitch_type: str, spec: dict, release_point, arm_extension: float):
+        """
+        Args:
+            pitch_type: Pitch type recorded with each pitch
+            spec: The pitch's entry in the arsenal spec
+            release_point: The pitcher's release point
+            arm_extension: The pitcher's arm extension in feet
+        """
+        self.pitch_type = pitch_type
+        self.ax = spec['ax']
+        self.ay = spec['ay']
+        self.release_x = release_point[0]
+        self.release_y = release_point[1]
+        self.target = spec.get('target')
+        self.velocity = spec.get('velocity')
+        if (self.target is None) == (self.velocity is None):
+            raise ValueError(f"Pitch '{pitch_type}' needs exactly one of 'target' or 'velocity'")
+
+        speed = spec['speed_mph']
+        if isinstance(speed, dict) and speed['sd'] > 0:
+            distribution = NormalDist(speed['mean'], speed['sd'])
+            speeds = [distribution.inv_cdf((i + 0.5) / SPEED_QUANTILES) for i in range(SPEED_QUANTILES)]
+        else:
+            speeds = [speed['mean'] if isinstance(speed, dict) else speed]
+        self.travel_times = [calculate_travel_time(mph, arm_extension) for mph in speeds]
+
+        # final = release + v * s + a * 300 * t, so v = (target - release - a * accel_gain) / s
+        s, t = trajectory_coefficients_table(self.travel_times)
+        self.velocity_gain = s.tolist()
+        self.accel_gain = (300 * t).tolist()
+
+    def sample(self):
+        """
+        Draw one pitch.
+
+        Returns:
+            Tuple of (ax, ay, vx, vy, travel_time)
+        """
+        i = int(random.random() * len(self.travel_times))
+        ax, ay = _uniform(self.ax), _uniform(self.ay)
+        if self.velocity is not None:
+            vx, vy = _from_ranges(self.velocity['vx']), _from_ranges(self.velocity['vy'])
+        else:
+            target_x, target_y = _from_ranges(self.target['x']), _from_ranges(self.target['y'])
+            s, gain = self.velocity_gain[i], self.accel_gain[i]
+            vx = (target_x - self.release_x - ax * gain) / s
+            vy = (target_y - self.release_y - ay * gain) / s
+        return ax, ay, vx, vy, self.travel_times[i]
+
+
+def compile_arsenal(spec: dict, release_point, arm_extension: float) -> dict:
+    """Compile every pitch in a spec, keyed by pitch name in spec order."""
+    return {
+        name: CompiledPitch(pitch['type'], pitch, release_point, arm_extension)
+        for name, pitch in spec['pitches'].items()
+    }
+
+
+class ArsenalPitcher(Pitcher):
+    """A pitcher placed, drawn from and armed by its arsenal spec."""
+
+    def __init__(self, screen, loadfunc, spec_name: str) -> None:
+        spec = load_arsenal_spec(spec_name)
+        center_x, top_third = screen.get_width() / 2, screen.get_height() / 3
+        super().__init__(center_x + spec['position'][0],
+                         top_third + spec['position'][1],
+                         pygame.Vector2(center_x + spec['release_point'][0], top_third + spec['release_point'][1]),
+                         screen,
+                         spec['name'],
+                         spec['windup_ms'],
+                         spec['arm_extension'])
+        self.pitcher_id = spec['id']
+        self.load_img(loadfunc, spec['sprites']['path'], spec['sprites']['frames'])
+        self.windup_animation = Animation(spec['windup_animation'])
+        for pitch_name, pitch in compile_arsenal(spec, self.release_point, self.arm_extension).items():
+            self.add_pitch_type(partial(self._throw, pitch), pitch_name)
+
+    def draw_pitcher(self, start_time, current_time):
+        frame, xoffset, yoffset = self.windup_animation.pose_at(current_time - start_time)
+        self.draw(self.screen, frame, xoffset, yoffset)
+
+    def _throw(self, pitch: CompiledPitch, simulation_func):
+        ax, ay, vx, vy, travel_time = pitch.sample()
+        simulation_func(self.release_point, self.pitcher_id, ax, ay, vx, vy, travel_time, pitch.pitch_type)
@@ -11,9 +11,11 @@ class DifficultyLevel(Enum):
     HALL_OF_FAME = "hall_of_fame"
 
 class SettingsManager:
-    # FPS option constants
-    DISPLAY_FPS_OPTIONS = [60, 120]
-    ENGINE_FPS_OPTIONS = [60, 120]  # 60 is baseline for original physics
+    # FPS option constants; these are the presets cycled through in the menu,
+    # any rate up to MAX_FPS can also be set in settings.json
+    DISPLAY_FPS_OPTIONS = [60, 120, 144, 240]
+    ENGINE_FPS_OPTIONS = [60, 120, 240, 360]  # 60 is baseline for original physics
+    MAX_FPS = 1000
 
     def __init__(self):
         self.settings_file = get_path("settings.json")
@@ -24,8 +26,9 @@ class SettingsManager:
             "show_strikezone": True,
             "batter_handedness": "R",
             "display_mode": "windowed",  # "windowed" or "fullscreen"
-            "display_fps": 60,           # Options: 60, 120
-            "engine_fps": 60             # Options: 60, 120, 240, 360 (60 = original physics)
+            "display_fps": 60,           # Options: 60, 120, 144, 240 (or any rate up to MAX_FPS)
+            "engine_fps": 60,            # Options: 60, 120, 240, 360 (60 = original physics)
+            "trajectory_history": 50     # Pitches whose trajectory points stay cached for PitchViz
         }
         self.current_settings = self.load_settings()
 
@@ -148,29 +151,42 @@ class SettingsManager:
 
         return descriptions.get(difficulty_level, descriptions[DifficultyLevel.AMATEUR])
 
+    def _valid_fps(self, fps):
+        """Check if a frame rate from the settings file can be used."""
+        return isinstance(fps, (int, float)) and not isinstance(fps, bool) and 0 < fps <= self.MAX_FPS
+
+    def _next_fps_option(self, current, options):
+        """Get the preset after the current rate, which may be a custom rate between presets."""
+        for fps in options:
+            if fps > current:
+                return fps
+        return options[0]
+
     def get_display_fps(self):
         """Get display/render FPS setting."""
         fps = self.get_setting("display_fps")
-        return fps if fps in self.DISPLAY_FPS_OPTIONS else 60
+        return fps if self._valid_fps(fps) else 60
 
     def get_engine_fps(self):
         """Get engine/physics FPS setting."""
         fps = self.get_setting("engine_fps")
-        return fps if fps in self.ENGINE_FPS_OPTIONS else 120
+        return fps if self._valid_fps(fps) else 120
+
+    def get_trajectory_history(self):
+        """Get how many pitches' trajectory points to keep cached."""
+        pitches = self.get_setting("trajectory_history")
+        valid = isinstance(pitches, int) and not isinstance(pitches, bool) and pitches > 0
+        return pitches if valid else self.default_settings["trajectory_history"]
 
     def cycle_display_fps(self):
         """Cycle to next display FPS option."""
-        current = self.get_display_fps()
-        idx = self.DISPLAY_FPS_OPTIONS.index(current)
-        next_fps = self.DISPLAY_FPS_OPTIONS[(idx + 1) % len(self.DISPLAY_FPS_OPTIONS)]
+        next_fps = self._next_fps_option(self.get_display_fps(), self.DISPLAY_FPS_OPTIONS)
         self.set_setting("display_fps", next_fps)
         return next_fps
 
     def cycle_engine_fps(self):
         """Cycle to next engine FPS option."""
-        current = self.get_engine_fps()
-        idx = self.ENGINE_FPS_OPTIONS.index(current)
-        next_fps = self.ENGINE_FPS_OPTIONS[(idx + 1) % len(self.ENGINE_FPS_OPTIONS)]
+        next_fps = self._next_fps_option(self.get_engine_fps(), self.ENGINE_FPS_OPTIONS)
         self.set_setting("engine_fps", next_fps)
         return next_fps
 
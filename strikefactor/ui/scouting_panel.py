@@ -56,6 +56,7 @@ class ScoutingReportPanel(UIPanel):
         )
 
         self.pitcher_ref = None
+        self.pitch_store = None
         self.stat_labels = {}
         self.arsenal_labels = []
         self._create_layout()
@@ -168,6 +169,10 @@ class ScoutingReportPanel(UIPanel):
             )
             self.arsenal_labels.append(arsenal_label)
 
+    def set_pitch_store(self, pitch_store):
+        """Show pitch usage from the pitch store next to the arsenal."""
+        self.pitch_store = pitch_store
+
     def update_data(self, pitcher):
         """Update panel with new pitcher data."""
         self.pitcher_ref = pitcher
@@ -200,12 +205,14 @@ class ScoutingReportPanel(UIPanel):
 
         # Update arsenal (compact format)
         pitch_names = pitcher.get_pitch_names()
+        usage = self.pitch_store.pitch_type_summary(pitcher.name) if self.pitch_store else {}
         for i, label in enumerate(self.arsenal_labels):
             if i < len(pitch_names):
                 pitch_code = pitch_names[i]
                 full_name = PITCH_NAMES.get(pitch_code, pitch_code)
                 velocity = PITCH_VELOCITIES.get(pitch_code, '??')
-                label.set_text(f'{pitch_code} {full_name} {velocity}')
+                usage_text = f" {usage[pitch_code]['usage']:.0%}" if pitch_code in usage else ''
+                label.set_text(f'{pitch_code} {full_name} {velocity}{usage_text}')
             else:
                 label.set_text('')
 
@@ -15,6 +15,7 @@ class UIManager:
         self.font = pygame.font.Font(resource_path(get_path("ui/font/8bitoperator_jve.ttf")), 40)
         self.big_font = pygame.font.Font(resource_path(get_path("ui/font/8bitoperator_jve.ttf")), 70)
         self.button_callbacks = {}
+        self.button_hover_callbacks = {}
         self.key_binding_manager = None  # Will be set after initialization
         self._create_ui_elements()
 
@@ -34,6 +35,18 @@ class UIManager:
         else:
             raise ValueError(f"Button '{button_name}' does not exist.")
 
+    def register_button_hover_callback(self, button_name, callback):
+        """
+        Registers a callback function for the mouse moving onto a button.
+
+        :param button_name: The name of the button to register the callback for.
+        :param callback: The function to call when the button is hovered.
+        """
+        if button_name in self.buttons:
+            self.button_hover_callbacks[button_name] = callback
+        else:
+            raise ValueError(f"Button '{button_name}' does not exist.")
+
     def _create_ui_manager(self, screen_size, theme_path=None):
         """Creates and configures the pygame_gui.UIManager."""
         theme_file = get_path(theme_path or 'assets/theme.json')
@@ -353,6 +366,11 @@ class UIManager:
                     # Call the registered callback for the button
                     self.button_callbacks[key]()
                     break
+        elif event.type == pygame_gui.UI_BUTTON_ON_HOVERED:
+            for key, button in self.buttons.items():
+                if event.ui_element == button and key in self.button_hover_callbacks:
+                    self.button_hover_callbacks[key]()
+                    break
 
     def update_scoreboard(self, text, typing_speed=0.0075):
         """Updates the scoreboard with new text and a typing effect."""
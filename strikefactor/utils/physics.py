@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 def collision(circlex, circley, radius, rectmiddlex, rectmiddley, rectwidth, rectheight):
     """Check collision between circle and rectangle"""
@@ -68,14 +69,255 @@ def simulate_pitch_trajectory(release_x, release_y, vx, vy, ax, ay, traveltime,
     return x, y
 
 
+def simulate_pitch_trajectories(release, vx, vy, ax, ay, traveltime, fps=60,
+                                z_start=4600, z_end=300, return_paths=False):
+    """
+    Simulate many pitch trajectories at once using the game's physics model.
+
+    Vectorized counterpart of simulate_pitch_trajectory. All pitches advance in
+    lockstep, one frame per step; pitches with a longer traveltime need more
+    frames, so every step only updates the pitches that have not reached the
+    plate yet. Per pitch, the arithmetic is identical to the scalar version.
+
+    Args:
+        release: Release points, shape (N, 2) or a single (x, y) pair
+        vx: Initial x velocities, shape (N,) or scalar
+        vy: Initial y velocities, shape (N,) or scalar
+        ax: x accelerations, shape (N,) or scalar
+        ay: y accelerations, shape (N,) or scalar
+        traveltime: Travel times in milliseconds, shape (N,) or scalar
+        fps: Frames per second (default 60)
+        z_start: Starting z position (default 4600)
+        z_end: Ending z position where dist=1 (default 300)
+        return_paths: Also return the per-frame positions (default False)
+
+    Returns:
+        Array of shape (N, 2) with the final (x, y) of each pitch. If
+        return_paths is True, returns (final, paths) where paths has shape
+        (N, frames + 1, 3) holding (x, y, z) at release and after every frame;
+        pitches that arrive early keep their final position for the remaining
+        frames.
+    """
+    release = np.asarray(release, dtype=np.float64)
+    vx, vy, ax, ay, traveltime = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (vx, vy, ax, ay, traveltime))
+    )
+    n = max(vx.size, release.size // 2)
+    release = np.broadcast_to(release.reshape(-1, 2), (n, 2))
+
+    x = release[:, 0].copy()
+    y = release[:, 1].copy()
+    z = np.full(n, float(z_start))
+    current_vx = np.broadcast_to(vx.ravel(), (n,)).copy()
+    current_vy = np.broadcast_to(vy.ravel(), (n,)).copy()
+    ax = np.broadcast_to(ax.ravel(), (n,))
+    ay = np.broadcast_to(ay.ravel(), (n,))
+    dz_per_frame = (4300 * 1000) / (fps * np.broadcast_to(traveltime.ravel(), (n,)))
+
+    frames = []
+    if return_paths:
+        frames.append(np.stack((x, y, z), axis=1))
+
+    active = z > z_end
+    while active.any():
+        dist = z[active] / 300
+        x[active] += current_vx[active] / dist
+        y[active] += current_vy[active] / dist
+        z[active] -= dz_per_frame[active]
+        current_vy[active] += (ay[active] * 300) / dist
+        current_vx[active] += (ax[active] * 300) / dist
+        if return_paths:
+            frames.append(np.stack((x, y, z), axis=1))
+        active = z > z_end
+
+    final = np.stack((x, y), axis=1)
+    if return_paths:
+        return final, np.stack(frames, axis=1)
+    return final
+
+
+def precompute_pitch_flight(release_point, vx, vy, ax, ay, traveltime, z_start=4600, z_end=300, fps=60):
+    """
+    Precompute a whole pitch flight as a time-parameterized table.
+
+    The flight is integrated once at the rate the physics was calibrated for
+    (60 FPS), so the path no longer depends on how often the game renders.
+
+    Args:
+        release_point: Tuple/Vector2 of (x, y) for the pitcher's release point
+        vx: Initial x velocity
+        vy: Initial y velocity
+        ax: x acceleration (horizontal break)
+        ay: y acceleration (vertical break)
+        traveltime: Total travel time in milliseconds
+        z_start: Starting z position (default 4600)
+        z_end: Ending z position where dist=1 (default 300)
+        fps: Integration rate the physics model is calibrated for (default 60)
+
+    Returns:
+        Array of shape (frames + 1, 5) with columns (t, x, y, z, size), where t
+        is milliseconds since release and size is the trail marker radius
+    """
+    return precompute_pitch_flights((release_point[0], release_point[1]), vx, vy, ax, ay, traveltime,
+                                    z_start, z_end, fps)[0]
+
+
+def precompute_pitch_flights(release, vx, vy, ax, ay, traveltime, z_start=4600, z_end=300, fps=60):
+    """
+    Precompute the flights of many pitches at once.
+
+    Vectorized counterpart of precompute_pitch_flight; every pitch's table is
+    the one precompute_pitch_flight gives for it, padded at the end.
+
+    Args:
+        release: Release points, shape (N, 2) or a single (x, y) pair
+        vx, vy, ax, ay, traveltime: Shape (N,) or scalars, as for simulate_pitch_trajectories
+        z_start: Starting z position (default 4600)
+        z_end: Ending z position where dist=1 (default 300)
+        fps: Integration rate the physics model is calibrated for (default 60)
+
+    Returns:
+        Array of shape (N, frames + 1, 5) with columns (t, x, y, z, size);
+        pitches that arrive early repeat their last position for the remaining
+        frames
+    """
+    _, paths = simulate_pitch_trajectories(release, vx, vy, ax, ay, traveltime, fps, z_start, z_end,
+                                           return_paths=True)
+    times = np.broadcast_to(np.arange(paths.shape[1]) * (1000 / fps), paths.shape[:2])
+    sizes = np.clip(11 / (paths[:, :, 2] / 300), 4, 11)
+    return np.concatenate((times[..., None], paths, sizes[..., None]), axis=2)
+
+
+def pitch_flight_position(flight, elapsed_ms):
+    """
+    Look up the ball position in a precomputed flight.
+
+    Positions between two integration steps are linearly interpolated, and
+    times outside the flight are clamped to its first or last row.
+
+    Args:
+        flight: Table returned by precompute_pitch_flight
+        elapsed_ms: Milliseconds since release
+
+    Returns:
+        Tuple of (x, y, z, size)
+    """
+    last = len(flight) - 1
+    step = flight[1, 0] if last > 0 else 1
+    position = elapsed_ms / step
+    if position <= 0:
+        return tuple(flight[0, 1:].tolist())
+    if position >= last:
+        return tuple(flight[last, 1:].tolist())
+
+    index = int(position)
+    a, b = flight[index, 1:], flight[index + 1, 1:]
+    return tuple((a + (b - a) * (position - index)).tolist())
+
+
+def trajectory_coefficients(traveltime, z_start=4600, z_end=300, fps=60):
+    """
+    Compute the linear coefficients of the discrete pitch integrator.
+
+    For a fixed traveltime the integrator in simulate_pitch_trajectory is linear
+    in the initial velocity and the acceleration along each axis:
+
+        final = release + v * s + a * 300 * t
+
+    where s is the sum of 1/dist over every frame and t is the sum, over every
+    frame, of 1/dist times the 1/dist values accumulated on earlier frames.
+    Both depend only on traveltime, the z range and fps, so one pass over the
+    frames gives the pair for both axes.
+
+    Args:
+        traveltime: Total travel time in milliseconds
+        z_start: Starting z position (default 4600)
+        z_end: Ending z position where dist=1 (default 300)
+        fps: Frames per second (default 60)
+
+    Returns:
+        Tuple of (s, t) - the velocity and acceleration coefficients
+    """
+    z = z_start
+    dz_per_frame = (4300 * 1000) / (fps * traveltime)
+    s = 0.0
+    t = 0.0
+
+    # Walk the frames exactly like simulate_pitch_trajectory so the frame count
+    # (and therefore the result) matches the integrator bit for bit in practice
+    while z > z_end:
+        inv_dist = 300 / z
+        t += inv_dist * s
+        s += inv_dist
+        z -= dz_per_frame
+
+    return s, t
+
+
+def trajectory_coefficients_table(traveltimes, z_start=4600, z_end=300, fps=60):
+    """
+    Compute trajectory_coefficients for many travel times at once.
+
+    Every travel time walks the same frames as trajectory_coefficients, in
+    lockstep, so each (s, t) pair is identical to the scalar result.
+
+    Args:
+        traveltimes: Array of travel times in milliseconds
+        z_start: Starting z position (default 4600)
+        z_end: Ending z position where dist=1 (default 300)
+        fps: Frames per second (default 60)
+
+    Returns:
+        Tuple of (s, t) arrays, one entry per travel time
+    """
+    traveltimes = np.asarray(traveltimes, dtype=float)
+    z = np.full(traveltimes.shape, float(z_start))
+    dz_per_frame = (4300 * 1000) / (fps * traveltimes)
+    s = np.zeros(traveltimes.shape)
+    t = np.zeros(traveltimes.shape)
+
+    active = z > z_end
+    while active.any():
+        inv_dist = 300 / z[active]
+        t[active] += inv_dist * s[active]
+        s[active] += inv_dist
+        z[active] -= dz_per_frame[active]
+        active = z > z_end
+
+    return s, t
+
+
+def solve_pitch_velocity(release_point, target_x, target_y, ax, ay, coefficients):
+    """
+    Solve the initial velocity (vx, vy) from precomputed trajectory coefficients.
+
+    Args:
+        release_point: Tuple/Vector2 of (x, y) for the pitcher's release point
+        target_x: Target x coordinate where pitch should arrive
+        target_y: Target y coordinate where pitch should arrive
+        ax: x acceleration (horizontal break)
+        ay: y acceleration (vertical break)
+        coefficients: (s, t) pair from trajectory_coefficients
+
+    Returns:
+        Tuple of (vx, vy) - the initial velocity components needed
+    """
+    s, t = coefficients
+    vx = (target_x - release_point[0] - ax * 300 * t) / s
+    vy = (target_y - release_point[1] - ay * 300 * t) / s
+    return vx, vy
+
+
 def calculate_pitch_velocity(release_point, target_x, target_y, ax, ay, traveltime,
                              z_start=4600, z_end=300, fps=60, tolerance=0.01, max_iterations=100):
     """
     Calculate the initial velocity (vx, vy) needed for a pitch to arrive at a target location.
 
-    This function uses the game's physics model to find the initial velocity components
-    that will cause a pitch to land at the specified target coordinates when it reaches
-    the plate.
+    The game's physics model is linear in the initial velocity, so instead of
+    searching for the velocity by re-simulating the pitch, the trajectory
+    coefficients are computed once and the velocity is solved directly. The
+    result lands on the target to within floating point error when run through
+    simulate_pitch_trajectory.
 
     Args:
         release_point: Tuple/Vector2 of (x, y) for the pitcher's release point
@@ -87,8 +329,8 @@ def calculate_pitch_velocity(release_point, target_x, target_y, ax, ay, travelti
         z_start: Starting z position (default 4600)
         z_end: Ending z position (default 300)
         fps: Frames per second (default 60)
-        tolerance: Convergence tolerance in pixels (default 0.01)
-        max_iterations: Maximum optimization iterations (default 100)
+        tolerance: Unused, kept for backwards compatibility
+        max_iterations: Unused, kept for backwards compatibility
 
     Returns:
         Tuple of (vx, vy) - the initial velocity components needed
@@ -112,52 +354,8 @@ def calculate_pitch_velocity(release_point, target_x, target_y, ax, ay, travelti
 
             simulation_func(self.release_point, 'pitcher_name', ax, ay, vx, vy, traveltime, 'FF')
     """
-    release_x, release_y = release_point[0], release_point[1]
-
-    # Use bisection/iterative approach for each dimension independently
-    # Since x and y physics are independent, we can solve them separately
-
-    def find_velocity_for_target(release_val, target_val, accel, is_x=True):
-        """Find the initial velocity needed to reach target in one dimension."""
-        # Start with a reasonable initial guess based on distance and time
-        distance = target_val - release_val
-
-        # Initial guess: simple linear estimate
-        v_guess = distance / 10  # rough starting point
-
-        # Bounds for binary search
-        v_low, v_high = -200, 200
-
-        for _ in range(max_iterations):
-            # Simulate with current guess
-            if is_x:
-                final_pos, _ = simulate_pitch_trajectory(
-                    release_x, release_y, v_guess, 0, accel, 0, traveltime, z_start, z_end, fps
-                )
-            else:
-                _, final_pos = simulate_pitch_trajectory(
-                    release_x, release_y, 0, v_guess, 0, accel, traveltime, z_start, z_end, fps
-                )
-
-            error = final_pos - target_val
-
-            if abs(error) < tolerance:
-                return v_guess
-
-            # Adjust bounds and make new guess
-            if error > 0:
-                v_high = v_guess
-            else:
-                v_low = v_guess
-
-            v_guess = (v_low + v_high) / 2
-
-        return v_guess
-
-    vx = find_velocity_for_target(release_x, target_x, ax, is_x=True)
-    vy = find_velocity_for_target(release_y, target_y, ay, is_x=False)
-
-    return vx, vy
+    coefficients = trajectory_coefficients(traveltime, z_start, z_end, fps)
+    return solve_pitch_velocity(release_point, target_x, target_y, ax, ay, coefficients)
 
 
 def create_targeted_pitch(release_point, target_x, target_y, ax, ay, traveltime):